@@ -1,19 +1,56 @@
-def aggregate_calories_by_elf(lines: list[str]) -> list[int]:
-    # Return a list of the total calories each Elf is carrying in descending order.
-    calories_by_elf = []
-    count = 0
-    for line in lines:
-        if stripped_line := line.strip():
-            count += int(stripped_line)
-        else:
-            if count > 0:
-                calories_by_elf.append(count)
-            count = 0
-    return sorted(calories_by_elf, reverse=True)
+import heapq
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, repeat
+from pathlib import Path
+from typing import Iterable, Sequence
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))  # make the shared `lib` package importable
+from lib.inputs import STDIN_FILE_NAME, iter_buffer_records, map_input, read_records, split_records  # isort: skip
+
+
+def aggregate_calories_by_elf(records: Iterable[Sequence[str | bytes]], k: int) -> list[int]:
+    # Return the k largest totals of the calories each Elf is carrying in descending order. Only the k largest totals
+    # seen so far are kept (in a min-heap), so memory use doesn't grow with the number of elves.
+    top_calories: list[int] = []
+    for record in records:
+        calories = sum([int(line) for line in record])
+        if len(top_calories) < k:
+            heapq.heappush(top_calories, calories)
+        elif calories > top_calories[0]:
+            heapq.heapreplace(top_calories, calories)
+    return sorted(top_calories, reverse=True)
+
+
+def aggregate_calories_by_elf_in_range(file_name: str, start: int, end: int, k: int) -> list[int]:
+    with map_input(file_name) as buffer:
+        return aggregate_calories_by_elf(iter_buffer_records(buffer, start, end), k)
+
+
+def find_top_calories(file_name: str, k: int, workers: int = 1) -> list[int]:
+    if workers == 1 or file_name == STDIN_FILE_NAME:
+        return aggregate_calories_by_elf(read_records(file_name), k)
+    # split the file into chunks on blank lines, find the top k in each chunk in parallel, then the top k of those
+    with map_input(file_name) as buffer:
+        chunks = split_records(buffer, num_chunks=workers * 4)
+    if not chunks:
+        return []  # an empty input has no elves, same as the serial path
+    starts, ends = zip(*chunks)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        top_calories_by_chunk = executor.map(
+            aggregate_calories_by_elf_in_range, repeat(file_name), starts, ends, repeat(k)
+        )
+        return heapq.nlargest(k, chain.from_iterable(top_calories_by_chunk))
+
+
+def part_1(file_name: str = "input.txt", workers: int = 1) -> int:
+    return find_top_calories(file_name, k=1, workers=workers)[0]
+
+
+def part_2(file_name: str = "input.txt", workers: int = 1) -> int:
+    return sum(find_top_calories(file_name, k=3, workers=workers))
 
 
 if __name__ == "__main__":
-    with open("input.txt", "r") as f:
-        calories = aggregate_calories_by_elf(f.readlines())
-        print(f"The elf carrying the most calories is carrying {calories[-1]} calories.")
-        print(f"The three elves carrying the most calories are altogether carrying {sum(calories[0:3])} calories.")
+    print(f"The elf carrying the most calories is carrying {part_1()} calories.")
+    print(f"The three elves carrying the most calories are altogether carrying {part_2()} calories.")
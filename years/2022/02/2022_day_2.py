@@ -1,6 +1,16 @@
 import abc
+import re
+import sys
+from itertools import chain
+from pathlib import Path
 from typing import Type
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))  # make the shared `lib` package importable
+from lib.cache import cached_by_input  # isort: skip
+from lib.inputs import read_chunks  # isort: skip
+
+STRATEGY_GUIDE_LINES = re.compile(rb"(?:(?:[ABC] [XYZ])?\r?\n)*")  # any number of lines, each blank or one of the 9
+
 
 class Option:
     @classmethod
@@ -123,16 +133,6 @@ def does_player_win(player_option: Type[Option], opponent_option: Type[Option])
     return OPTIONS[wrap_index(OPTIONS.index(opponent_option) + Win.get_index_offset(), len(OPTIONS))] == player_option
 
 
-def incorrectly_read_strategy_guide(file_name: str = "input.txt") -> list[tuple[Type[Option], Type[Option]]]:
-    options_by_opponent_code = {x.get_opponent_code(): x for x in [Rock, Paper, Scissors]}
-    options_by_player_code = {x.get_player_code(): x for x in [Rock, Paper, Scissors]}
-    with open(file_name, "r") as f:
-        return [
-            (options_by_opponent_code[(split_line := x.strip().split(" "))[0]], options_by_player_code[split_line[1]])
-            for x in f.readlines()
-        ]
-
-
 def count_score_for_incorrectly_following_strategy_guide(
     strategy_guide: list[tuple[Type[Option], Type[Option]]], win_bonus: int = 6, draw_bonus: int = 3
 ) -> int:
@@ -146,16 +146,6 @@ def count_score_for_incorrectly_following_strategy_guide(
     return score
 
 
-def correctly_read_strategy_guide(file_name: str = "input.txt") -> list[tuple[Type[Option], Type[GameOutcome]]]:
-    options_by_opponent_code = {x.get_opponent_code(): x for x in [Rock, Paper, Scissors]}
-    game_outcomes_by_code = {x.get_code(): x for x in OUTCOMES}
-    with open(file_name, "r") as f:
-        return [
-            (options_by_opponent_code[(split_line := x.strip().split(" "))[0]], game_outcomes_by_code[split_line[1]])
-            for x in f.readlines()
-        ]
-
-
 def count_score_for_correctly_following_strategy_guide(
     strategy_guide: list[tuple[Type[Option], Type[GameOutcome]]], win_bonus: int = 6, draw_bonus: int = 3
 ) -> int:
@@ -172,14 +162,59 @@ def count_score_for_correctly_following_strategy_guide(
     return score
 
 
-if __name__ == "__main__":
-    incorrect_guide = incorrectly_read_strategy_guide()
-    print(
-        f"The total score for playing according to the incorrectly interpreted strategy guide is "
-        f"{count_score_for_incorrectly_following_strategy_guide(incorrect_guide)}."
-    )
-    correct_guide = correctly_read_strategy_guide()
-    print(
-        f"The total score for playing according to the correctly interpreted strategy guide is "
-        f"{count_score_for_correctly_following_strategy_guide(correct_guide)}."
+def build_score_table(win_bonus: int = 6, draw_bonus: int = 3) -> dict[bytes, tuple[int, int]]:
+    # there are only 9 possible lines in a strategy guide, so score each of them up front for both the incorrect and
+    # correct interpretations of the second column
+    options_by_player_code = {x.get_player_code(): x for x in OPTIONS}
+    game_outcomes_by_code = {x.get_code(): x for x in OUTCOMES}
+    return {
+        f"{opponent_option.get_opponent_code()} {code}".encode(): (
+            count_score_for_incorrectly_following_strategy_guide(
+                [(opponent_option, options_by_player_code[code])], win_bonus=win_bonus, draw_bonus=draw_bonus
+            ),
+            count_score_for_correctly_following_strategy_guide(
+                [(opponent_option, game_outcomes_by_code[code])], win_bonus=win_bonus, draw_bonus=draw_bonus
+            ),
+        )
+        for opponent_option in OPTIONS
+        for code in ["X", "Y", "Z"]
+    }
+
+
+def count_strategy_guide_lines(file_name: str = "input.txt") -> dict[bytes, int]:
+    # count how many times each of the 9 possible lines appears, reading the input once in chunks of bytes. counting
+    # substrings would quietly skip anything that isn't one of them (e.g. `A  X` or `D Y`), so each chunk's lines are
+    # checked first.
+    line_counts = {line: 0 for line in build_score_table()}
+    remainder = b""
+    for chunk in chain(read_chunks(file_name), [b"\n"]):  # the extra newline finishes off a last line without one
+        complete_lines, _, remainder = (remainder + chunk).rpartition(b"\n")  # don't split a line across chunks
+        if complete_lines and not STRATEGY_GUIDE_LINES.fullmatch(complete_lines + b"\n"):
+            raise ValueError(f"The strategy guide has a line which isn't one of {sorted(line_counts)}")
+        for line in line_counts:
+            line_counts[line] += complete_lines.count(line)
+    return line_counts
+
+
+@cached_by_input
+def score_strategy_guide(file_name: str = "input.txt") -> tuple[int, int]:  # incorrect score, correct score
+    score_table = build_score_table()
+    line_counts = count_strategy_guide_lines(file_name)
+    return (
+        sum([count * score_table[line][0] for line, count in line_counts.items()]),
+        sum([count * score_table[line][1] for line, count in line_counts.items()]),
     )
+
+
+def part_1(file_name: str = "input.txt") -> int:
+    return score_strategy_guide(file_name)[0]
+
+
+def part_2(file_name: str = "input.txt") -> int:
+    return score_strategy_guide(file_name)[1]
+
+
+if __name__ == "__main__":
+    incorrect_score, correct_score = score_strategy_guide()  # both parts from one read of the input
+    print(f"The total score for playing according to the incorrectly interpreted strategy guide is {incorrect_score}.")
+    print(f"The total score for playing according to the correctly interpreted strategy guide is {correct_score}.")
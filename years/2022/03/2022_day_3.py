@@ -1,7 +1,15 @@
 import dataclasses
+import functools
+import operator
+import string
+import sys
+from pathlib import Path
 from typing import TypeAlias
 
-Compartment: TypeAlias = str
+sys.path.append(str(Path(__file__).resolve().parents[1]))  # make the shared `lib` package importable
+from lib.inputs import read_lines  # isort: skip
+
+ItemMask: TypeAlias = int  # bit (priority - 1) is set for each item present, so 52 bits covers a-z and A-Z
 
 
 def get_value_for_character(character: str) -> int:
@@ -11,28 +19,45 @@ def get_value_for_character(character: str) -> int:
     return ord(character) - 96
 
 
-@dataclasses.dataclass
+ITEM_MASKS = {character: 1 << (get_value_for_character(character) - 1) for character in string.ascii_letters}
+
+
+def get_item_mask(items: str) -> ItemMask:
+    mask = 0
+    for item in items:
+        mask |= ITEM_MASKS[item]
+    return mask
+
+
+def get_priority_of_only_item(mask: ItemMask) -> int:
+    # with only one bit set, the item's priority is just the position of that bit
+    assert mask and mask & (mask - 1) == 0, f"Expected exactly 1 item, got {mask.bit_count()}"
+    return mask.bit_length()
+
+
+@dataclasses.dataclass(slots=True)
 class Rucksack:
-    first_compartment: Compartment
-    second_compartment: Compartment
+    first_compartment: ItemMask
+    second_compartment: ItemMask
 
     @classmethod
     def from_line(cls, line: str) -> "Rucksack":
         stripped_line = line.strip()
         assert len(stripped_line) % 2 == 0, "Line must be even length"
         half_length = int(len(stripped_line) / 2)
-        return cls(first_compartment=stripped_line[0:half_length], second_compartment=stripped_line[half_length:])
+        return cls(
+            first_compartment=get_item_mask(stripped_line[0:half_length]),
+            second_compartment=get_item_mask(stripped_line[half_length:]),
+        )
 
-    def get_unique_items(self) -> set[str]:
-        return set(self.first_compartment) | set(self.second_compartment)
+    def get_unique_items(self) -> ItemMask:
+        return self.first_compartment | self.second_compartment
 
-    def get_overlapping_items(self) -> set[str]:
-        return set(self.first_compartment) & set(self.second_compartment)
+    def get_overlapping_items(self) -> ItemMask:
+        return self.first_compartment & self.second_compartment
 
-    def get_overlapping_item(self) -> str:
-        overlapping_items = self.get_overlapping_items()
-        assert len(overlapping_items) == 1
-        return overlapping_items.pop()
+    def get_overlapping_item_priority(self) -> int:
+        return get_priority_of_only_item(self.get_overlapping_items())
 
 
 @dataclasses.dataclass
@@ -41,37 +66,31 @@ class RucksackContainer:
 
     @classmethod
     def from_input_file(cls, file_name: str = "input.txt") -> "RucksackContainer":
-        with open(file_name, "r") as f:
-            return cls(rucksacks=[Rucksack.from_line(line) for line in f.readlines()])
+        return cls(rucksacks=[Rucksack.from_line(line) for line in read_lines(file_name)])
 
     def get_sum_of_priorities_of_overlapping_items_for_all_rucksacks(self) -> int:
         # assume that each rucksack only has one overlapping item
-        return sum(get_value_for_character(rucksack.get_overlapping_item()) for rucksack in self.rucksacks)
+        return sum(rucksack.get_overlapping_item_priority() for rucksack in self.rucksacks)
 
     def get_sum_of_priorities_of_badges_per_group(self, group_size: int) -> int:
         assert group_size > 1, "Don't use this function with a group size of 1"
         assert len(self.rucksacks) % group_size == 0, f"Cannot cleanly divide rucksacks into {group_size} groups"
-        total_priority = 0
-        for i in range(0, int(len(self.rucksacks) / group_size)):
-            rucksack_unique_items = [rucksack.get_unique_items() for rucksack in self.rucksacks[3 * i : 3 * i + 3]]
-            common_item_set = rucksack_unique_items[0]
-            for items in rucksack_unique_items[1:]:
-                common_item_set = common_item_set.intersection(items)
-            assert (
-                len(common_item_set) == 1
-            ), f"Expected there to be exactly 1 common item per group, got {len(common_item_set)}"
-            total_priority += get_value_for_character(common_item_set.pop())
-        return total_priority
+        return sum(
+            get_priority_of_only_item(
+                functools.reduce(operator.and_, [x.get_unique_items() for x in self.rucksacks[i : i + group_size]])
+            )
+            for i in range(0, len(self.rucksacks), group_size)
+        )
+
+
+def part_1(file_name: str = "input.txt") -> int:
+    return RucksackContainer.from_input_file(file_name).get_sum_of_priorities_of_overlapping_items_for_all_rucksacks()
+
+
+def part_2(file_name: str = "input.txt", group_size: int = 3) -> int:
+    return RucksackContainer.from_input_file(file_name).get_sum_of_priorities_of_badges_per_group(group_size)
 
 
 if __name__ == "__main__":
-    rucksack_container = RucksackContainer.from_input_file()
-    group_size = 3
-    print(
-        f"The sum of priorities of overlapping items for all rucksacks is "
-        f"{rucksack_container.get_sum_of_priorities_of_overlapping_items_for_all_rucksacks()}."
-    )
-    print(
-        f"The sum of priorities of each group's badge (group size {group_size}) is "
-        f"{rucksack_container.get_sum_of_priorities_of_badges_per_group(group_size)}."
-    )
+    print(f"The sum of priorities of overlapping items for all rucksacks is {part_1()}.")
+    print(f"The sum of priorities of each group's badge (group size 3) is {part_2(group_size=3)}.")
@@ -1,62 +1,134 @@
+import bisect
 import dataclasses
+import functools
+import sys
+from array import array
+from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))  # make the shared `lib` package importable
+from lib.inputs import read_lines  # isort: skip
 
-@dataclasses.dataclass
-class SectionAssignment:
-    min_id: int
-    max_id: int
 
-    @classmethod
-    def from_line(cls, line: str) -> "SectionAssignment":
-        line_split = line.split("-")
-        assert len(line_split) == 2, f"Attempted to create a SectionAssignment with {len(line_split)} bits"
-        return cls(min_id=int(line_split[0]), max_id=int(line_split[1]))
+def is_pairing_strictly_redundant(first_min_id: int, first_max_id: int, second_min_id: int, second_max_id: int) -> bool:
+    return (first_min_id >= second_min_id and first_max_id <= second_max_id) or (
+        second_min_id >= first_min_id and second_max_id <= first_max_id
+    )
 
 
-@dataclasses.dataclass
-class ElfPair:
-    first_elf: SectionAssignment
-    second_elf: SectionAssignment
+def is_pairing_redundant_at_all(first_min_id: int, first_max_id: int, second_min_id: int, second_max_id: int) -> bool:
+    return first_max_id >= second_min_id and first_min_id <= second_max_id
+
+
+@dataclasses.dataclass(frozen=True)
+class SectionIndex:
+    # every elf's assignment sorted by min_id and stored as an implicit balanced binary tree - the middle of each range
+    # is the root of that range's subtree - where each node also records the largest max_id in its subtree. this is an
+    # interval tree without any pointers, so subtrees which finish before a query range starts can be skipped entirely.
+    min_ids: "array[int]"
+    max_ids: "array[int]"
+    assignments: "array[int]"  # pair index * 2 + which elf in the pair (0 or 1)
+    subtree_max_ids: "array[int]"
+    sorted_max_ids: "array[int]"
 
     @classmethod
-    def from_line(cls, line: str) -> "ElfPair":
-        line_split = line.split(",")
-        assert len(line_split) == 2, f"Attempted to create an ElfPair with {len(line_split)} bits"
+    def from_columns(cls, min_ids: "array[int]", max_ids: "array[int]") -> "SectionIndex":
+        order = sorted(range(len(min_ids)), key=lambda i: min_ids[i])
+        sorted_min_ids = array("i", [min_ids[i] for i in order])
+        sorted_by_min_max_ids = array("i", [max_ids[i] for i in order])
+        subtree_max_ids = array("i", sorted_by_min_max_ids)
+        # fill in subtree maxima bottom up, i.e. children before their parents
+        stack = [(0, len(order), False)]
+        while stack:
+            start, end, children_done = stack.pop()
+            if start >= end:
+                continue
+            middle = (start + end) // 2
+            if not children_done:
+                stack += [(start, end, True), (start, middle, False), (middle + 1, end, False)]
+                continue
+            for child_start, child_end in [(start, middle), (middle + 1, end)]:
+                if child_start < child_end:
+                    child = (child_start + child_end) // 2
+                    subtree_max_ids[middle] = max(subtree_max_ids[middle], subtree_max_ids[child])
         return cls(
-            first_elf=SectionAssignment.from_line(line_split[0]), second_elf=SectionAssignment.from_line(line_split[1])
+            min_ids=sorted_min_ids,
+            max_ids=sorted_by_min_max_ids,
+            assignments=array("i", order),
+            subtree_max_ids=subtree_max_ids,
+            sorted_max_ids=array("i", sorted(max_ids)),
         )
 
-    def is_pairing_strictly_redundant(self) -> bool:
-        return (
-            self.first_elf.min_id >= self.second_elf.min_id and self.first_elf.max_id <= self.second_elf.max_id
-        ) or (self.second_elf.min_id >= self.first_elf.min_id and self.second_elf.max_id <= self.first_elf.max_id)
+    def count_overlapping(self, min_id: int, max_id: int) -> int:
+        # assignments which start before the range ends, minus those that also finish before it starts - anything that
+        # finishes before the range starts must also have started before it ends, so the subtraction never goes wrong.
+        # just two binary searches, so O(log n) without looking at any of the matches.
+        return bisect.bisect_right(self.min_ids, max_id) - bisect.bisect_left(self.sorted_max_ids, min_id)
 
-    def is_pairing_redundant_at_all(self) -> bool:
-        return (
-            self.first_elf.max_id >= self.second_elf.min_id and self.first_elf.min_id <= self.second_elf.max_id
-        ) or (self.second_elf.max_id >= self.first_elf.min_id and self.second_elf.min_id <= self.first_elf.max_id)
+    def find_overlapping(self, min_id: int, max_id: int) -> list[tuple[int, int]]:  # (pair index, elf index)
+        # a subtree is only walked into if something in it could still overlap, so every node visited is either on the
+        # path down to one of the k matches or one of the O(log n) subtrees straddling the last assignment which starts
+        # in time - O((k + 1) log n) nodes, plus sorting the matches.
+        end = bisect.bisect_right(self.min_ids, max_id)  # only assignments which start before the range ends
+        found: list[int] = []
+        stack = [(0, len(self.min_ids))]
+        while stack:
+            start, stop = stack.pop()
+            if start >= min(stop, end):
+                continue  # empty, or everything in this subtree starts after the range ends
+            middle = (start + stop) // 2
+            if self.subtree_max_ids[middle] < min_id:
+                continue  # everything in this subtree finishes before the range starts
+            if middle < end and self.max_ids[middle] >= min_id:
+                found.append(self.assignments[middle])
+            stack += [(start, middle), (middle + 1, stop)]
+        return [divmod(x, 2) for x in sorted(found)]
 
 
 @dataclasses.dataclass
 class ElfPairs:
-    elf_pairs: list[ElfPair]
+    # one column per number in each line, rather than an object per elf
+    first_min_ids: "array[int]"
+    first_max_ids: "array[int]"
+    second_min_ids: "array[int]"
+    second_max_ids: "array[int]"
 
     @classmethod
     def from_input_file(cls, file_name: str = "input.txt") -> "ElfPairs":
-        with open(file_name, "r") as f:
-            return cls(elf_pairs=[ElfPair.from_line(line) for line in f.readlines()])
+        columns = [array("i") for _ in range(4)]
+        for line in read_lines(file_name):
+            line_split = line.replace(",", "-").split("-")
+            assert len(line_split) == 4, f"Attempted to create an elf pair with {len(line_split)} bits"
+            for column, value in zip(columns, line_split):
+                column.append(int(value))
+        return cls(*columns)
+
+    def get_columns(self) -> "tuple[array[int], array[int], array[int], array[int]]":
+        return self.first_min_ids, self.first_max_ids, self.second_min_ids, self.second_max_ids
 
     def count_redundant_work_allocations_across_elf_pairs(self) -> int:
-        return len(list(filter(lambda x: x.is_pairing_strictly_redundant(), self.elf_pairs)))
+        return sum(map(is_pairing_strictly_redundant, *self.get_columns()))
 
     def count_all_redundant_work_allocations(self) -> int:
-        return len(list(filter(lambda x: x.is_pairing_redundant_at_all(), self.elf_pairs)))
+        return sum(map(is_pairing_redundant_at_all, *self.get_columns()))
+
+    @functools.cached_property
+    def section_index(self) -> SectionIndex:
+        # interleave the two elves in each pair so assignment i is elf i % 2 in pair i // 2
+        min_ids, max_ids = array("i"), array("i")
+        for first_min_id, first_max_id, second_min_id, second_max_id in zip(*self.get_columns()):
+            min_ids += array("i", [first_min_id, second_min_id])
+            max_ids += array("i", [first_max_id, second_max_id])
+        return SectionIndex.from_columns(min_ids, max_ids)
+
+
+def part_1(file_name: str = "input.txt") -> int:
+    return ElfPairs.from_input_file(file_name).count_redundant_work_allocations_across_elf_pairs()
+
+
+def part_2(file_name: str = "input.txt") -> int:
+    return ElfPairs.from_input_file(file_name).count_all_redundant_work_allocations()
 
 
 if __name__ == "__main__":
-    elf_pairs = ElfPairs.from_input_file()
-    print(
-        f"There are {elf_pairs.count_redundant_work_allocations_across_elf_pairs()} "
-        f"redundant work allocations across Elf pairs."
-    )
-    print(f"There are {elf_pairs.count_all_redundant_work_allocations()} " f"redundant work allocations in total.")
+    print(f"There are {part_1()} redundant work allocations across Elf pairs.")
+    print(f"There are {part_2()} redundant work allocations in total.")
@@ -1,11 +1,17 @@
 import dataclasses
 import re
+import sys
+from pathlib import Path
 from typing import TypeAlias
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))  # make the shared `lib` package importable
+from lib.cache import cached_by_input  # isort: skip
+from lib.inputs import read_records  # isort: skip
+
 CrateStack: TypeAlias = list[str]
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Transform:
     num_crates: int
     source_stack: int
@@ -13,9 +19,7 @@ class Transform:
 
     @classmethod
     def from_line(cls, line: str) -> "Transform":
-        num_crates, source_stack, target_stack = re.match(  # type: ignore  # technically sloppy but known input data
-            "^move ([0-9].*) from ([0-9].*) to ([0-9].*)$", line.strip()
-        ).groups()
+        _, num_crates, _, source_stack, _, target_stack = line.split()  # move N from X to Y
         return cls(num_crates=int(num_crates), source_stack=int(source_stack) - 1, target_stack=int(target_stack) - 1)
 
 
@@ -37,38 +41,59 @@ class CrateStackSet:
         return crate_stacks
 
     @classmethod
+    @cached_by_input
     def from_input_file(cls, file_name: str = "input.txt") -> "CrateStackSet":
-        with open(file_name, "r") as f:
-            crate_stacks_lines, transform_lines = [x.splitlines() for x in f.read().split("\n\n")]
+        crate_stacks_lines, transform_lines = read_records(file_name)
         crate_stacks = cls.pivot_crate_stacks_lines(crate_stacks_lines)  # exclude line with stack numbers
         return cls(crate_stacks=crate_stacks, transforms=[Transform.from_line(line) for line in transform_lines])
 
-    def apply_transforms(self, reverse: bool) -> "CrateStackSet":
-        transformed_stacks = [*self.crate_stacks]
+    def apply_transforms_for_cranes(self, reverses: list[bool]) -> list["CrateStackSet"]:
+        # one pass over the transforms, moving crates for every crane model at once (e.g. `[True, False]` for both the
+        # CrateMover 9000 and 9001). crates only ever come off or go onto the top of a stack, so each move truncates
+        # and extends the ends of lists in place and costs O(crates moved) rather than O(stack height).
+        crane_stacks = [[[*stack] for stack in self.crate_stacks] for _ in reverses]
         for transform in self.transforms:
-            assert len(transformed_stacks[transform.source_stack]) >= transform.num_crates, "Cannot draw below 0 crates"
-            crates_to_move = transformed_stacks[transform.source_stack][
-                len(transformed_stacks[transform.source_stack]) - transform.num_crates :
-            ]
-            if reverse:
-                crates_to_move.reverse()
-            transformed_stacks[transform.target_stack] = [*transformed_stacks[transform.target_stack], *crates_to_move]
-            transformed_stacks[transform.source_stack] = transformed_stacks[transform.source_stack][
-                0 : len(transformed_stacks[transform.source_stack]) - transform.num_crates
-            ]
-
-        return CrateStackSet(crate_stacks=transformed_stacks, transforms=self.transforms)
+            if transform.num_crates == 0:
+                continue  # careful - `stack[-0:]` is the whole stack
+            for stacks, reverse in zip(crane_stacks, reverses):
+                source_stack = stacks[transform.source_stack]
+                assert len(source_stack) >= transform.num_crates, "Cannot draw below 0 crates"
+                crates_to_move = source_stack[-transform.num_crates :]
+                del source_stack[-transform.num_crates :]
+                if reverse:
+                    crates_to_move.reverse()
+                stacks[transform.target_stack] += crates_to_move
+        return [CrateStackSet(crate_stacks=stacks, transforms=self.transforms) for stacks in crane_stacks]
+
+    def apply_transforms(self, reverse: bool) -> "CrateStackSet":
+        return self.apply_transforms_for_cranes([reverse])[0]
 
     def get_stack_message(self) -> str:
         return "".join([stack[-1] for stack in self.crate_stacks])
 
 
+def part_1(file_name: str = "input.txt") -> str:
+    return CrateStackSet.from_input_file(file_name).apply_transforms(reverse=True).get_stack_message()
+
+
+def part_2(file_name: str = "input.txt") -> str:
+    return CrateStackSet.from_input_file(file_name).apply_transforms(reverse=False).get_stack_message()
+
+
+def get_stack_messages_for_both_cranes(file_name: str = "input.txt") -> tuple[str, str]:  # (9000, 9001)
+    crate_mover_9000, crate_mover_9001 = CrateStackSet.from_input_file(file_name).apply_transforms_for_cranes(
+        [True, False]
+    )
+    return crate_mover_9000.get_stack_message(), crate_mover_9001.get_stack_message()
+
+
 if __name__ == "__main__":
+    crate_mover_9000_message, crate_mover_9001_message = get_stack_messages_for_both_cranes()
     print(
         f"The crates on the top of each stack after the rearrangement procedure completes with the CrateMover 9000 are "
-        f"{CrateStackSet.from_input_file().apply_transforms(reverse=True).get_stack_message()}."
+        f"{crate_mover_9000_message}."
     )
     print(
         f"The crates on the top of each stack after the rearrangement procedure completes with the CrateMover 9001 are "
-        f"{CrateStackSet.from_input_file().apply_transforms(reverse=False).get_stack_message()}."
+        f"{crate_mover_9001_message}."
     )
@@ -1,27 +1,49 @@
-from builtins import bytes
-from functools import partial
+import sys
+from pathlib import Path
+from typing import Iterable
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))  # make the shared `lib` package importable
+from lib.inputs import read_chunks  # isort: skip
+
+
+def find_markers(marker_lengths: Iterable[int], file_name: str = "input.txt") -> dict[int, int]:
+    # marker length => number of characters processed when the marker is complete, for every marker found.
+    # remembering where each character was last seen means the start of the longest run of distinct characters ending
+    # at the current one can be moved forward in O(1), and every marker length is just a threshold on that run's length
+    # - so one pass finds them all, stopping as soon as the longest has been found.
+    pending_lengths = sorted(set(marker_lengths), reverse=True)  # shortest last, so it's found (and popped) first
+    markers: dict[int, int] = {}
+    last_seen = [-1] * 256
+    run_start = 0
+    position = 0
+    for chunk in read_chunks(file_name):
+        for character in chunk:
+            if last_seen[character] >= run_start:
+                run_start = last_seen[character] + 1
+            last_seen[character] = position
+            position += 1
+            while pending_lengths and position - run_start >= pending_lengths[-1]:
+                markers[pending_lengths.pop()] = position
+            if not pending_lengths:
+                return markers
+    return markers
 
 
 def identify_characters_before_start_of_marker(marker_length: int, file_name: str = "input.txt") -> int:
-    register: list[bytes] = []
-    counter = 1
-    with open(file_name, "rb") as f:
-        for character in iter(partial(f.read, 1), b""):
-            if len(register) >= marker_length:
-                register.pop(0)
-            register.append(character)
-            if len(set(register)) == marker_length:
-                break
-            counter += 1
-    return counter
+    markers = find_markers([marker_length], file_name=file_name)
+    assert marker_length in markers, f"There is no {marker_length}-character marker in {file_name}"
+    return markers[marker_length]
+
+
+def part_1(file_name: str = "input.txt") -> int:
+    return identify_characters_before_start_of_marker(marker_length=4, file_name=file_name)
+
+
+def part_2(file_name: str = "input.txt") -> int:
+    return identify_characters_before_start_of_marker(marker_length=14, file_name=file_name)
 
 
 if __name__ == "__main__":
-    print(
-        f"The number of characters before the 4-character marker is "
-        f"{identify_characters_before_start_of_marker(marker_length=4)}."
-    )
-    print(
-        f"The number of characters before the 14-character marker is "
-        f"{identify_characters_before_start_of_marker(marker_length=14)}."
-    )
+    markers = find_markers([4, 14])
+    print(f"The number of characters before the 4-character marker is {markers[4]}.")
+    print(f"The number of characters before the 14-character marker is {markers[14]}.")
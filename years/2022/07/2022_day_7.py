@@ -1,6 +1,12 @@
 import dataclasses
+import posixpath
+import sys
+from pathlib import Path
 from typing import Optional
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))  # make the shared `lib` package importable
+from lib.inputs import read_lines  # isort: skip
+
 # coupla constants
 BASH = "$"
 CD = "cd"
@@ -12,45 +18,74 @@ DISK_SIZE = 70_000_000
 UPDATE_SIZE = 30_000_000
 
 
-def partition_ls_output_into_files_and_directories(
-    cwd: "Directory", ls_output: list[str]
-) -> tuple[dict[str, int], dict[str, "Directory"]]:
-    files: dict[str, int] = {}
-    directories: dict[str, "Directory"] = {}
-    for line in ls_output:
-        stripped_line = line.strip()
-        if stripped_line.startswith(DIR):
-            # assume this is a directory - the expected format is `dir <dirname>`
-            dirname = stripped_line.split(" ", 1)[1]
-            directories[dirname] = Directory(name=dirname, files={}, children={}, parent=cwd)
-        else:
-            # assume this is a file - the expected format is `<size> <filename>`
-            filesize_string, filename = stripped_line.split(" ")
-            files[filename] = int(filesize_string)
-    return files, directories
-
-
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Directory:
     name: str
     files: dict[str, int]
     children: dict[str, "Directory"]
     parent: Optional["Directory"] = None
+    # total size including child directories, filled in by `compute_total_sizes` and reset to None whenever anything
+    # in this directory or below it changes
+    cached_total_size: int | None = dataclasses.field(default=None, repr=False, compare=False)
 
     def get_absolute_parent(self) -> "Directory":
-        if self.parent is None:
-            return self
-        return self.parent.get_absolute_parent()
+        directory = self
+        while directory.parent is not None:
+            directory = directory.parent
+        return directory
 
     def get_all_child_directories(self) -> list["Directory"]:
-        children = list(self.children.values())
-        all_children = [*children]
-        for child in children:
-            all_children += child.get_all_child_directories()
+        # each directory's children, followed by everything below the first child, then everything below the second...
+        all_children: list["Directory"] = []
+        stack = [self]
+        while stack:
+            children = list(stack.pop().children.values())
+            all_children += children
+            stack += children[::-1]
         return all_children
 
+    def add_file(self, filename: str, size: int) -> None:
+        self.files[filename] = size
+        self.invalidate_total_sizes()
+
+    def get_or_add_child(self, dirname: str) -> "Directory":
+        if (child := self.children.get(dirname)) is None:
+            child = self.children[dirname] = Directory(name=dirname, files={}, children={}, parent=self)
+            self.invalidate_total_sizes()  # the new child's size isn't known, so neither is ours
+        return child
+
+    def invalidate_total_sizes(self) -> None:
+        # only this directory and the ones above it contain what changed. sizes are only ever computed for a directory
+        # along with everything below it, so once one directory is already stale so is everything above it.
+        directory: Directory | None = self
+        while directory is not None and directory.cached_total_size is not None:
+            directory.cached_total_size = None
+            directory = directory.parent
+
+    def compute_total_sizes(self) -> int:
+        # fill in the total size of this directory and everything below it in one post-order pass, skipping any
+        # directories whose sizes are already known
+        stack = [(self, False)]
+        while stack:
+            directory, children_done = stack.pop()
+            if directory.cached_total_size is not None:
+                continue
+            if not children_done:
+                stack.append((directory, True))
+                stack += [(child, False) for child in directory.children.values()]
+                continue
+            total_size = sum(directory.files.values())
+            for child in directory.children.values():
+                assert child.cached_total_size is not None, "children are always sized before their parent"
+                total_size += child.cached_total_size
+            directory.cached_total_size = total_size
+        assert self.cached_total_size is not None
+        return self.cached_total_size
+
     def get_total_size(self, min_file_size: int | None = None, max_file_size: int | None = None) -> int:
-        # includes the size of child directories
+        # includes the size of child directories, although the file size range only applies to this directory's files
+        if min_file_size is None and max_file_size is None:
+            return self.cached_total_size if self.cached_total_size is not None else self.compute_total_sizes()
         total_size_of_files_in_directory = sum(
             list(
                 filter(
@@ -65,51 +100,7 @@ class Directory:
 
     @classmethod
     def from_input_file(cls, file_name: str = "input.txt") -> "Directory":
-        with open(file_name, "r") as f:
-            file_contents = f.read()
-            file_contents_by_instruction = file_contents.split(BASH)
-
-            root_directory = Directory(name=ROOT, files={}, parent=None, children={})
-            cwd = root_directory  # hopefully this doesn't become problematic in part two!
-
-            for instruction_line in file_contents_by_instruction:
-                if stripped_instruction_line := instruction_line.strip():  # ignore empty lines
-                    instruction_lines = stripped_instruction_line.splitlines()
-                    # assume the first element of `instruction_lines` is the instruction and any subsequent lines are
-                    # the console output
-                    assert len(instruction_lines) > 0, "would be silly if this assumption is violated"
-                    instruction = instruction_lines[0]
-
-                    if instruction.startswith(CD):
-                        # we changing directory
-                        directory_name = instruction.split(" ", 1)[1]
-                        if directory_name == ROOT:
-                            cwd = root_directory
-                        elif directory_name == PREVIOUS:
-                            # change into the parent of this directory
-                            if cwd.parent is not None:  # trying to `cd ..` from root does nothing
-                                cwd = cwd.parent
-                        else:
-                            # change into a directory relative to this directory
-                            # hopefully we don't need to handle changing into /a/b!
-                            if directory_name in cwd.children.keys():
-                                # change into a known directory
-                                cwd = cwd.children[directory_name]
-                            else:
-                                # we have discovered a new directory!
-                                cwd.children[directory_name] = Directory(
-                                    name=directory_name, files={}, children={}, parent=cwd
-                                )
-                    elif instruction.startswith(LS):
-                        # we printing the contents of a directory
-                        files, directories = partition_ls_output_into_files_and_directories(
-                            cwd=cwd, ls_output=instruction_lines[1:]
-                        )
-                        cwd.files |= files
-                        cwd.children |= directories
-                    else:
-                        raise Exception(f"unknown instruction: {instruction}")
-        return root_directory
+        return FileSystem.from_input_file(file_name).root
 
     def get_total_size_of_file_system_in_range(
         self, min_directory_size: int = 0, max_directory_size: int = 100_000
@@ -139,13 +130,73 @@ class Directory:
         return smallest_big_directory
 
 
+def join_path(directory_path: str, path: str) -> str:
+    # handles `..`, `a`, `/a/b`, `../c` etc. - only the less common cases need the (slower) full normalisation
+    if path == PREVIOUS:
+        return posixpath.dirname(directory_path)
+    if ROOT not in path and path != ".":
+        return f"{directory_path.rstrip(ROOT)}{ROOT}{path}"
+    return posixpath.normpath(posixpath.join(directory_path, path))
+
+
+@dataclasses.dataclass
+class FileSystem:
+    root: Directory
+    directories_by_path: dict[str, Directory]  # absolute path (e.g. `/a/e`) => directory
+
+    @classmethod
+    def from_input_file(cls, file_name: str = "input.txt") -> "FileSystem":
+        # the log is read one line at a time and each line of `ls` output is added as soon as it's read, so memory use
+        # only depends on the size of the file system rather than the length of the log
+        root_directory = Directory(name=ROOT, files={}, children={}, parent=None)
+        file_system = cls(root=root_directory, directories_by_path={ROOT: root_directory})
+        cwd_path = ROOT
+        cwd = root_directory
+        for line in read_lines(file_name):
+            if not (stripped_line := line.strip()):  # ignore empty lines
+                continue
+            # `ls` output starts with a size or `dir`, so only commands start with `$` (filenames can contain it though)
+            if stripped_line.startswith(BASH):
+                instruction = stripped_line[len(BASH) :].strip()
+                if instruction.startswith(CD):
+                    cwd_path = join_path(cwd_path, instruction.split(" ", 1)[1])
+                    cwd = file_system.get_directory(cwd_path)
+                elif not instruction.startswith(LS):  # the output of `ls` is on the lines which follow
+                    raise Exception(f"unknown instruction: {instruction}")
+            elif stripped_line.startswith(f"{DIR} "):
+                # assume this is a directory - the expected format is `dir <dirname>`
+                dirname = stripped_line.split(" ", 1)[1]
+                file_system.directories_by_path[join_path(cwd_path, dirname)] = cwd.get_or_add_child(dirname)
+            else:
+                # assume this is a file - the expected format is `<size> <filename>`
+                filesize_string, filename = stripped_line.split(" ", 1)
+                cwd.add_file(filename, int(filesize_string))
+        return file_system
+
+    def get_directory(self, path: str) -> Directory:
+        # creating it (and any directories above it) if it hasn't been seen yet
+        missing_paths = []
+        while path not in self.directories_by_path:
+            missing_paths.append(path)
+            path = posixpath.dirname(path)
+        directory = self.directories_by_path[path]
+        for missing_path in missing_paths[::-1]:
+            directory = directory.get_or_add_child(posixpath.basename(missing_path))
+            self.directories_by_path[missing_path] = directory
+        return directory
+
+
+def part_1(file_name: str = "input.txt") -> int:
+    return Directory.from_input_file(file_name).get_total_size_of_file_system_in_range(max_directory_size=100_000)
+
+
+def part_2(file_name: str = "input.txt") -> int:
+    return Directory.from_input_file(file_name).find_one_directory_to_delete_in_file_system().get_total_size()
+
+
 if __name__ == "__main__":
-    file_system = Directory.from_input_file()
-    print(
-        "The total file size of files with size of at most 100,000 is "
-        f"{file_system.get_total_size_of_file_system_in_range(max_directory_size=100_000)}."
-    )
-    one_directory_to_delete = file_system.find_one_directory_to_delete_in_file_system()
+    print(f"The total file size of files with size of at most 100,000 is {part_1()}.")
+    one_directory_to_delete = Directory.from_input_file().find_one_directory_to_delete_in_file_system()
     print(
         f"You should delete directory '{one_directory_to_delete.name}' "
         f"(which has size {one_directory_to_delete.get_total_size()})."
@@ -1,42 +1,130 @@
-from typing import Iterable, TypeAlias
+import os
+import sys
+from array import array
+from pathlib import Path
+from typing import Iterator
 
-Pair: TypeAlias = tuple[int, int]
-TreeGrid: TypeAlias = dict[Pair, int]
+sys.path.append(str(Path(__file__).resolve().parents[1]))  # make the shared `lib` package importable
+from lib.grid import Grid  # isort: skip
+from lib.inputs import STDIN_FILE_NAME, Buffer, map_input, read_lines  # isort: skip
 
+MAX_IN_MEMORY_BYTES = 2**28  # bigger forests than this are counted a band of rows at a time instead
+BAND_ROWS = 256
 
-def read_input_file(file_name: str = "input.txt") -> TreeGrid:
-    with open(file_name, "r") as f:
-        return {(r, c): int(height) for r, line in enumerate(f.readlines()) for c, height in enumerate(line.strip())}
 
+def read_input_file(file_name: str = "input.txt") -> Grid:
+    return Grid.from_lines(read_lines(file_name), int)
 
-def get_slices(pair: Pair, h: int, w: int) -> Iterable[Iterable[Pair]]:
-    yield ((x, pair[1]) for x in reversed(range(0, pair[0])))  # up
-    yield ((x, pair[1]) for x in range(pair[0] + 1, h))  # down
-    yield ((pair[0], x) for x in reversed(range(0, pair[1])))  # left
-    yield ((pair[0], x) for x in range(pair[1] + 1, w))  # right
 
+def sweep_line(cells: bytes, line: range, visible: bytearray, scenic_scores: "array[int]") -> None:
+    # walk along one row or column of trees, looking back towards where the walk started from each tree. the stack holds
+    # (height, position) of every tree that hasn't been hidden behind a later tree at least as tall, so it's always in
+    # decreasing order of height - the tree that blocks the view is whatever is left on top after popping the shorter
+    # ones, and if nothing is left then the tree can be seen from the edge. every tree is pushed and popped at most
+    # once, so the whole line takes linear time.
+    stack: list[tuple[int, int]] = []
+    for position, i in enumerate(line):
+        height = cells[i]
+        while stack and stack[-1][0] < height:
+            stack.pop()
+        if stack:
+            scenic_scores[i] *= position - stack[-1][1]
+        else:
+            visible[i] = 1
+            scenic_scores[i] *= position  # can see all the way to the edge
+        stack.append((height, position))
 
-def check_tree(grid: TreeGrid, pair: Pair, h: int, w: int) -> tuple[bool, int]:
-    total_score = 1
-    tree_is_visible = False
-    for grid_slice in get_slices(pair, h, w):
-        slice_score = 0
-        checked_entirety_of_slice = True
-        for slice_pair in grid_slice:
-            slice_score += 1
-            if grid[slice_pair] >= grid[pair]:
-                checked_entirety_of_slice = False
+
+def check_forest_in_memory(file_name: str = "input.txt") -> tuple[int, int]:  # visible trees, max scenic score
+    tree_grid = read_input_file(file_name)
+    h, w, cells = tree_grid.height, tree_grid.width, tree_grid.cells
+    visible = bytearray(len(cells))
+    scenic_scores = array("q", [1]) * len(cells)
+    for line in [range(y * w, (y + 1) * w) for y in range(h)] + [range(x, len(cells), w) for x in range(w)]:
+        sweep_line(cells, line, visible, scenic_scores)  # looking left/up
+        sweep_line(cells, line[::-1], visible, scenic_scores)  # looking right/down
+    return sum(visible), max(scenic_scores, default=0)
+
+
+def iter_row_bands(buffer: Buffer, band_rows: int = BAND_ROWS) -> Iterator[list[bytes]]:
+    # only one band of rows is copied out of the buffer at a time
+    position = 0
+    while position < len(buffer):
+        band_end = position
+        for _ in range(band_rows):
+            if (band_end := buffer.find(b"\n", band_end) + 1) == 0:
+                band_end = len(buffer)
                 break
-        tree_is_visible = tree_is_visible or checked_entirety_of_slice
-        total_score *= slice_score
-    return tree_is_visible, total_score
+        yield [x.rstrip(b"\r") for x in buffer[position:band_end].split(b"\n") if x.rstrip(b"\r")]
+        position = band_end
+
+
+def check_forest_in_bands(file_name: str = "input.txt", band_rows: int = BAND_ROWS) -> tuple[int, int]:
+    # the same answers as `check_forest_in_memory`, but streaming rows from a memory-mapped file so memory use only
+    # depends on the width of the forest. left/right are swept a row at a time, and each column keeps a stack of
+    # (height, row) for looking up like `sweep_line` does. looking down needs rows that haven't been read yet, so each
+    # column also keeps the trees which nothing below has blocked yet - a tree leaves that stack once a tree at least as
+    # tall turns up below it, which is when its view down ends and it's known not to be visible from the bottom.
+    # heights in each stack strictly decrease, so there are at most 10 entries per column.
+    up_stacks: list[list[tuple[int, int]]] = []
+    # (height, row, scenic score so far, visible from the left, right or top?)
+    down_stacks: list[list[tuple[int, int, int, int]]] = []
+    trees_visible = 0
+    max_scenic_score = 0
+    y = -1
+    with map_input(file_name) as buffer:
+        for band in iter_row_bands(buffer, band_rows):
+            for row in band:
+                y += 1
+                if not up_stacks:
+                    up_stacks, down_stacks = [[] for _ in row], [[] for _ in row]
+                if len(row) != len(up_stacks):
+                    raise ValueError(f"row {y} is {len(row)} trees wide rather than {len(up_stacks)}")
+                visible = bytearray(len(row))
+                scenic_scores = array("q", [1]) * len(row)
+                sweep_line(row, range(len(row)), visible, scenic_scores)  # looking left
+                sweep_line(row, range(len(row) - 1, -1, -1), visible, scenic_scores)  # looking right
+                for x, height in enumerate(row):
+                    up_stack = up_stacks[x]
+                    while up_stack and up_stack[-1][0] < height:
+                        up_stack.pop()
+                    if up_stack:
+                        scenic_scores[x] *= y - up_stack[-1][1]
+                        if up_stack[-1][0] == height:
+                            up_stack.pop()  # this tree is just as tall and closer to anything below it
+                    else:
+                        visible[x] = 1
+                        scenic_scores[x] *= y
+                    up_stack.append((height, y))
+
+                    down_stack = down_stacks[x]
+                    while down_stack and down_stack[-1][0] <= height:
+                        _, blocked_y, scenic_score, blocked_visible = down_stack.pop()
+                        trees_visible += blocked_visible
+                        max_scenic_score = max(max_scenic_score, scenic_score * (y - blocked_y))
+                    down_stack.append((height, y, scenic_scores[x], visible[x]))
+    # anything that was never blocked can see all the way to the bottom edge
+    for down_stack in down_stacks:
+        for _, unblocked_y, scenic_score, _ in down_stack:
+            trees_visible += 1
+            max_scenic_score = max(max_scenic_score, scenic_score * (y - unblocked_y))
+    return trees_visible, max_scenic_score
+
+
+def check_forest(file_name: str = "input.txt") -> tuple[int, int]:  # visible trees, max scenic score
+    if file_name != STDIN_FILE_NAME and os.path.getsize(file_name) > MAX_IN_MEMORY_BYTES:
+        return check_forest_in_bands(file_name)
+    return check_forest_in_memory(file_name)
+
+
+def part_1(file_name: str = "input.txt") -> int:
+    return check_forest(file_name)[0]
+
+
+def part_2(file_name: str = "input.txt") -> int:
+    return check_forest(file_name)[1]
 
 
 if __name__ == "__main__":
-    tree_grid = read_input_file("input.txt")
-    h, w = [max(x) + 1 for x in zip(*tree_grid.keys())]  # calculate height and width of forest
-    trees_visible, scenic_scores = zip(
-        *[check_tree(grid=tree_grid, pair=(r, c), h=h, w=w) for r in range(1, h - 1) for c in range(1, w - 1)]
-    )
-    print(f"The number of partially visible trees in the forest is {(h * 2 + w * 2 - 4) + sum(trees_visible)}.")
-    print(f"The maximum scenic score in the forest is {max(scenic_scores)}.")
+    print(f"The number of partially visible trees in the forest is {part_1()}.")
+    print(f"The maximum scenic score in the forest is {part_2()}.")
@@ -1,49 +1,75 @@
-from typing import TypeAlias
+import sys
+from pathlib import Path
+from typing import Iterable, Iterator, TypeAlias
 
-Point: TypeAlias = tuple[int, int]  # x, y
-Transformation: TypeAlias = tuple[int, int]  # x delta, y delta
+sys.path.append(str(Path(__file__).resolve().parents[1]))  # make the shared `lib` package importable
+from lib.inputs import read_lines  # isort: skip
 
+Move: TypeAlias = tuple[int, int, int]  # x delta, y delta, number of steps
 
-def get_transformations_with_magnitude(direction: str, magnitude_string: str) -> list[Transformation]:
-    return [{"R": (1, 0), "U": (0, 1), "L": (-1, 0), "D": (0, -1)}[direction]] * int(magnitude_string)
+DIRECTIONS = {"R": (1, 0), "U": (0, 1), "L": (-1, 0), "D": (0, -1)}
+PACKED_X = 2**32  # points are packed into a single int as x * PACKED_X + y, which works for |y| < 2**31
 
 
-def read_input_file(file_name: str = "input.txt") -> list[Transformation]:
-    with open(file_name, "r") as f:
-        return [
-            transformation
-            for line in f.readlines()
-            for transformation in get_transformations_with_magnitude(*line.strip().split(" "))
-        ]
+def read_input_file(file_name: str = "input.txt") -> Iterator[Move]:
+    for line in read_lines(file_name):
+        direction, magnitude_string = line.strip().split(" ")
+        yield *DIRECTIONS[direction], int(magnitude_string)
 
 
-def are_points_touching(point_a: Point, point_b: Point) -> bool:
-    return point_b[0] - 1 <= point_a[0] <= point_b[0] + 1 and point_b[1] - 1 <= point_a[1] <= point_b[1] + 1
+def simulate_rope(moves: Iterable[Move], knot_counts: Iterable[int]) -> dict[int, int]:
+    # number of knots => number of points visited by the tail of a rope with that many knots.
+    # the first k knots of a longer rope move exactly like a rope with k knots, so every rope length is covered by
+    # simulating the longest one and tracking where each of the shorter ropes' tails go.
+    visited_by_knot = {knot_count - 1: {0} for knot_count in knot_counts}  # knot index => packed points
+    tracked_knots = sorted(visited_by_knot.items())
+    num_knots = tracked_knots[-1][0] + 1
+    xs, ys = [0] * num_knots, [0] * num_knots  # knot 0 is the head
+    for dx, dy, steps in moves:
+        for step in range(steps):
+            previous_x = xs[0] = xs[0] + dx
+            previous_y = ys[0] = ys[0] + dy
+            last_moved = 0
+            rope_translated = True  # did every knot move exactly like the head did?
+            for i in range(1, num_knots):
+                x, y = xs[i], ys[i]
+                x_gap, y_gap = previous_x - x, previous_y - y
+                if -1 <= x_gap <= 1 and -1 <= y_gap <= 1:
+                    rope_translated = False
+                    break  # all knots after this are guaranteed to also be touching - no need to check
+                knot_dx, knot_dy = (x_gap > 0) - (x_gap < 0), (y_gap > 0) - (y_gap < 0)  # follow the previous knot
+                if knot_dx != dx or knot_dy != dy:
+                    rope_translated = False
+                previous_x = xs[i] = x + knot_dx
+                previous_y = ys[i] = y + knot_dy
+                last_moved = i
+            for i, visited in tracked_knots:
+                if i > last_moved:
+                    break  # hasn't moved, so wherever it is has already been visited
+                visited.add(xs[i] * PACKED_X + ys[i])
+            if rope_translated and (remaining_steps := steps - step - 1):
+                # the whole rope is now trailing straight behind the head, so the rest of this move shifts every knot
+                # along by the same amount each step and the points visited by each tail are just a range
+                packed_delta = dx * PACKED_X + dy
+                for i, visited in tracked_knots:
+                    start = xs[i] * PACKED_X + ys[i] + packed_delta
+                    visited.update(range(start, start + packed_delta * remaining_steps, packed_delta))
+                for i in range(num_knots):
+                    xs[i] += dx * remaining_steps
+                    ys[i] += dy * remaining_steps
+                break
+    return {i + 1: len(visited) for i, visited in tracked_knots}
 
 
-def clamp(number: int, min_: int = -1, max_: int = 1) -> int:  # clamp `number` to [`min_`, `max_`]
-    return min(max(number, min_), max_)
+def part_1(file_name: str = "input.txt") -> int:
+    return simulate_rope(read_input_file(file_name), knot_counts=[2])[2]
 
 
-def apply_transformation(point: Point, transformation: Transformation) -> Point:
-    return point[0] + transformation[0], point[1] + transformation[1]
-
-
-def apply_transformations(transformations: list[Transformation], num_knots: int) -> set[Point]:
-    points_visited_by_tail: set[Point] = {(0, 0)}
-    knots: list[Point] = [(0, 0)] * num_knots  # knots[0]: head, knots[-1]: tail
-    for transformation in transformations:
-        knots[0] = apply_transformation(knots[0], transformation)
-        for i in range(1, num_knots):
-            if are_points_touching(knots[i - 1], knots[i]):
-                break  # all points in `knots` after this are guaranteed to also be touching - no need to check
-            knot_transformation = clamp(knots[i - 1][0] - knots[i][0]), clamp(knots[i - 1][1] - knots[i][1])
-            knots[i] = apply_transformation(knots[i], knot_transformation)  # follow the previous knot
-        points_visited_by_tail.add(knots[-1])
-    return points_visited_by_tail
+def part_2(file_name: str = "input.txt") -> int:
+    return simulate_rope(read_input_file(file_name), knot_counts=[10])[10]
 
 
 if __name__ == "__main__":
-    tf = read_input_file("input.txt")
-    print(f"The tail of the 2-knot rope travelled to {len(apply_transformations(tf, num_knots=2))} points.")
-    print(f"The tail of the 10-knot rope travelled to {len(apply_transformations(tf, num_knots=10))} points.")
+    points_visited = simulate_rope(read_input_file(), knot_counts=[2, 10])
+    print(f"The tail of the 2-knot rope travelled to {points_visited[2]} points.")
+    print(f"The tail of the 10-knot rope travelled to {points_visited[10]} points.")
@@ -1,44 +1,81 @@
-from collections import defaultdict
-from typing import TypeAlias
-
-Instructions: TypeAlias = dict[int, int]  # cycle: value to add to the register
-
-
-def read_input_file(file_name: str = "input.txt") -> Instructions:
-    with open(file_name, "r") as f:
-        instructions: dict[int, int] = defaultdict(int)
-        instructions[-1] = 1
-        cycle: int = 0
-        for line in f.readlines():
-            split_line = line.strip().split(" ")
-            if split_line[0] == "addx":
-                instructions[cycle + 3] += int(split_line[1])
-                cycle += 1
+import itertools
+import sys
+from array import array
+from pathlib import Path
+from typing import Iterator, TypeAlias
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))  # make the shared `lib` package importable
+from lib.inputs import read_lines  # isort: skip
+
+RegisterTimeline: TypeAlias = "array[int]"  # the x register's value during each cycle, starting from cycle -1
+
+LIT = ord("#")
+DARK = ord(".")
+
+
+def read_input_file(file_name: str = "input.txt") -> RegisterTimeline:
+    # record how much the register changes by on each cycle, then add those up once so that looking up the register's
+    # value on any cycle is O(1). index i is cycle i - 1.
+    changes = array("q", [1])  # cycle -1 starts the register at 1
+    cycle: int = 0
+    for line in read_lines(file_name):
+        split_line = line.strip().split(" ")
+        if split_line[0] == "addx":
+            if len(changes) <= (index := cycle + 4):
+                changes.extend(itertools.repeat(0, index + 1 - len(changes)))
+            changes[index] += int(split_line[1])
             cycle += 1
-        return instructions
+        cycle += 1
+    changes.extend(itertools.repeat(0, cycle + 2 - len(changes)))  # cover every cycle, even trailing noops
+    return array("q", itertools.accumulate(changes))
+
+
+def calculate_x_register_value(timeline: RegisterTimeline, cycle: int) -> int:
+    return timeline[min(max(cycle + 1, 0), len(timeline) - 1)]  # the register doesn't change after the last cycle
+
+
+def get_last_cycle(timeline: RegisterTimeline) -> int:
+    return len(timeline) - 2
+
+
+def calculate_total_signal_strength(timeline: RegisterTimeline, cycle_step: int = 40, starting_cycle: int = 20) -> int:
+    return sum(
+        [
+            calculate_x_register_value(timeline, c) * c
+            for c in range(starting_cycle, get_last_cycle(timeline), cycle_step)
+        ]
+    )
+
+
+def render_crt_output(
+    timeline: RegisterTimeline, width: int = 40, height: int = 6, sprite_width: int = 3, first_cycle: int = 1
+) -> str:
+    # one line of `width` pixels per row, drawn into a framebuffer which starts out dark
+    framebuffer = bytearray([*[DARK] * width, ord("\n")] * height)
+    for i in range(width * height):
+        sprite_position = calculate_x_register_value(timeline, first_cycle + i)
+        row, column = divmod(i, width)
+        if sprite_position <= column + 1 < sprite_position + sprite_width:
+            framebuffer[row * (width + 1) + column] = LIT
+    return framebuffer.decode()
 
 
-def calculate_x_register_value(instructions: Instructions, cycle: int) -> int:
-    return sum([instructions[x] for x in range(-1, cycle + 1)])
+def render_crt_frames(
+    timeline: RegisterTimeline, width: int = 40, height: int = 6, sprite_width: int = 3
+) -> Iterator[str]:
+    # every frame drawn while the program runs, for programs which run for longer than one frame
+    for first_cycle in range(1, max(get_last_cycle(timeline), 1) + 1, width * height):
+        yield render_crt_output(timeline, width, height, sprite_width, first_cycle=first_cycle)
 
 
-def calculate_total_signal_strength(instructions: Instructions, cycle_step: int = 40, starting_cycle: int = 20) -> int:
-    max_cycle = max(instructions.keys())
-    return sum([calculate_x_register_value(instructions, c) * c for c in range(starting_cycle, max_cycle, cycle_step)])
+def part_1(file_name: str = "input.txt") -> int:
+    return calculate_total_signal_strength(read_input_file(file_name))
 
 
-def render_crt_output(instructions: Instructions, width: int = 40, height: int = 6, sprite_width: int = 3) -> str:
-    output = ""
-    sprite_position = calculate_x_register_value(instructions, -1)
-    for cycle in range(1, width * height + 1):
-        if cycle in instructions.keys():
-            sprite_position = calculate_x_register_value(instructions, cycle)
-        character = "#" if ((cycle - 1) % width) + 1 in range(sprite_position, sprite_position + sprite_width) else "."
-        output += character + "\n" if cycle % width == 0 else character
-    return output
+def part_2(file_name: str = "input.txt") -> str:
+    return render_crt_output(read_input_file(file_name))
 
 
 if __name__ == "__main__":
-    inst = read_input_file("input.txt")
-    print(f"The total signal strength starting at 20 and with steps of 40 is {calculate_total_signal_strength(inst)}.")
-    print(f"The CRT draws the following pixels:\n\n{render_crt_output(inst)}")
+    print(f"The total signal strength starting at 20 and with steps of 40 is {part_1()}.")
+    print(f"The CRT draws the following pixels:\n\n{part_2()}")
@@ -1,74 +1,148 @@
-import copy
 import dataclasses
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from functools import reduce
+from itertools import repeat
 from operator import mul
+from pathlib import Path
 from typing import Callable
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))  # make the shared `lib` package importable
+from lib.expressions import compile_operation  # isort: skip
+from lib.inputs import STDIN_FILE_NAME, read_records  # isort: skip
+
 
 @dataclasses.dataclass
 class Monkey:
-    items: list[int]  # ordered list of items, represented by their worry value
+    starting_items: tuple[int, ...]  # worry value of each item held at the start. items are followed on their own.
     operation: Callable[[int], int]  # old value => new value
     throw: Callable[[int], int]  # value => monkey to throw the item to
-    inspection_count: int = 0
 
 
 def read_input_file(file_name: str = "input.txt") -> tuple[list[Monkey], int]:
-    with open(file_name, "r") as f:
-        monkeys = []
-        product_mod_base = 1  # used to keep worrying under control while being mathematically equivalent
-        for monkey_text in f.read().split("\n\n"):
-            _, starting_items_text, operation_text, mod_base_text, test_true_target_monkey, test_false_target_monkey = [
-                x.strip() for x in monkey_text.splitlines()
-            ]
-            mod_base = int(mod_base_text[len("Test: divisible by ") :])
-            product_mod_base *= mod_base
-            monkeys.append(
-                Monkey(  # WARNING: using `eval` like this is super unsafe! don't do this in non-toy code.
-                    items=[int(x.strip()) for x in starting_items_text[len("Starting items: ") :].split(",")],
-                    operation=(
-                        lambda value, callable_text=operation_text[  # type: ignore  # mypy unhappy with closures
-                            len("Operation: new = ") :
-                        ].replace("old", "{0}"): eval(callable_text.format(value))
-                    ),
-                    throw=(
-                        lambda value, true_value=int(  # type: ignore  # mypy unhappy with closures
-                            test_true_target_monkey[len("If true: throw to monkey ") :]
-                        ), false_value=int(
-                            test_false_target_monkey[len("If true: throw to monkey ") :]
-                        ), base=mod_base: (
-                            true_value if value % base == 0 else false_value
-                        )
-                    ),
-                )
+    monkeys = []
+    product_mod_base = 1  # used to keep worrying under control while being mathematically equivalent
+    for monkey_lines in read_records(file_name):
+        _, starting_items_text, operation_text, mod_base_text, test_true_target_monkey, test_false_target_monkey = [
+            x.strip() for x in monkey_lines
+        ]
+        mod_base = int(mod_base_text[len("Test: divisible by ") :])
+        product_mod_base *= mod_base
+        monkeys.append(
+            Monkey(
+                starting_items=tuple(int(x) for x in starting_items_text[len("Starting items: ") :].split(",")),
+                operation=compile_operation(operation_text[len("Operation: new = ") :]),
+                throw=(
+                    lambda value, true_value=int(  # type: ignore  # mypy unhappy with closures
+                        test_true_target_monkey[len("If true: throw to monkey ") :]
+                    ), false_value=int(test_false_target_monkey[len("If false: throw to monkey ") :]), base=mod_base: (
+                        true_value if value % base == 0 else false_value
+                    )
+                ),
             )
-        return monkeys, product_mod_base
+        )
+    return monkeys, product_mod_base
+
+
+def count_item_inspections(
+    monkeys: list[Monkey], monkey_index: int, value: int, worrywort: bool, mod_base: int, num_rounds: int
+) -> list[int]:
+    # how many times each monkey inspects one item. where an item goes only depends on its own worry value, so every
+    # item can be followed on its own. at the start of each round an item's state is just (monkey, worry value) - once
+    # a state comes around again the item is going round in a loop, where every lap takes the same number of rounds and
+    # adds the same inspections, so whole laps can be skipped and only the rounds left over need simulating.
+    inspections = [0] * len(monkeys)
+    history: list[list[int]] = []  # inspections at the start of each round, until a loop is found
+    first_rounds: dict[tuple[int, int], int] | None = {}  # state => first round it was seen at the start of
+    round_ = 0
+    while round_ < num_rounds:
+        if first_rounds is not None:
+            if (first_round := first_rounds.get((monkey_index, value))) is None:
+                first_rounds[(monkey_index, value)] = round_
+                history.append([*inspections])
+            else:
+                lap_rounds = round_ - first_round
+                laps = (num_rounds - round_) // lap_rounds
+                inspections = [x + laps * (x - y) for x, y in zip(inspections, history[first_round])]
+                round_ += laps * lap_rounds
+                first_rounds = None  # fewer rounds than a lap left, so no need to keep looking
+                continue
+        while True:  # monkeys go in order, so the item keeps moving this round until it's thrown back to an earlier one
+            monkey = monkeys[monkey_index]
+            value = monkey.operation(value)  # inspect the item
+            if worrywort:
+                value = value % mod_base  # keep anxiety under control with mathematics
+            else:
+                value = value // 3  # keep anxiety under control by taking a chill pill
+            inspections[monkey_index] += 1
+            target = monkey.throw(value)
+            thrown_to_next_round = target < monkey_index
+            monkey_index = target
+            if thrown_to_next_round:
+                break
+        round_ += 1
+    return inspections
+
+
+def get_items(monkeys: list[Monkey]) -> list[tuple[int, int]]:  # (monkey, worry value) for every item
+    return [(monkey_index, value) for monkey_index, monkey in enumerate(monkeys) for value in monkey.starting_items]
+
+
+def count_inspections(
+    monkeys: list[Monkey], items: list[tuple[int, int]], worrywort: bool, mod_base: int, num_rounds: int
+) -> list[int]:
+    inspections = [0] * len(monkeys)
+    for monkey_index, value in items:
+        item_inspections = count_item_inspections(monkeys, monkey_index, value, worrywort, mod_base, num_rounds)
+        inspections = [x + y for x, y in zip(inspections, item_inspections)]
+    return inspections
+
+
+def count_inspections_for_items_in_range(
+    file_name: str, start: int, end: int, worrywort: bool, num_rounds: int
+) -> list[int]:
+    # the monkeys' operations are closures which can't be sent to other processes, so each process reads them itself
+    monkeys, mod_base = read_input_file(file_name)
+    return count_inspections(monkeys, get_items(monkeys)[start:end], worrywort, mod_base, num_rounds)
+
+
+def get_monkey_business(inspections: list[int]) -> int:
+    return reduce(mul, sorted(inspections, reverse=True)[0:2], 1)
 
 
 def calculate_monkey_business(monkeys: list[Monkey], worrywort: bool, mod_base: int, num_rounds: int = 20) -> int:
-    mutated_monkeys = copy.deepcopy(monkeys)  # avoid mutating input list. [*monkeys] doesn't cut it here.
-    for round_ in range(num_rounds):
-        for monkey in mutated_monkeys:
-            while monkey.items:
-                value = monkey.operation(monkey.items.pop(0))  # grab an item for the monkey to inspect and inspect it
-                if worrywort:
-                    value = value % mod_base  # keep anxiety under control with mathematics
-                else:
-                    value = value // 3  # keep anxiety under control by taking a chill pill
-                monkey.inspection_count += 1  # track number of inspections for calculating monkey business
-                mutated_monkeys[monkey.throw(value)].items.append(value)  # pass the item to the next monkey
-    return reduce(mul, sorted([x.inspection_count for x in mutated_monkeys], reverse=True)[0:2], 1)
+    return get_monkey_business(count_inspections(monkeys, get_items(monkeys), worrywort, mod_base, num_rounds))
+
+
+def calculate_monkey_business_for_file(file_name: str, worrywort: bool, num_rounds: int, workers: int = 1) -> int:
+    monkeys, mod_base = read_input_file(file_name)
+    if workers == 1 or file_name == STDIN_FILE_NAME:
+        return calculate_monkey_business(monkeys, worrywort=worrywort, mod_base=mod_base, num_rounds=num_rounds)
+    # every item is independent, so split them between processes and add up their inspections
+    num_items = len(get_items(monkeys))
+    starts = list(range(0, num_items, -(-num_items // workers)))
+    ends = [*starts[1:], num_items]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        inspections_by_chunk = executor.map(
+            count_inspections_for_items_in_range, repeat(file_name), starts, ends, repeat(worrywort), repeat(num_rounds)
+        )
+        return get_monkey_business([sum(x) for x in zip(*inspections_by_chunk)])
+
+
+def part_1(file_name: str = "input.txt", workers: int = 1) -> int:
+    return calculate_monkey_business_for_file(file_name, worrywort=False, num_rounds=20, workers=workers)
+
+
+def part_2(file_name: str = "input.txt", workers: int = 1, num_rounds: int = 10_000) -> int:
+    return calculate_monkey_business_for_file(file_name, worrywort=True, num_rounds=num_rounds, workers=workers)
 
 
 if __name__ == "__main__":
-    m, product_base = read_input_file("input.txt")
     print(
         f"The total level of monkey business in this situation when you're not a worrywort and the monkeys pass "
-        f"your stuff around for 20 rounds is "
-        f"{calculate_monkey_business(m, worrywort=False, num_rounds=20, mod_base=product_base)}."
+        f"your stuff around for 20 rounds is {part_1()}."
     )
     print(
         f"The total level of monkey business in this situation when your anxiety is unbounded and the monkeys pass "
-        f"your stuff around for 10,000 rounds is "
-        f"{calculate_monkey_business(m, worrywort=True, num_rounds=10_000, mod_base=product_base)}."
+        f"your stuff around for 10,000 rounds is {part_2()}."
     )
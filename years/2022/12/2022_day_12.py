@@ -1,10 +1,15 @@
 import dataclasses
-import time
-from queue import PriorityQueue
-from typing import Any, TypeAlias
+import sys
+from functools import partial
+from pathlib import Path
+from typing import Callable, TypeAlias
 
-Point: TypeAlias = tuple[int, int]  # x, y
-HeightMap: TypeAlias = dict[Point, int]  # point => elevation
+sys.path.append(str(Path(__file__).resolve().parents[1]))  # make the shared `lib` package importable
+from lib.grid import Grid, Point  # isort: skip
+from lib.inputs import read_lines  # isort: skip
+from lib.search import UNREACHED, CompressedGraph, SearchResult, a_star_search, breadth_first_search  # isort: skip
+
+HeightMap: TypeAlias = Grid  # point => elevation
 
 
 def get_value_for_character(character: str) -> int:
@@ -12,99 +17,117 @@ def get_value_for_character(character: str) -> int:
     return ord(character) - 96
 
 
-def heuristic(source: Point, target: Point) -> int:
+def heuristic(source: int, target: Point, heightmap: HeightMap) -> int:
     # a simple admissible heuristic for the cost of moving from `source` to `target` - Manhattan distance :)
-    return abs(source[0] - target[0]) + abs(source[1] - target[1])
+    source_point = heightmap.point(source)
+    return abs(source_point[0] - target[0]) + abs(source_point[1] - target[1])
 
 
-def possible_moves(source: Point, heightmap: HeightMap, height_delta: int = 1) -> list[Point]:
-    # return a list of possible moves from `source`, taking `heightmap` into account
+def possible_moves(source: int, heightmap: HeightMap, height_delta: int = 1) -> list[int]:
+    # return a list of possible moves from cell `source`, taking `heightmap` into account
     moves = []
-    for possible_move in (
-        (source[0], source[1] + 1),  # up
-        (source[0], source[1] - 1),  # down
-        (source[0] - 1, source[1]),  # left
-        (source[0] + 1, source[1]),  # right
+    cells, w = heightmap.cells, heightmap.width
+    x = source % w
+    max_height = cells[source] + height_delta
+    for possible_move, within_map in (
+        (source - w, source >= w),  # up
+        (source + w, source + w < len(cells)),  # down
+        (source - 1, x > 0),  # left
+        (source + 1, x < w - 1),  # right
     ):
-        if possible_move in heightmap.keys() and heightmap[possible_move] - heightmap[source] <= height_delta:
+        if within_map and cells[possible_move] <= max_height:
             moves.append(possible_move)
     return moves
 
 
 def read_input_file(file_name: str = "input.txt") -> tuple[HeightMap, Point, Point]:  # map, start, target
-    heightmap = {}
     start = None
     target = None
-    with open(file_name, "r") as f:
-        for y, line in enumerate(f.readlines()):
-            for x, character in enumerate(line):
-                if character == "S":
-                    assert start is None, "multiple starts in input!"
-                    start = (x, y)
-                    character = "a"
-                elif character == "E":
-                    assert target is None, "multiple targets in input!"
-                    target = (x, y)
-                    character = "z"
-                heightmap[(x, y)] = get_value_for_character(character)
+    lines = [x for x in read_lines(file_name) if x]  # skip blank lines so `y` matches the heightmap's rows
+    for y, line in enumerate(lines):
+        if "S" in line:
+            assert start is None and line.count("S") == 1, "multiple starts in input!"
+            start = (line.index("S"), y)
+        if "E" in line:
+            assert target is None and line.count("E") == 1, "multiple targets in input!"
+            target = (line.index("E"), y)
     assert start is not None and target is not None, "start and end not specified in input!"
+    heightmap = Grid.from_lines(
+        lines, lambda character: get_value_for_character({"S": "a", "E": "z"}.get(character, character))
+    )
     return heightmap, start, target
 
 
-@dataclasses.dataclass
-class HeuristicPoint:
-    h: int = dataclasses.field()
-    point: Point = dataclasses.field()
-
-    def __eq__(self, other: Any) -> bool:
-        return isinstance(other, HeuristicPoint) and self.h == other.h
-
-    def __lt__(self, other: Any) -> bool:
-        return isinstance(other, HeuristicPoint) and self.h < other.h
-
+def compile_heightmap(heightmap: HeightMap) -> CompressedGraph:
+    # the moves out of every cell, worked out once up front since the map never changes
+    return CompressedGraph.from_neighbours(len(heightmap.cells), partial(possible_moves, heightmap=heightmap))
 
-def reconstruct_path(point: Point, previous_point_map: dict[Point, Point]) -> list[Point]:
-    if point in previous_point_map.keys():
-        return [point] + reconstruct_path(previous_point_map[point], previous_point_map)
-    return [point]
 
-
-def a_star_search(start: Point, target: Point, heightmap: HeightMap) -> list[Point]:
-    frontier: PriorityQueue[HeuristicPoint] = PriorityQueue()
-    frontier.put(HeuristicPoint(point=start, h=heuristic(start, target)))
-    previous_point: dict[Point, Point] = {}
-    g_score: dict[Point, int | None] = {start: 0}  # none represents infinite
-    while True:
-        if frontier.empty():
-            return []  # infeasible given the starting point and possible moves
-        current_point = frontier.get()
-        if current_point.point == target:
-            return reconstruct_path(current_point.point, previous_point)
-        moves = possible_moves(current_point.point, heightmap)
-        for move in moves:
-            # coupla type ignores here because mypy thinks a.get(thing, number) foc whatever reason? might fix later
-            tentative_score = g_score.get(current_point.point, 1_000_000) + 1  # type: ignore
-            if tentative_score < g_score.get(move, 1_000_000):  # type: ignore
-                previous_point[move] = current_point.point
-                g_score[move] = tentative_score
-                frontier.put(HeuristicPoint(point=move, h=heuristic(move, target) + tentative_score))
+def find_shortest_path(
+    start_points: list[Point], target: Point, heightmap: HeightMap, graph: CompressedGraph | None = None
+) -> list[Point]:
+    # searching from every start point at once finds the shortest path from whichever start point is closest.
+    # pass in `graph` from `compile_heightmap` to reuse it across searches on the same map.
+    graph = compile_heightmap(heightmap) if graph is None else graph
+    result = a_star_search(
+        sources=[heightmap.index(*x) for x in start_points],
+        neighbours=graph.weighted_neighbours,
+        heuristic=partial(heuristic, target=target, heightmap=heightmap),
+        targets={heightmap.index(*target)},
+        num_nodes=len(heightmap.cells),
+    )
+    return [heightmap.point(x) for x in result.path()]
+
+
+@dataclasses.dataclass(frozen=True)
+class DistanceField:
+    # the number of steps from every cell to the target, from one breadth-first search backwards from the target.
+    # building it is a single pass over the map, after which any number of start points can be looked up.
+    heightmap: HeightMap
+    target: Point
+    search_result: SearchResult
+
+    @classmethod
+    def from_target(cls, heightmap: HeightMap, target: Point, graph: CompressedGraph | None = None) -> "DistanceField":
+        graph = compile_heightmap(heightmap) if graph is None else graph
+        search_result = breadth_first_search(
+            sources=[heightmap.index(*target)],
+            neighbours=graph.reversed().neighbours,  # the cells which can move to each cell
+            num_nodes=len(heightmap.cells),
+        )
+        return cls(heightmap=heightmap, target=target, search_result=search_result)
+
+    def distance(self, point: Point) -> int | None:  # None if the target can't be reached from `point`
+        return self.search_result.distance(self.heightmap.index(*point))
+
+    def path(self, point: Point) -> list[Point]:  # `point` => target
+        return [self.heightmap.point(x) for x in self.search_result.path(self.heightmap.index(*point))[::-1]]
+
+    def find_closest(self, predicate: Callable[[Point, int], bool]) -> Point | None:
+        # the closest point to the target whose (point, elevation) satisfies `predicate`, e.g. any point of elevation 1
+        closest: tuple[int, int] | None = None  # distance, cell index
+        for i, distance in enumerate(self.search_result.distances):
+            if distance != UNREACHED and (closest is None or distance < closest[0]):
+                if predicate(self.heightmap.point(i), self.heightmap.cells[i]):
+                    closest = distance, i
+        return self.heightmap.point(closest[1]) if closest is not None else None
+
+
+def part_1(file_name: str = "input.txt") -> int:
+    hm, start_point, end_point = read_input_file(file_name)
+    return len(find_shortest_path([start_point], end_point, hm)) - 1
+
+
+def part_2(file_name: str = "input.txt") -> int:
+    hm, _, end_point = read_input_file(file_name)
+    distance_field = DistanceField.from_target(hm, end_point)
+    closest_start = distance_field.find_closest(lambda point, elevation: elevation == 1)
+    assert closest_start is not None, "the target can't be reached from any point of elevation 1"
+    distance = distance_field.distance(closest_start)
+    assert distance is not None, "the closest start point should always be reachable"
+    return distance
 
 
 if __name__ == "__main__":
-    t0 = time.time()  # measure running time of part a
-    hm, start_point, end_point = read_input_file("input.txt")
-    optimal_path = a_star_search(start_point, end_point, hm)
-    print(
-        f"Starting from {start_point}, the optimal path is {len(optimal_path)-1} steps long. "
-        f"This was computed in roughly {round(time.time() - t0, 2)} seconds."
-    )
-    t1 = time.time()  # measure running time of part b
-    possible_start_points = [key for key, value in hm.items() if value == 1]
-    possible_answers = []
-    for possible_start_point in possible_start_points:
-        if len(possible_path := a_star_search(possible_start_point, end_point, hm)) > 0:
-            possible_answers.append(len(possible_path) - 1)
-    print(
-        f"Starting from any point of elevation 1, the optimal path is {min(possible_answers)} steps long. "
-        f"This was computed in roughly {round(time.time() - t1, 2)} seconds."
-    )
+    print(f"Starting from the current position, the optimal path is {part_1()} steps long.")
+    print(f"Starting from any point of elevation 1, the optimal path is {part_2()} steps long.")
@@ -1,7 +1,12 @@
 import json
+import sys
 from functools import cmp_to_key
+from pathlib import Path
 from typing import TypeAlias
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))  # make the shared `lib` package importable
+from lib.inputs import read_lines, read_records  # isort: skip
+
 PacketItem: TypeAlias = int | list["PacketItem"]
 Packet: TypeAlias = list[PacketItem]
 PacketPair: TypeAlias = tuple[Packet, Packet]
@@ -9,17 +14,14 @@ PacketPair: TypeAlias = tuple[Packet, Packet]
 
 def read_input_file_as_pairs(file_name: str = "input.txt") -> list[PacketPair]:
     packet_pairs = []
-    with open(file_name, "r") as f:
-        for group in f.read().split("\n\n"):
-            split_group = group.splitlines()
-            assert len(split_group) == 2
-            packet_pairs.append((json.loads(split_group[0]), json.loads(split_group[1])))
+    for group in read_records(file_name):
+        assert len(group) == 2
+        packet_pairs.append((json.loads(group[0]), json.loads(group[1])))
     return packet_pairs
 
 
 def read_input_file_as_flat_list(file_name: str = "input.txt") -> list[Packet]:
-    with open(file_name, "r") as f:
-        return [json.loads(line_stripped) for line in f.read().splitlines() if (line_stripped := line.strip())]
+    return [json.loads(line_stripped) for line in read_lines(file_name) if (line_stripped := line.strip())]
 
 
 def is_packet_pair_in_order(left_packet: Packet, right_packet: Packet) -> bool | None:
@@ -42,18 +44,20 @@ def is_packet_pair_in_order(left_packet: Packet, right_packet: Packet) -> bool |
     return True
 
 
-if __name__ == "__main__":
-    print(
-        "The sum of the indices of the packet pairs in the correct order is "
-        f"{sum([i + 1 for i, x in enumerate(read_input_file_as_pairs('input.txt')) if is_packet_pair_in_order(*x)])}."
-    )
+def part_1(file_name: str = "input.txt") -> int:
+    return sum([i + 1 for i, x in enumerate(read_input_file_as_pairs(file_name)) if is_packet_pair_in_order(*x)])
+
+
+def part_2(file_name: str = "input.txt") -> int:
     sorted_packets = sorted(
-        read_input_file_as_flat_list("input.txt") + [[[2]], [[6]]],  # add the two divider packets,
+        read_input_file_as_flat_list(file_name) + [[[2]], [[6]]],  # add the two divider packets,
         key=cmp_to_key(  # type: ignore
             lambda x, y: {True: -1, False: 1, None: 0}[is_packet_pair_in_order(left_packet=x, right_packet=y)]
         ),
     )
-    print(
-        "The decoder key of the distress signal is "
-        f"{(sorted_packets.index([[2]])+1)*(sorted_packets.index([[6]])+1)}."
-    )
+    return (sorted_packets.index([[2]]) + 1) * (sorted_packets.index([[6]]) + 1)
+
+
+if __name__ == "__main__":
+    print(f"The sum of the indices of the packet pairs in the correct order is {part_1()}.")
+    print(f"The decoder key of the distress signal is {part_2()}.")
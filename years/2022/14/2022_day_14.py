@@ -1,67 +1,73 @@
-from typing import Iterable, TypeAlias
+import sys
+from pathlib import Path
+from typing import TypeAlias
 
-Point: TypeAlias = tuple[int, int]  # x, y
-Cave: TypeAlias = set[Point]  # (x, y) => is this cell filled?
+sys.path.append(str(Path(__file__).resolve().parents[1]))  # make the shared `lib` package importable
+from lib.grid import Grid, Point  # isort: skip
+from lib.inputs import read_lines  # isort: skip
 
+Cave: TypeAlias = Grid  # (x, y) => is this cell filled? 0 = empty, 1 = rock, 2 = sand
 
-def draw_line(start: Point, end: Point) -> set[Point]:
-    # super naive solution which handles drawing straight lines in cardinal directions only
-    return {
-        (x, y)
-        for x in range(min(start[0], end[0]), max(start[0], end[0]) + 1)
-        for y in range(min(start[1], end[1]), max(start[1], end[1]) + 1)
-    }
+ROCK = 1
+SAND = 2
 
 
-def read_input_file(file_name: str = "input.txt") -> Cave:
-    cave: Cave = set()
-    with open(file_name, "r") as f:
-        for line in f.readlines():
-            split_line = line.strip().split(" -> ")  # handle each continuous line of rock separately
-            for i in range(len(split_line) - 1):  # fill the cave between each adjacent pair of coordinates
-                start, end = split_line[i].split(","), split_line[i + 1].split(",")
-                cave |= draw_line((int(start[0]), int(start[1])), (int(end[0]), int(end[1])))
-        return cave
+def draw_line(cave: Cave, start: Point, end: Point) -> None:
+    # super naive solution which handles drawing straight lines in cardinal directions only
+    for x in range(min(start[0], end[0]), max(start[0], end[0]) + 1):
+        for y in range(min(start[1], end[1]), max(start[1], end[1]) + 1):
+            cave[x, y] = ROCK
 
 
-def get_possible_sand_movements(point: Point) -> Iterable[Point]:
-    yield point[0], point[1] + 1  # directly down
-    yield point[0] - 1, point[1] + 1  # diagonally down and left
-    yield point[0] + 1, point[1] + 1  # diagonally down and right
+def read_input_file(file_name: str = "input.txt") -> Cave:
+    cave = Grid(width=1, height=1, min_x=500, min_y=0, auto_grow=True)  # the sand source is always in the cave
+    for line in read_lines(file_name):
+        split_line = line.strip().split(" -> ")  # handle each continuous line of rock separately
+        for i in range(len(split_line) - 1):  # fill the cave between each adjacent pair of coordinates
+            start, end = split_line[i].split(","), split_line[i + 1].split(",")
+            draw_line(cave, (int(start[0]), int(start[1])), (int(end[0]), int(end[1])))
+    return cave
 
 
 def simulate_cave(cave: Cave, sand_source: Point, bottomless_void: bool) -> int:
-    sand_block_count, mutated_cave = 0, {*cave}
-    cave_height = max([x[1] for x in mutated_cave]) + 1
+    sand_block_count = 0
+    cave_height = cave.bounding_box()[1][1] + 1
+    # sand can only spread one cell sideways for each cell it falls, so this is all of the cave it can ever reach.
+    # anything below `cave_height` is either the bottomless void or the floor.
+    mutated_cave = cave.cropped(
+        sand_source[0] - cave_height - 1, min(sand_source[1], cave.min_y), sand_source[0] + cave_height + 1, cave_height
+    )
+    cells, w = mutated_cave.cells, mutated_cave.width
+    source_index = mutated_cave.index(*sand_source)
     while True:
-        sand_block = sand_source
-        if sand_block in mutated_cave:
+        if cells[source_index]:
             return sand_block_count  # the cave has filled with sand
-        mutated_cave.add(sand_block)
-        while True:
-            exhausted_all_movement_options = True
-            for new_point in get_possible_sand_movements(sand_block):
-                if new_point not in mutated_cave:
-                    if new_point[1] > cave_height:
-                        if bottomless_void:
-                            return sand_block_count
-                        else:
-                            break
-                    # the sand block can move into this position!
-                    mutated_cave.remove(sand_block)
-                    mutated_cave.add(new_point)
-                    sand_block = new_point
-                    exhausted_all_movement_options = False
-                    break
-            if exhausted_all_movement_options:
-                sand_block_count += 1
-                break
+        sand_block, y = source_index, sand_source[1]
+        while y < cave_height:
+            below = sand_block + w
+            if not cells[below]:  # directly down
+                sand_block = below
+            elif not cells[below - 1]:  # diagonally down and left
+                sand_block = below - 1
+            elif not cells[below + 1]:  # diagonally down and right
+                sand_block = below + 1
+            else:
+                break  # exhausted all movement options
+            y += 1
+        if y == cave_height and bottomless_void:
+            return sand_block_count  # nothing stops sand from falling from this point
+        cells[sand_block] = SAND
+        sand_block_count += 1
+
+
+def part_1(file_name: str = "input.txt") -> int:
+    return simulate_cave(read_input_file(file_name), (500, 0), bottomless_void=True)
+
+
+def part_2(file_name: str = "input.txt") -> int:
+    return simulate_cave(read_input_file(file_name), (500, 0), bottomless_void=False)
 
 
 if __name__ == "__main__":
-    c = read_input_file("input.txt")
-    print(
-        f"After {simulate_cave(c, (500, 0), bottomless_void=True)} blocks of sand fall, any further blocks of sand "
-        f"will fall into the bottomless pit."
-    )
-    print(f"It takes {simulate_cave(c, (500, 0), bottomless_void=False)} blocks of sand to completely fill the cave.")
+    print(f"After {part_1()} blocks of sand fall, any further blocks of sand will fall into the bottomless pit.")
+    print(f"It takes {part_2()} blocks of sand to completely fill the cave.")
@@ -1,8 +1,12 @@
 import re
-import time
+import sys
 from itertools import chain
+from pathlib import Path
 from typing import Iterable, TypeAlias
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))  # make the shared `lib` package importable
+from lib.inputs import read_lines  # isort: skip
+
 Point: TypeAlias = tuple[int, int]  # x, y, distance to closest beacon
 SensorMap: TypeAlias = dict[Point, int]  # (x, y) => distance to closest beacon
 Dimensions = tuple[Point, Point]  # (min x, min y), (max x, max y)
@@ -16,20 +20,19 @@ def read_input_file(file_name: str = "input.txt") -> tuple[SensorMap, set[Point]
     sensor_map: SensorMap = {}
     beacons: set[Point] = set()
     min_x, min_y, max_x, max_y = 0, 0, 0, 0
-    with open(file_name, "r") as f:
-        for line in f.readlines():
-            if stripped_line := line.strip():
-                sensor_x, sensor_y, beacon_x, beacon_y = [
-                    int(x)
-                    for x in re.match(
-                        r"^Sensor at x=(-?\d+), y=(-?\d+): closest beacon is at x=(-?\d+), y=(-?\d+)$", stripped_line
-                    ).groups()  # type: ignore  # technically sloppy but known input data so w/e
-                ]
-                dist = manhattan_distance((sensor_x, sensor_y), (beacon_x, beacon_y))
-                sensor_map[(sensor_x, sensor_y)] = dist
-                beacons.add((beacon_x, beacon_y))
-                min_x, min_y = min(min_x, sensor_x, beacon_x - dist), min(min_y, sensor_y, beacon_y - dist)
-                max_x, max_y = max(max_x, sensor_x, beacon_x + dist), max(max_y, sensor_y, beacon_y + dist)
+    for line in read_lines(file_name):
+        if stripped_line := line.strip():
+            sensor_x, sensor_y, beacon_x, beacon_y = [
+                int(x)
+                for x in re.match(
+                    r"^Sensor at x=(-?\d+), y=(-?\d+): closest beacon is at x=(-?\d+), y=(-?\d+)$", stripped_line
+                ).groups()  # type: ignore  # technically sloppy but known input data so w/e
+            ]
+            dist = manhattan_distance((sensor_x, sensor_y), (beacon_x, beacon_y))
+            sensor_map[(sensor_x, sensor_y)] = dist
+            beacons.add((beacon_x, beacon_y))
+            min_x, min_y = min(min_x, sensor_x, beacon_x - dist), min(min_y, sensor_y, beacon_y - dist)
+            max_x, max_y = max(max_x, sensor_x, beacon_x + dist), max(max_y, sensor_y, beacon_y + dist)
     return sensor_map, beacons, ((min_x, max_x), (min_y, max_y))
 
 
@@ -78,18 +81,16 @@ def find_distress_signal(file_name: str, min_x: int, max_x: int, min_y: int, max
     return None
 
 
+def part_1(file_name: str = "input.txt", y: int = 2_000_000) -> int:
+    return count_possible_distress_signal_positions_at_y_level(file_name=file_name, y=y)
+
+
+def part_2(file_name: str = "input.txt", max_coordinate: int = 4_000_000) -> int:
+    s = find_distress_signal(file_name=file_name, min_x=0, max_x=max_coordinate, min_y=0, max_y=max_coordinate)
+    assert s is not None, "The distress signal could not be found."
+    return s[0] * 4_000_000 + s[1]
+
+
 if __name__ == "__main__":
-    t0 = time.time()
-    print(
-        f"There are {count_possible_distress_signal_positions_at_y_level(file_name='input.txt', y=2_000_000)} "
-        f"places where the distress signal could be coming from at y=2,000,000. "
-        f"Computing this took {round(time.time() - t0, 2)} seconds."
-    )
-    t1 = time.time()
-    s = find_distress_signal(file_name="input.txt", min_x=0, max_x=4000000, min_y=0, max_y=4000000)
-    if s is not None:
-        freq = s[0] * 4000000 + s[1]
-        print(f"The location of the distress signal is {s} and its tuning frequency is {freq}. ", end="")
-    else:
-        print("The distress signal could not be found. ", end="")
-    print(f"Computing this took {round(time.time() - t1, 2)} seconds.")
+    print(f"There are {part_1()} places where the distress signal could be coming from at y=2,000,000.")
+    print(f"The tuning frequency of the distress signal is {part_2()}.")
@@ -1,10 +1,15 @@
 import dataclasses
 import re
-import time
-from collections import defaultdict
+import sys
 from itertools import combinations, permutations
+from pathlib import Path
 from typing import TypeAlias
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))  # make the shared `lib` package importable
+from lib.cache import cached_by_input  # isort: skip
+from lib.inputs import read_lines  # isort: skip
+from lib.search import breadth_first_search  # isort: skip
+
 Movements: TypeAlias = dict[str, set[str]]  # node => which nodes can you move to from here?
 SolvedMovements: TypeAlias = dict[str, dict[str, int]]  # source => {destination node => moves to get to this node}
 FlowRates: TypeAlias = dict[str, int]  # node => flow rate
@@ -16,32 +21,20 @@ def get_total_steam_released(opened_valves: dict[str, int], flows: FlowRates) ->
     return sum([flows[valve] * time_step for valve, time_step in opened_valves.items()])
 
 
-def dijkstra(moves: Movements) -> SolvedMovements:
-    # compute a map of how long it takes to get from each node to each other node
-    # i didn't realise this until tonight, but running dijkstra from each possible starting point is called
-    # the floyd-warshall algorithm. wikipedia reckons this only works if all edge weights are non-negative.
-    solved_moves: SolvedMovements = defaultdict(dict)
-    all_nodes = set(moves.keys())
-    for source_node in all_nodes:
-        frontier = {source_node}
-        node_distances = {x: None if x != source_node else 0 for x in all_nodes}
-        explored = set()
-        while frontier:
-            node = frontier.pop()
-            neighbours = moves[node]
-            node_distance = node_distances[node]
-            assert node_distance is not None
-            for neighbour in neighbours:
-                neighbour_distance = node_distances[neighbour]
-                if neighbour_distance is None:
-                    node_distances[neighbour] = node_distance + 1
-                else:
-                    node_distances[neighbour] = min(neighbour_distance, node_distance + 1)
-                if neighbour not in explored:
-                    frontier.add(neighbour)
-            explored.add(node)
-        assert None not in node_distances.values()
-        solved_moves[source_node] = node_distances  # type: ignore  # mmm i'm so full from gorging on mypy errors, yum
+def shortest_paths(moves: Movements) -> SolvedMovements:
+    # compute a map of how long it takes to get from each node to each other node. every tunnel takes one minute to
+    # walk through, so the graph is unweighted and one breadth-first search from each node finds its distances to all
+    # the others.
+    nodes = sorted(moves.keys())
+    node_ids = {node: i for i, node in enumerate(nodes)}
+    adjacencies = [[node_ids[x] for x in moves[node]] for node in nodes]
+    solved_moves: SolvedMovements = {}
+    for source_node in nodes:
+        result = breadth_first_search(
+            sources=[node_ids[source_node]], neighbours=adjacencies.__getitem__, num_nodes=len(nodes)
+        )
+        assert all(x is not None for x in map(result.distance, range(len(nodes)))), "some valves are unreachable"
+        solved_moves[source_node] = {node: result.distances[i] for i, node in enumerate(nodes)}
     return solved_moves
 
 
@@ -99,17 +92,22 @@ class State:
 def read_input_file(file_name: str = "input.txt") -> tuple[Movements, FlowRates]:
     moves: Movements = {}
     flows: FlowRates = {}
-    with open(file_name, "r") as f:
-        for line in f.readlines():
-            if stripped_line := line.strip():
-                valve, flow_rate_string, destination_valves = re.match(
-                    r"^Valve (\w{2}) has flow rate=(\d+); tunnel[s]? lead[s]? to valve[s]? (.+?)(?:,|$)$", stripped_line
-                ).groups()  # type: ignore  # technically sloppy but known input data so w/e
-                moves[valve] = {x.strip() for x in destination_valves.split(", ")}
-                flows[valve] = int(flow_rate_string)
+    for line in read_lines(file_name):
+        if stripped_line := line.strip():
+            valve, flow_rate_string, destination_valves = re.match(
+                r"^Valve (\w{2}) has flow rate=(\d+); tunnel[s]? lead[s]? to valve[s]? (.+?)(?:,|$)$", stripped_line
+            ).groups()  # type: ignore  # technically sloppy but known input data so w/e
+            moves[valve] = {x.strip() for x in destination_valves.split(", ")}
+            flows[valve] = int(flow_rate_string)
     return moves, flows
 
 
+@cached_by_input
+def read_and_solve_input_file(file_name: str = "input.txt") -> tuple[SolvedMovements, FlowRates]:
+    movements, flow_rates = read_input_file(file_name)
+    return shortest_paths(movements), flow_rates
+
+
 def maximise_pressure_reduction(
     moves: SolvedMovements, flows: FlowRates, max_time_steps: int = 30, num_agents: int = 1
 ) -> int:
@@ -134,18 +132,19 @@ def maximise_pressure_reduction(
     return state_with_max_steam.total_steam_released
 
 
+def part_1(file_name: str = "input.txt") -> int:
+    solved_movements, flow_rates = read_and_solve_input_file(file_name)
+    return maximise_pressure_reduction(solved_movements, flow_rates, max_time_steps=30, num_agents=1)
+
+
+def part_2(file_name: str = "input.txt") -> int:
+    solved_movements, flow_rates = read_and_solve_input_file(file_name)
+    return maximise_pressure_reduction(solved_movements, flow_rates, max_time_steps=26, num_agents=2)
+
+
 if __name__ == "__main__":
-    movements, flow_rates = read_input_file("input.txt")
-    solved_movements = dijkstra(movements)
-    t0 = time.time()
-    print(
-        f"The maximum amount of steam which can be released by just yourself in 30 minutes is "
-        f"{maximise_pressure_reduction(solved_movements, flow_rates, max_time_steps=30, num_agents=1)} pressure. "
-        f"Computing this took roughly {int(time.time() - t0)} second/s."
-    )
-    t1 = time.time()
+    print(f"The maximum amount of steam which can be released by just yourself in 30 minutes is {part_1()} pressure.")
     print(
         f"The maximum amount of steam which can be released by you and your elephant friend in 26 minutes is "
-        f"{maximise_pressure_reduction(solved_movements, flow_rates, max_time_steps=26, num_agents=2)} pressure. "
-        f"Computing this took roughly {int(time.time() - t1)} second/s."
+        f"{part_2()} pressure."
     )
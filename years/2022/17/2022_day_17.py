@@ -1,10 +1,15 @@
+import sys
+from pathlib import Path
 from typing import TypeAlias
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))  # make the shared `lib` package importable
+from lib.inputs import open_input  # isort: skip
+
 Point: TypeAlias = tuple[int, int]  # x, y
 
 
 def read_input_file(file_name: str = "input.txt") -> list[int]:
-    with open(file_name, "r") as f:
+    with open_input(file_name) as f:
         return list(map(lambda x: {"<": -1, ">": 1}[x], f.read().strip()))
 
 
@@ -130,10 +135,14 @@ def simulate_rocks_falling(
     return floor_height + height_offset_for_all_patterns
 
 
+def part_1(file_name: str = "input.txt") -> int:
+    return simulate_rocks_falling(2022, read_input_file(file_name))
+
+
+def part_2(file_name: str = "input.txt") -> int:
+    return simulate_rocks_falling(1_000_000_000_000, read_input_file(file_name))
+
+
 if __name__ == "__main__":
-    j = read_input_file("input.txt")
-    print(f"After 2022 rocks have fallen, the height of the rock tower is {simulate_rocks_falling(2022, j)}.")
-    print(
-        f"After literally one trillion rocks have fallen, the height of the rock tower is "
-        f"{simulate_rocks_falling(1_000_000_000_000, j)}."
-    )
+    print(f"After 2022 rocks have fallen, the height of the rock tower is {part_1()}.")
+    print(f"After literally one trillion rocks have fallen, the height of the rock tower is {part_2()}.")
@@ -1,11 +1,15 @@
+import sys
+from pathlib import Path
 from typing import TypeAlias
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))  # make the shared `lib` package importable
+from lib.inputs import read_lines  # isort: skip
+
 Point: TypeAlias = tuple[int, int, int]  # x, y, z
 
 
 def read_input_file(file_name: str = "input.txt") -> set[Point]:
-    with open(file_name, "r") as f:
-        return {tuple(map(lambda x: int(x), line.strip().split(","))) for line in f.readlines() if line.strip()}  # type: ignore
+    return {tuple(map(lambda x: int(x), line.strip().split(","))) for line in read_lines(file_name) if line.strip()}  # type: ignore
 
 
 def get_adjacencies(point: Point) -> set[Point]:
@@ -72,7 +76,14 @@ def compute_exterior_surface_area(points: set[Point]) -> int:
     )
 
 
+def part_1(file_name: str = "input.txt") -> int:
+    return compute_total_surface_area(read_input_file(file_name))
+
+
+def part_2(file_name: str = "input.txt") -> int:
+    return compute_exterior_surface_area(read_input_file(file_name))
+
+
 if __name__ == "__main__":
-    p = read_input_file("input.txt")
-    print(f"The total surface area of the lava droplet (including the interior) is {compute_total_surface_area(p)}.")
-    print(f"The total surface area of the lava droplet (excluding the interior) is {compute_exterior_surface_area(p)}.")
+    print(f"The total surface area of the lava droplet (including the interior) is {part_1()}.")
+    print(f"The total surface area of the lava droplet (excluding the interior) is {part_2()}.")
@@ -2,9 +2,15 @@ import dataclasses
 import enum
 import math
 import re
-import time
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from functools import cached_property
-from typing import TypeAlias
+from itertools import repeat
+from pathlib import Path
+from typing import Sequence, TypeAlias
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))  # make the shared `lib` package importable
+from lib.inputs import read_lines  # isort: skip
 
 RobotRecipe: TypeAlias = dict[str, int]  # ingredient => quantity required
 Blueprint: TypeAlias = dict[str, RobotRecipe]  # robot => recipe to make the robot
@@ -18,22 +24,21 @@ class Materials(str, enum.Enum):
 
 
 def read_input_file(file_name: str = "input.txt") -> tuple[Blueprint, ...]:
-    with open(file_name, "r") as f:
-        blueprints: list[Blueprint] = []
-        for line in f.readlines():
-            if stripped_line := line.strip():
-                blueprint: Blueprint = {}
-                # sorry for this disgusting fucking regex 🗿
-                matches = re.findall(
-                    r"Each ([a-zA-Z]+) robot costs (?:(\d+) ([a-zA-Z]+) and )*(?:(\d+) ([a-zA-Z]+)(?: and )?)+\.\s?",
-                    stripped_line,
-                )
-                for match in matches:
-                    blueprint[match[0]] = {
-                        match[i + 1]: int(match[i]) for i in range(1, len(matches), 2) if match[i] and match[i + 1]
-                    }
-                blueprints.append(blueprint)
-        return tuple(blueprints)
+    blueprints: list[Blueprint] = []
+    for line in read_lines(file_name):
+        if stripped_line := line.strip():
+            blueprint: Blueprint = {}
+            # sorry for this disgusting fucking regex 🗿
+            matches = re.findall(
+                r"Each ([a-zA-Z]+) robot costs (?:(\d+) ([a-zA-Z]+) and )*(?:(\d+) ([a-zA-Z]+)(?: and )?)+\.\s?",
+                stripped_line,
+            )
+            for match in matches:
+                blueprint[match[0]] = {
+                    match[i + 1]: int(match[i]) for i in range(1, len(matches), 2) if match[i] and match[i + 1]
+                }
+            blueprints.append(blueprint)
+    return tuple(blueprints)
 
 
 @dataclasses.dataclass
@@ -124,33 +129,37 @@ def simulate_blueprint(blueprint: Blueprint, time_steps: int = 24) -> State:
     return best_state
 
 
-def calculate_quality_level(blueprints: tuple[Blueprint, ...]) -> None:
+def simulate_blueprints(blueprints: Sequence[Blueprint], time_steps: int, workers: int = 1) -> list[State]:
+    # each blueprint is simulated independently of the others, so they can be spread across processes
+    if workers == 1:
+        return [simulate_blueprint(blueprint, time_steps) for blueprint in blueprints]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(simulate_blueprint, blueprints, repeat(time_steps)))
+
+
+def calculate_quality_level(blueprints: tuple[Blueprint, ...], workers: int = 1) -> int:
     quality_level = 0
-    print(f"Commencing evaluation of {len(blueprints)} blueprint{'s' if len(blueprints) != 1 else ''}.\n")
-    for i, blueprint in enumerate(blueprints):
-        print(f"Evaluating blueprint {i+1} for 24 minutes... ", end="", flush=True)
-        t0 = time.time()
-        solution = simulate_blueprint(blueprint, 24)
-        print(f"and done! Score is {solution.objective}, computing that took {round(time.time() - t0, 2)} seconds.")
+    for i, solution in enumerate(simulate_blueprints(blueprints, 24, workers=workers)):
         quality_level += (i + 1) * solution.objective
-    print(f"\nAll blueprints evaluated. Total quality level: {quality_level}.")
+    return quality_level
 
 
-def calculate_multiplied_geodes(blueprints: tuple[Blueprint, ...], num_blueprints: int = 3) -> None:
+def calculate_multiplied_geodes(blueprints: tuple[Blueprint, ...], num_blueprints: int = 3, workers: int = 1) -> int:
     result = 1
-    print(f"\nCommencing evaluation of the first {num_blueprints} blueprint{'s' if num_blueprints != 1 else ''}.\n")
-    for i in range(num_blueprints):
-        print(f"Evaluating blueprint {i + 1} for 32 minutes... ", end="", flush=True)
-        t0 = time.time()
-        solution = simulate_blueprint(blueprints[i], 32)
-        print(f"and done! Score is {solution.objective}, computing that took {round(time.time() - t0, 2)} seconds.")
+    # the example only has two blueprints
+    for solution in simulate_blueprints(blueprints[:num_blueprints], 32, workers=workers):
         result *= solution.objective
-    print(f"\nAll blueprints evaluated. Multiplied number of geodes across blueprints: {result}.")
+    return result
+
+
+def part_1(file_name: str = "input.txt", workers: int = 1) -> int:
+    return calculate_quality_level(read_input_file(file_name), workers=workers)
+
+
+def part_2(file_name: str = "input.txt", workers: int = 1) -> int:
+    return calculate_multiplied_geodes(read_input_file(file_name), workers=workers)
 
 
 if __name__ == "__main__":
-    b = read_input_file("input.txt")
-    t1 = time.time()
-    calculate_quality_level(b)
-    calculate_multiplied_geodes(b)
-    print(f"\nTotal runtime: {round(time.time() - t1, 2)} seconds.")
+    print(f"Total quality level of all blueprints: {part_1()}.")
+    print(f"Multiplied number of geodes across the first 3 blueprints: {part_2()}.")
@@ -1,6 +1,12 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))  # make the shared `lib` package importable
+from lib.inputs import read_lines  # isort: skip
+
+
 def read_input_file(file_name: str = "input.txt") -> list[int]:
-    with open(file_name, "r") as f:
-        return [int(stripped_line) for line in f.readlines() if (stripped_line := line.strip())]
+    return [int(stripped_line) for line in read_lines(file_name) if (stripped_line := line.strip())]
 
 
 def mix(items: list[int], repetitions: int) -> list[int]:
@@ -18,10 +24,14 @@ def find_grove_coordinates_sum(mixed_items: list[int], value_to_find: int = 0) -
     return sum([mixed_items[(start_index + i - 1) % len(mixed_items) + 1] for i in range(1000, 4000, 1000)])
 
 
+def part_1(file_name: str = "input.txt") -> int:
+    return find_grove_coordinates_sum(mix(read_input_file(file_name), 1))
+
+
+def part_2(file_name: str = "input.txt") -> int:
+    return find_grove_coordinates_sum(mix([number * 811589153 for number in read_input_file(file_name)], 10))
+
+
 if __name__ == "__main__":
-    encrypted = read_input_file("input.txt")
-    print(f"The sum of the grove coordinates after mixing once is {find_grove_coordinates_sum(mix(encrypted, 1))}.")
-    print(
-        f"The sum of the grove coordinates after applying the decryption key then mixing ten times is "
-        f"{find_grove_coordinates_sum(mix([number * 811589153 for number in encrypted], 10))}."
-    )
+    print(f"The sum of the grove coordinates after mixing once is {part_1()}.")
+    print(f"The sum of the grove coordinates after applying the decryption key then mixing ten times is {part_2()}.")
@@ -1,85 +1,72 @@
 import operator
 import re
-from typing import Callable, TypeAlias
+import sys
+from pathlib import Path
+from typing import TypeAlias
 
-Operator: TypeAlias = Callable[[int, int], int]
+sys.path.append(str(Path(__file__).resolve().parents[1]))  # make the shared `lib` package importable
+from lib.cache import cached_by_input  # isort: skip
+from lib.expressions import OPERATORS, Operator  # isort: skip
+from lib.inputs import read_lines  # isort: skip
+
+Job: TypeAlias = int | tuple[Operator, str, str]  # a number to yell, or an operation on two other monkeys' numbers
 
-OPS: dict[str, Operator] = {"+": operator.add, "-": operator.sub, "*": operator.mul, "/": operator.floordiv}
-REVERSED_OPS = {value: key for key, value in OPS.items()}
 HUMN = "humn"
 ROOT = "root"
 
 
+@cached_by_input
 def read_input_file(file_name: str = "input.txt") -> dict[str, str]:
-    with open(file_name, "r") as f:
-        parsed_input = {}
-        for line in f.readlines():
-            if stripped_line := line.strip():
-                lhs, rhs = stripped_line.split(": ")
-                parsed_input[lhs] = rhs
-        return parsed_input
+    parsed_input = {}
+    for line in read_lines(file_name):
+        if stripped_line := line.strip():
+            lhs, rhs = stripped_line.split(": ")
+            parsed_input[lhs] = rhs
+    return parsed_input
 
 
-def parse_monkey_line(line: str) -> str | tuple[Operator, str, str]:
+def parse_monkey_line(line: str) -> Job:
     if line.isdigit():
-        return line
+        return int(line)
     else:
         match = re.match(r"^([a-zA-Z]{4}) ([\+\-\*\/]) ([a-zA-Z]{4})$", line)
         assert match is not None and len(match.groups()) == 3
-        return OPS[str(match.groups()[1])], str(match.groups()[0]), str(match.groups()[2])
-
-
-def resolve_monkeys(monkeys: dict[str, str], monkey_to_resolve: str = ROOT) -> tuple[int, list[str]]:
-    assert monkey_to_resolve in monkeys
-    equation, frontier, explored = monkey_to_resolve, [monkey_to_resolve], []
-    while frontier:
-        node = frontier.pop()
-        if node in monkeys:
-            equation = equation.replace(node, f"({monkeys[node]})")
-            parsed = parse_monkey_line(monkeys[node])
-            if isinstance(parsed, tuple):
-                _, monkey_1, monkey_2 = parsed
-                frontier += [monkey_1, monkey_2]
-                explored += [monkey_1, monkey_2]
-    return int(eval(equation)), explored
-
-
-def get_mappings(monkeys: dict[str, str]) -> tuple[dict[str, tuple[str, str]], dict[str, str]]:
-    parent_to_children_mapping: dict[str, tuple[str, str]] = {}
-    child_to_parent_mapping: dict[str, str] = {}
-    for key, val in monkeys.items():
-        parsed = parse_monkey_line(val)
-        if isinstance(parsed, tuple):
-            parent_to_children_mapping[key] = (parsed[1], parsed[2])
-            child_to_parent_mapping[parsed[1]] = key
-            child_to_parent_mapping[parsed[2]] = key
-    return parent_to_children_mapping, child_to_parent_mapping
-
-
-def compress_monkey_tree(monkeys: dict[str, str]) -> dict[str, str]:
-    # compress the tree by identifying any nodes where all nodes below it can be resolved,
-    # then remove them from the tree and set the node's value to the value of that resolution.
-    # this is critical to the implementation of part 2 which involves walking up the tree.
-    mutated_monkeys = {**monkeys}
-    frontier = [ROOT]
-    while frontier:
-        node = frontier.pop()
-        if node in mutated_monkeys and not monkeys[node].isdigit():
-            try:
-                value, explored_nodes = resolve_monkeys(mutated_monkeys, monkey_to_resolve=node)
-                # this node and all nodes below it can be collapsed into a single digit
-                mutated_monkeys[node] = str(value)
-                for explored_node in explored_nodes:
-                    mutated_monkeys.pop(explored_node)
-            except NameError:
-                # this node cannot be collapsed. attempt to collapse its children individually.
-                parsed = parse_monkey_line(mutated_monkeys[node])
-                assert isinstance(parsed, tuple)
-                frontier += [parsed[1], parsed[2]]
-    return mutated_monkeys
-
-
-def rearrange_for_first_operand(op: Operator, lhs: str, second_operand: str) -> tuple[Operator, str, str]:
+        return OPERATORS[str(match.groups()[1])], str(match.groups()[0]), str(match.groups()[2])
+
+
+def parse_monkeys(monkeys: dict[str, str]) -> dict[str, Job]:
+    return {monkey: parse_monkey_line(line) for monkey, line in monkeys.items()}
+
+
+def resolve_monkeys(jobs: dict[str, Job], monkey_to_resolve: str = ROOT) -> dict[str, int]:
+    # work out the number yelled by `monkey_to_resolve` and every monkey below it, depth first with an explicit stack.
+    # any monkey which depends on a monkey missing from `jobs` (i.e. `humn` in part 2) is left out of the result.
+    values: dict[str, int] = {}
+    unresolvable: set[str] = set()
+    stack = [monkey_to_resolve]
+    while stack:
+        monkey = stack[-1]
+        if monkey in values or monkey in unresolvable:
+            stack.pop()
+        elif (job := jobs.get(monkey)) is None:
+            unresolvable.add(monkey)
+            stack.pop()
+        elif isinstance(job, int):
+            values[monkey] = job
+            stack.pop()
+        elif pending := [x for x in job[1:] if x not in values and x not in unresolvable]:
+            stack += pending  # resolve the operands first, then come back to this monkey
+        else:
+            stack.pop()
+            op, monkey_1, monkey_2 = job
+            if monkey_1 in unresolvable or monkey_2 in unresolvable:
+                unresolvable.add(monkey)
+            else:
+                values[monkey] = op(values[monkey_1], values[monkey_2])
+    return values
+
+
+def rearrange_for_first_operand(op: Operator, lhs: int, second_operand: int) -> tuple[Operator, int, int]:
     return {
         operator.add: (operator.sub, lhs, second_operand),
         operator.sub: (operator.add, lhs, second_operand),
@@ -88,7 +75,7 @@ def rearrange_for_first_operand(op: Operator, lhs: str, second_operand: str) ->
     }[op]
 
 
-def rearrange_for_second_operand(op: Operator, lhs: str, first_operand: str) -> tuple[Operator, str, str]:
+def rearrange_for_second_operand(op: Operator, lhs: int, first_operand: int) -> tuple[Operator, int, int]:
     return {
         operator.add: (operator.sub, lhs, first_operand),
         operator.sub: (operator.sub, first_operand, lhs),
@@ -97,56 +84,39 @@ def rearrange_for_second_operand(op: Operator, lhs: str, first_operand: str) ->
     }[op]
 
 
-def determine_what_number_to_yell(monkeys: dict[str, str]) -> int:
-    mutated_monkeys = compress_monkey_tree({k: v for k, v in monkeys.items() if k != HUMN})
-    parent_to_children_mapping, child_to_parent_mapping = get_mappings(mutated_monkeys)
-
-    def invert_line(monkey: str) -> tuple[str, set[str]]:
-        parsed = parse_monkey_line(mutated_monkeys[child_to_parent_mapping[monkey]])
-        assert isinstance(parsed, tuple)
-        op, monkey_1, monkey_2 = parsed
-        inverted_op, inverted_monkey_1, inverted_monkey_2 = (
-            rearrange_for_first_operand(op, lhs=child_to_parent_mapping[monkey], second_operand=monkey_2)
-            if monkey_1 == monkey
-            else rearrange_for_second_operand(op, lhs=child_to_parent_mapping[monkey], first_operand=monkey_1)
-        )
-        variables = {inverted_monkey_1, inverted_monkey_2}
-        return f"({inverted_monkey_1} {REVERSED_OPS[inverted_op]} {inverted_monkey_2})", variables
-
-    # identify the nodes in the tree which are equal according to the `root` monkey's rules in part 2
-    root_children = parent_to_children_mapping[ROOT]
-    assert mutated_monkeys[root_children[0]].isdigit() or mutated_monkeys[root_children[1]].isdigit()
-    left, right = (
-        (root_children[1], root_children[0])
-        if mutated_monkeys[root_children[0]].isdigit()
-        else (root_children[0], root_children[1])
-    )
-
-    # starting from `humn`, walk up the tree and progressively compose an equation with LHS of `humn`
-    composed_equation, frontier = invert_line(HUMN)
-    while frontier:
-        variable_to_walk = frontier.pop()
-        if variable_to_walk == left:
-            composed_equation = composed_equation.replace(variable_to_walk, mutated_monkeys[right])
-        elif mutated_monkeys[variable_to_walk].isdigit():
-            composed_equation = composed_equation.replace(variable_to_walk, mutated_monkeys[variable_to_walk])
+def determine_what_number_to_yell(jobs: dict[str, Job]) -> int:
+    # resolve everything which doesn't depend on `humn`. exactly one side of the `root` monkey's equality check will
+    # be left unresolved - walk down from `root` towards `humn`, inverting each operation along the way to work out
+    # what number the unresolved operand has to be for the equality check to pass.
+    jobs = {k: v for k, v in jobs.items() if k != HUMN}
+    values = resolve_monkeys(jobs)
+    root_job = jobs[ROOT]
+    assert isinstance(root_job, tuple)
+    _, left, right = root_job
+    assert (left in values) != (right in values), "exactly one side of the equality check should depend on `humn`"
+    unknown, target = (left, values[right]) if right in values else (right, values[left])
+    while unknown != HUMN:
+        job = jobs[unknown]
+        assert isinstance(job, tuple)
+        op, monkey_1, monkey_2 = job
+        if monkey_1 not in values:
+            inverted_op, operand_1, operand_2 = rearrange_for_first_operand(op, target, values[monkey_2])
+            unknown = monkey_1
         else:
-            equation_section, new_variables = invert_line(variable_to_walk)
-            composed_equation = composed_equation.replace(variable_to_walk, equation_section)
-            frontier |= new_variables
+            inverted_op, operand_1, operand_2 = rearrange_for_second_operand(op, target, values[monkey_1])
+            unknown = monkey_2
+        target = inverted_op(operand_1, operand_2)
+    return target
+
+
+def part_1(file_name: str = "input.txt") -> int:
+    return resolve_monkeys(parse_monkeys(read_input_file(file_name)), monkey_to_resolve=ROOT)[ROOT]
 
-    # substitute in known monkey numbers. the completion of this step should result in a valid equation.
-    for key, value in mutated_monkeys.items():
-        if value.isdigit():
-            composed_equation = composed_equation.replace(key, value)
 
-    return round(eval(composed_equation))
+def part_2(file_name: str = "input.txt") -> int:
+    return determine_what_number_to_yell(parse_monkeys(read_input_file(file_name)))
 
 
 if __name__ == "__main__":
-    m = read_input_file("input.txt")
-    number_that_root_yells, _ = resolve_monkeys(m, monkey_to_resolve=ROOT)
-    print(f"The monkey named `{ROOT}` will yell the number {number_that_root_yells}.")
-    print(
-        f"You must yell the number {determine_what_number_to_yell(m)} to satisfy the `{ROOT}` monkey's equality check."
-    )
+    print(f"The monkey named `{ROOT}` will yell the number {part_1()}.")
+    print(f"You must yell the number {part_2()} to satisfy the `{ROOT}` monkey's equality check.")
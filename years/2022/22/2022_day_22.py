@@ -1,13 +1,22 @@
 import re
+import sys
+from pathlib import Path
 from typing import Callable, TypeAlias
 
-Point: TypeAlias = tuple[int, int]  # x, y
-Map: TypeAlias = dict[Point, bool]  # point => is this point traversable (i.e. not a wall)?
+sys.path.append(str(Path(__file__).resolve().parents[1]))  # make the shared `lib` package importable
+from lib.grid import Grid, Point  # isort: skip
+from lib.inputs import read_records  # isort: skip
+
+Map: TypeAlias = Grid  # point => is this point outside the map, traversable, or a wall?
 Commands: TypeAlias = list[str | int]  # str for direction to turn in, int for number of tiles to move
 EdgeAdjacencies: TypeAlias = dict[tuple[Point, int], tuple[Point, int]]  # (point, direction) => (point, direction)
 
 DIRECTIONS: list[Point] = [(1, 0), (0, 1), (-1, 0), (0, -1)]  # east, south, west, north. top-left is (0, 0).
 
+VOID = 0
+OPEN = 1
+WALL = 2
+
 
 def add_points(point_a: Point, point_b: Point) -> Point:
     return point_a[0] + point_b[0], point_a[1] + point_b[1]
@@ -18,17 +27,9 @@ def move_in_direction(point: Point, direction: int) -> Point:
 
 
 def read_input_file(file_name: str = "input.txt") -> tuple[Map, Commands]:
-    with open(file_name, "r") as f:
-        map_text, commands_text = f.read().split("\n\n")
-        commands = [int(x) if x.strip().isdigit() else x for x in re.split(r"([LR])", commands_text) if x.strip()]
-        map_: Map = {}
-        for y, line in enumerate(map_text.splitlines()):
-            for x, character in enumerate(line):
-                if character.strip() in [".", "#"]:
-                    map_[(x, y)] = character.strip() == "."
-                elif character != " ":
-                    raise Exception
-        return map_, commands
+    map_lines, (commands_text,) = read_records(file_name)
+    commands = [int(x) if x.strip().isdigit() else x for x in re.split(r"([LR])", commands_text) if x.strip()]
+    return Grid.from_lines(map_lines, {" ": VOID, ".": OPEN, "#": WALL}, pad_ragged_rows=True), commands
 
 
 def get_edge_adjacencies() -> EdgeAdjacencies:
@@ -53,10 +54,10 @@ def wrap_around_flat_map(map_: Map, position: Point, direction: int) -> tuple[Po
     temporary_position = position
     while True:
         new_temporary_position = move_in_direction(temporary_position, temporary_direction)
-        if map_.get(new_temporary_position, None) is None:
+        if map_.get(*new_temporary_position) == VOID:
             break
         temporary_position = new_temporary_position
-    if map_.get(temporary_position, False) is True:
+    if map_.get(*temporary_position) == OPEN:
         return temporary_position, direction
     return position, direction  # the wrapped-around position is not traversable
 
@@ -64,7 +65,7 @@ def wrap_around_flat_map(map_: Map, position: Point, direction: int) -> tuple[Po
 def wrap_around_cube_map(map_: Map, position: Point, direction: int) -> tuple[Point, int]:
     adjacencies = get_edge_adjacencies()
     assert (position, direction) in adjacencies.keys(), "edge adjacency map is incomplete"
-    if map_.get(adjacencies[(position, direction)][0], False) is True:
+    if map_.get(*adjacencies[(position, direction)][0]) == OPEN:
         return adjacencies[(position, direction)]
     return position, direction  # the wrapped-around position is not traversable
 
@@ -72,7 +73,7 @@ def wrap_around_cube_map(map_: Map, position: Point, direction: int) -> tuple[Po
 def traverse(
     map_: Map, commands: Commands, wrap_around_callable: Callable[[Map, Point, int], tuple[Point, int]]
 ) -> int:
-    position = min([x for x in map_.keys() if x[1] == 0])  # leftmost tile in top row
+    position = map_.point(map_.cells.index(OPEN))  # leftmost tile in top row
     direction = 0  # east
     for counter, command in enumerate(commands):
         if isinstance(command, str):
@@ -82,17 +83,25 @@ def traverse(
             # move
             for _ in range(command):
                 new_position = move_in_direction(position, direction)
-                match map_.get(new_position, None):
-                    case True:  # new position is within map and is traversable
-                        position = new_position
-                    case False:  # new position is within map and is not traversable
-                        break
-                    case None:  # new position is outside map
-                        position, direction = wrap_around_callable(map_, position, direction)
+                tile = map_.get(*new_position)
+                if tile == OPEN:  # new position is within map and is traversable
+                    position = new_position
+                elif tile == WALL:  # new position is within map and is not traversable
+                    break
+                else:  # new position is outside map
+                    position, direction = wrap_around_callable(map_, position, direction)
     return 1000 * (position[1] + 1) + 4 * (position[0] + 1) + direction
 
 
+def part_1(file_name: str = "input.txt") -> int:
+    return traverse(*read_input_file(file_name), wrap_around_flat_map)
+
+
+def part_2(file_name: str = "input.txt") -> int:
+    # the cube's edges are hardcoded for my input so this won't work on the example
+    return traverse(*read_input_file(file_name), wrap_around_cube_map)
+
+
 if __name__ == "__main__":
-    m, c = read_input_file("input.txt")
-    print(f"The final password when the map is flat is {traverse(m, c, wrap_around_flat_map)}.")
-    print(f"The final password when the map is a cube is {traverse(m, c, wrap_around_cube_map)}.")
+    print(f"The final password when the map is flat is {part_1()}.")
+    print(f"The final password when the map is a cube is {part_2()}.")
@@ -1,52 +1,51 @@
-import time
+import sys
 from collections import defaultdict
-from typing import TypeAlias
+from pathlib import Path
 
-Point: TypeAlias = tuple[int, int]  # x, y. top-left is 0, 0.
+sys.path.append(str(Path(__file__).resolve().parents[1]))  # make the shared `lib` package importable
+from lib.grid import Grid, Point  # isort: skip
+from lib.inputs import read_lines  # isort: skip
 
 
 def read_input_file(file_name: str = "input.txt") -> set[Point]:
-    with open(file_name, "r") as f:
-        return {(x, y) for y, line in enumerate(f.readlines()) for x, ch in enumerate(line.strip()) if ch == "#"}
-
-
-def add_points(point_a: Point, point_b: Point) -> Point:
-    return point_a[0] + point_b[0], point_a[1] + point_b[1]
-
-
-def get_all_neighbours_for_point(point: Point) -> set[Point]:
-    return {  # hard-coding these is actually much faster than iterating over the 3x3 area and excluding `point`
-        (point[0] - 1, point[1] + 1),
-        (point[0], point[1] + 1),
-        (point[0] + 1, point[1] + 1),
-        (point[0] - 1, point[1]),
-        (point[0] + 1, point[1]),
-        (point[0] - 1, point[1] - 1),
-        (point[0], point[1] - 1),
-        (point[0] + 1, point[1] - 1),
-    }
+    return {(x, y) for y, line in enumerate(read_lines(file_name)) for x, ch in enumerate(line.strip()) if ch == "#"}
 
 
 def simulate_elf_movements(elves: set[Point], num_rounds: int | None) -> tuple[int, set[Point]]:
-    mutated_elves = {*elves}
-    deltas = [(0, -1), (0, 1), (-1, 0), (1, 0)]  # north, south, west, east
+    mutated_elves = list(elves)
+    occupied = Grid.from_points(mutated_elves)  # (x, y) => is there an elf here?
     proposed_direction: int = 0
     n: int = 0
     while True:
+        # make sure there's at least one empty cell around every elf so we can check neighbours without bounds checks.
+        # leave plenty of room while we're at it so the grid only needs to be reallocated every so often.
+        all_x, all_y = [x for x, _ in mutated_elves], [y for _, y in mutated_elves]
+        min_x, max_x, min_y, max_y = min(all_x), max(all_x), min(all_y), max(all_y)
+        if min_x <= occupied.min_x or min_y <= occupied.min_y or max_x >= occupied.max_x or max_y >= occupied.max_y:
+            occupied.grow_to_include(min_x - 16, min_y - 16, max_x + 16, max_y + 16)
+        cells, w = occupied.cells, occupied.width
+
         # first half of the round - elves propose where to move
-        proposals: dict[Point, list[Point]] = defaultdict(list)  # point => the elves proposing to move to that point
-        for elf in mutated_elves:
+        proposals: dict[int, list[int]] = defaultdict(list)  # cell index => the elves proposing to move to that cell
+        for elf_number, (x, y) in enumerate(mutated_elves):
+            i = occupied.index(x, y)
+            north_west, north, north_east = cells[i - w - 1], cells[i - w], cells[i - w + 1]
+            west, east = cells[i - 1], cells[i + 1]
+            south_west, south, south_east = cells[i + w - 1], cells[i + w], cells[i + w + 1]
             # if none of the neighbours of this elf are occupied, do not move the elf
-            if not (get_all_neighbours_for_point(elf) & mutated_elves):
+            if not (north_west or north or north_east or west or east or south_west or south or south_east):
                 continue
-            for delta_index in range(len(deltas)):
-                delta = deltas[(delta_index + proposed_direction) % len(deltas)]
-                elf_plus_delta = add_points(elf, delta)
-                man = [i for i, x in enumerate(delta) if x != 0].pop()
-                neighbours = {x for x in get_all_neighbours_for_point(elf) if elf_plus_delta[man] == x[man]}
-                if not (mutated_elves & neighbours):
+            directions = [  # north, south, west, east - is each direction free, and which cell would the elf move into?
+                (not (north_west or north or north_east), i - w),
+                (not (south_west or south or south_east), i + w),
+                (not (north_west or west or south_west), i - 1),
+                (not (north_east or east or south_east), i + 1),
+            ]
+            for delta_index in range(len(directions)):
+                direction_is_free, proposed_position = directions[(delta_index + proposed_direction) % len(directions)]
+                if direction_is_free:
                     # no elves occupy this space - propose moving here
-                    proposals[elf_plus_delta].append(elf)
+                    proposals[proposed_position].append(elf_number)
                     break
 
         # second half of the round - elves move according to their proposals if nobody else proposed the same thing
@@ -55,15 +54,16 @@ def simulate_elf_movements(elves: set[Point], num_rounds: int | None) -> tuple[i
         for proposed_position, elves_proposing_position in proposals.items():
             if len(elves_proposing_position) == 1:
                 elf_proposing_direction = elves_proposing_position.pop()
-                mutated_elves.remove(elf_proposing_direction)
-                mutated_elves.add(proposed_position)
+                cells[occupied.index(*mutated_elves[elf_proposing_direction])] = 0
+                cells[proposed_position] = 1
+                mutated_elves[elf_proposing_direction] = occupied.point(proposed_position)
 
         # end of round bookkeeping
         proposed_direction += 1
         n += 1
         if num_rounds is not None and n >= num_rounds:
             break
-    return n, mutated_elves
+    return n, set(mutated_elves)
 
 
 def calculate_empty_ground_tiles(elves: set[Point]) -> int:
@@ -72,12 +72,14 @@ def calculate_empty_ground_tiles(elves: set[Point]) -> int:
     return len({(x, y) for x in range(min_x, max_x + 1) for y in range(min_y, max_y + 1) if (x, y) not in elves})
 
 
+def part_1(file_name: str = "input.txt") -> int:
+    return calculate_empty_ground_tiles(simulate_elf_movements(read_input_file(file_name), num_rounds=10)[1])
+
+
+def part_2(file_name: str = "input.txt") -> int:
+    return simulate_elf_movements(read_input_file(file_name), num_rounds=None)[0] + 1
+
+
 if __name__ == "__main__":
-    e = read_input_file("input.txt")
-    t0 = time.time()
-    print(
-        "The number of empty ground tiles in the bounding rectangle after 10 rounds of Elf movements is "
-        f"{calculate_empty_ground_tiles(simulate_elf_movements(e, num_rounds=10)[1])}."
-    )
-    print(f"The first round where no Elves move is round {simulate_elf_movements(e, num_rounds=None)[0]+1}.")
-    print(f"Both simulations took {round(time.time() - t0, 2)} seconds to run (in total).")
+    print(f"The number of empty ground tiles in the bounding rectangle after 10 rounds of Elf movements is {part_1()}.")
+    print(f"The first round where no Elves move is round {part_2()}.")
@@ -1,9 +1,12 @@
-import dataclasses
-import heapq
-import time
-from typing import Any, TypeAlias
+import sys
+from pathlib import Path
+from typing import TypeAlias
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))  # make the shared `lib` package importable
+from lib import search  # isort: skip
+from lib.grid import Grid, Point  # isort: skip
+from lib.inputs import read_lines  # isort: skip
 
-Point: TypeAlias = tuple[int, int]  # x, y. top-left is 0, 0.
 Blizzard: TypeAlias = tuple[Point, int]  # starting position, direction (0, 1, 2, 3 => north, east, south west)
 
 
@@ -13,27 +16,26 @@ DELTAS = ((0, -1), (1, 0), (0, 1), (-1, 0))  # north, east, south, west
 def read_input_file(
     file_name: str = "input.txt",
 ) -> tuple[Point, Point, set[Blizzard], int, int]:  # start, end, blizzards, width, height
-    with open(file_name, "r") as f:
-        start: Point | None = None
-        end: Point | None = None
-        blizzards: set[Blizzard] = set()
-        for y, line in enumerate(f.readlines()):
-            if stripped_line := line.strip():
-                if (len(stripped_line) - 1) == stripped_line.count("#"):
-                    if y == 0:
-                        assert start is None
-                        start = (stripped_line.index("."), y)
-                    else:
-                        assert end is None
-                        end = (stripped_line.index("."), y)
+    start: Point | None = None
+    end: Point | None = None
+    blizzards: set[Blizzard] = set()
+    for y, line in enumerate(read_lines(file_name)):
+        if stripped_line := line.strip():
+            if (len(stripped_line) - 1) == stripped_line.count("#"):
+                if y == 0:
+                    assert start is None
+                    start = (stripped_line.index("."), y)
                 else:
-                    blizzards |= {
-                        ((x, y), {"^": 0, ">": 1, "v": 2, "<": 3}[ch])
-                        for x, ch in enumerate(stripped_line)
-                        if ch in ["^", ">", "v", "<"]
-                    }
-        assert start is not None and end is not None
-        return start, end, blizzards, len(stripped_line), y + 1
+                    assert end is None
+                    end = (stripped_line.index("."), y)
+            else:
+                blizzards |= {
+                    ((x, y), {"^": 0, ">": 1, "v": 2, "<": 3}[ch])
+                    for x, ch in enumerate(stripped_line)
+                    if ch in ["^", ">", "v", "<"]
+                }
+    assert start is not None and end is not None
+    return start, end, blizzards, len(stripped_line), y + 1
 
 
 def heuristic(source: Point, target: Point) -> int:
@@ -49,26 +51,13 @@ def apply_magnitude_to_point(point: Point, magnitude: int) -> Point:
     return point[0] * magnitude, point[1] * magnitude
 
 
-@dataclasses.dataclass(frozen=True)
-class State:
-    h: int = dataclasses.field()  # cached heuristic
-    point: Point = dataclasses.field()
-    time: int = dataclasses.field()
-
-    # defining these for heapq usage
-    def __eq__(self, other: Any) -> bool:
-        return isinstance(other, State) and self.h == other.h and self.time == other.time
-
-    def __lt__(self, other: Any) -> bool:
-        return isinstance(other, State) and self.time < other.time
-
-
 def a_star_search(
     start: Point, target: Point, blizzards: set[Blizzard], width: int, height: int, start_time: int = 0
-) -> list[State]:
+) -> int | None:  # the time at which `target` is reached, or None if it can't be reached
     # TODO: could reuse `computed_blizzard_movements` between `a_star_search` calls. don't really feel like it atm tho.
-    computed_blizzard_movements: dict[int, set[Point]] = {}  # where the blizzard will be at some time
-    previous_points: dict[State, State] = {}
+    computed_blizzard_movements: dict[int, Grid] = {}  # where the blizzard will be at some time
+    area = width * height  # each node in the search is a (time, point) pair, encoded as `time * area + point index`
+    start_index, target_index = start[1] * width + start[0], target[1] * width + target[0]
 
     def is_point_within_map(point: Point) -> bool:
         return (0 < point[0] < (width - 1) and 0 < point[1] < (height - 1)) or point in [start, target]
@@ -79,57 +68,55 @@ def a_star_search(
         clamped_point = ((new_point[0] - 1) % (width - 2) + 1), ((new_point[1] - 1) % (height - 2) + 1)
         return clamped_point
 
-    def possible_moves(state: State) -> list[State]:
-        new_time = state.time + 1
+    def possible_moves(node: int) -> list[tuple[int, int]]:
+        time, index = divmod(node, area)
+        new_time = time + 1
         if (blizzard_positions_at_time := computed_blizzard_movements.get(new_time, None)) is None:
             # blizzards have not yet been computed for this time step - compute and store them
-            blizzard_positions_at_time = {
-                move_blizzard(point=blizzard_point, direction=blizzard_direction, time_steps=new_time)
-                for (blizzard_point, blizzard_direction) in blizzards
-            }
+            blizzard_positions_at_time = Grid(width=width, height=height)
+            for blizzard_point, blizzard_direction in blizzards:
+                blizzard_point = move_blizzard(point=blizzard_point, direction=blizzard_direction, time_steps=new_time)
+                blizzard_positions_at_time.cells[blizzard_positions_at_time.index(*blizzard_point)] = 1
             computed_blizzard_movements[new_time] = blizzard_positions_at_time
 
+        point = (index % width, index // width)
         return [
-            State(point=p, time=new_time, h=heuristic(p, target))
-            for p in [*[add_points(state.point, delta) for delta in DELTAS], state.point]
-            if is_point_within_map(p) and p not in blizzard_positions_at_time
+            (new_time * area + p[1] * width + p[0], 1)
+            for p in [*[add_points(point, delta) for delta in DELTAS], point]
+            if is_point_within_map(p) and not blizzard_positions_at_time.cells[p[1] * width + p[0]]
         ]
 
-    def reconstruct_path(point: State) -> list[State]:
-        if point in previous_points.keys():
-            return [point] + reconstruct_path(previous_points[point])
-        return [point]
-
-    frontier: list[State] = []
-    start_state = State(point=start, h=heuristic(start, target), time=start_time)
-    heapq.heappush(frontier, start_state)
-    g_score: dict[State, int] = {start_state: 0}
-    while True:
-        if not frontier:
-            return []  # infeasible
-        current_state = heapq.heappop(frontier)
-        if current_state.point == target:
-            return reconstruct_path(current_state)
-        moves = possible_moves(current_state)
-        for move in moves:
-            tentative_score = g_score.get(current_state, 1_000_000) + (move.time - current_state.time)
-            if tentative_score < g_score.get(move, 1_000_000):
-                previous_points[move] = current_state
-                g_score[move] = tentative_score
-                heapq.heappush(frontier, move)
+    def estimate_time_to_target(node: int) -> int:
+        index = node % area
+        return heuristic((index % width, index // width), target)
 
+    result = search.a_star_search(
+        sources=[start_time * area + start_index],
+        neighbours=possible_moves,
+        heuristic=estimate_time_to_target,
+        targets=lambda node: node % area == target_index,
+    )
+    return None if result.target is None else result.target // area
 
-if __name__ == "__main__":
-    t0 = time.time()
-    s, e, b, w, h = read_input_file("input.txt")
+
+def part_1(file_name: str = "input.txt") -> int:
+    s, e, b, w, h = read_input_file(file_name)
     leg_1 = a_star_search(start=s, target=e, blizzards=b, width=w, height=h)
-    if leg_1:
-        print(f"Fastest time to reach the goal: {leg_1[0].time} mins.")
-        leg_2 = a_star_search(start=e, target=s, blizzards=b, width=w, height=h, start_time=leg_1[0].time)
-        assert len(leg_2) > 0
-        leg_3 = a_star_search(start=s, target=e, blizzards=b, width=w, height=h, start_time=leg_2[0].time)
-        assert len(leg_3) > 0
-        print(f"Fastest time to reach the goal, then go back to the start and to the goal again: {leg_3[0].time} mins.")
-    else:
-        print("Problem is infeasible.")
-    print(f"Solve completed in {round(time.time() - t0, 2)} seconds.")
+    assert leg_1 is not None, "Problem is infeasible."
+    return leg_1
+
+
+def part_2(file_name: str = "input.txt") -> int:
+    s, e, b, w, h = read_input_file(file_name)
+    leg_1 = a_star_search(start=s, target=e, blizzards=b, width=w, height=h)
+    assert leg_1 is not None, "Problem is infeasible."
+    leg_2 = a_star_search(start=e, target=s, blizzards=b, width=w, height=h, start_time=leg_1)
+    assert leg_2 is not None
+    leg_3 = a_star_search(start=s, target=e, blizzards=b, width=w, height=h, start_time=leg_2)
+    assert leg_3 is not None
+    return leg_3
+
+
+if __name__ == "__main__":
+    print(f"Fastest time to reach the goal: {part_1()} mins.")
+    print(f"Fastest time to reach the goal, then go back to the start and to the goal again: {part_2()} mins.")
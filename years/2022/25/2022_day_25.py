@@ -1,3 +1,9 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))  # make the shared `lib` package importable
+from lib.inputs import read_lines  # isort: skip
+
 SNAFU_POWER = 5
 SNAFU_TO_DECIMAL = {"1": 1, "2": 2, "0": 0, "-": -1, "=": -2}
 
@@ -26,10 +32,12 @@ def decimal_to_snafu(decimal: int) -> str:
 
 
 def read_input_file(file_name: str = "input.txt") -> list[str]:
-    with open(file_name, "r") as f:
-        return [x.strip() for x in f.readlines() if x.strip()]
+    return [x.strip() for x in read_lines(file_name) if x.strip()]
+
+
+def part_1(file_name: str = "input.txt") -> str:
+    return decimal_to_snafu(sum([snafu_to_decimal(s) for s in read_input_file(file_name)]))
 
 
 if __name__ == "__main__":
-    s = decimal_to_snafu(sum([snafu_to_decimal(s) for s in read_input_file("input.txt")]))
-    print(f"The SNAFU number you need to supply to Bob's console is {s}.")
+    print(f"The SNAFU number you need to supply to Bob's console is {part_1()}.")
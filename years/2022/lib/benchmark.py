@@ -0,0 +1,203 @@
+import argparse
+import dataclasses
+import json
+import statistics
+import sys
+from pathlib import Path
+from typing import Any, Iterable, TypeAlias, cast
+
+from lib.generators import get_generated_file_name, write_generated_input
+from lib.runner import (
+    DAYS,
+    INPUT_FILE_NAME,
+    PARTS,
+    get_day_directory,
+    get_part,
+    load_day,
+    parse_days,
+    time_part,
+)
+
+BASELINE_FILE_NAME = str(Path(__file__).resolve().parents[1] / "benchmark_baseline.json")
+DEFAULT_ROUNDS = 5
+DEFAULT_THRESHOLD = 0.25  # fail if a part's median gets more than 25% slower than the baseline
+DEFAULT_NOISE_FLOOR = 0.005  # seconds - parts faster than this are too noisy to compare meaningfully
+GENERATED_SEED = 0  # generated inputs always use the same seed so their timings are comparable between runs
+
+# some parts need different parameters to produce sensible answers for the examples
+EXAMPLE_KWARGS: dict[tuple[int, int], dict[str, Any]] = {  # (day, part) => kwargs
+    (15, 1): {"y": 10},
+    (15, 2): {"max_coordinate": 20},
+}
+# and some parts just can't be run against the examples at all
+SKIPPED_EXAMPLES: set[tuple[int, int]] = {
+    (22, 2),  # the cube's edges are hardcoded for my input
+}
+
+
+@dataclasses.dataclass(frozen=True)
+class BenchmarkCase:
+    day: int
+    part: int
+    file_name: str  # relative to the day's directory
+    kwargs: dict[str, Any] = dataclasses.field(default_factory=dict)
+
+    @property
+    def key(self) -> str:
+        return f"day_{self.day}/part_{self.part}/{self.file_name}"
+
+
+@dataclasses.dataclass(frozen=True)
+class BenchmarkResult:
+    case: BenchmarkCase
+    samples: list[float]  # seconds per round
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def p95(self) -> float:
+        if len(self.samples) < 2:
+            return self.samples[0]
+        return statistics.quantiles(self.samples, n=20, method="inclusive")[-1]
+
+    def to_json(self) -> dict[str, float | int]:
+        return {"median": self.median, "p95": self.p95, "rounds": len(self.samples)}
+
+
+@dataclasses.dataclass(frozen=True)
+class Regression:
+    key: str
+    baseline_median: float
+    median: float
+
+    def __str__(self) -> str:
+        return (
+            f"{self.key} regressed from a median of {self.baseline_median:.4f} seconds to {self.median:.4f} seconds "
+            f"({self.median / self.baseline_median:.2f}x)"
+        )
+
+
+def get_benchmark_cases(
+    days: Iterable[int] = DAYS,
+    parts: Iterable[int] = PARTS,
+    include_inputs: bool = True,
+    include_examples: bool = True,
+    generated_scales: Iterable[float] = (),
+) -> list[BenchmarkCase]:
+    cases = []
+    for day in days:
+        example_file_names = sorted(x.name for x in get_day_directory(day).glob("*example*.txt"))
+        for part in parts:
+            if include_inputs:
+                cases.append(BenchmarkCase(day=day, part=part, file_name=INPUT_FILE_NAME))
+            if include_examples and (day, part) not in SKIPPED_EXAMPLES:
+                cases += [
+                    BenchmarkCase(day=day, part=part, file_name=x, kwargs=EXAMPLE_KWARGS.get((day, part), {}))
+                    for x in example_file_names
+                ]
+            cases += [
+                BenchmarkCase(day=day, part=part, file_name=get_generated_file_name(scale, GENERATED_SEED))
+                for scale in generated_scales
+            ]
+    return cases
+
+
+def ensure_generated_inputs_exist(cases: list[BenchmarkCase], generated_scales: Iterable[float]) -> None:
+    for day in sorted({x.day for x in cases}):
+        for scale in generated_scales:
+            file_name = get_generated_file_name(scale, GENERATED_SEED)
+            if not (get_day_directory(day) / file_name).exists():
+                write_generated_input(day, scale=scale, seed=GENERATED_SEED, file_name=file_name)
+
+
+def run_benchmark_cases(cases: list[BenchmarkCase], rounds: int = DEFAULT_ROUNDS) -> Iterable[BenchmarkResult]:
+    modules = {day: load_day(day) for day in sorted({x.day for x in cases})}
+    for case in cases:
+        if (part_callable := get_part(modules[case.day], case.part)) is None:
+            continue  # day 25 only has the one part
+        file_name = str(get_day_directory(case.day) / case.file_name)
+        samples = [time_part(part_callable, file_name, **case.kwargs)[1] for _ in range(rounds)]
+        yield BenchmarkResult(case=case, samples=samples)
+
+
+Baseline: TypeAlias = dict[str, dict[str, float | int]]  # case key => that case's timings
+
+
+def read_baseline(file_name: str = BASELINE_FILE_NAME) -> Baseline:
+    if not Path(file_name).exists():
+        return {}
+    with open(file_name, "r") as f:
+        return cast(Baseline, json.load(f))  # trust that this file was written by `write_baseline`
+
+
+def write_baseline(results: list[BenchmarkResult], file_name: str = BASELINE_FILE_NAME) -> None:
+    # merge into the existing baseline so benchmarking a subset of days doesn't throw away everything else
+    baseline = read_baseline(file_name) | {x.case.key: x.to_json() for x in results}
+    with open(file_name, "w") as f:
+        json.dump(dict(sorted(baseline.items())), f, indent=2)
+        f.write("\n")
+
+
+def find_regressions(
+    results: list[BenchmarkResult],
+    baseline: dict[str, dict[str, float | int]],
+    threshold: float = DEFAULT_THRESHOLD,
+    noise_floor: float = DEFAULT_NOISE_FLOOR,
+) -> list[Regression]:
+    regressions = []
+    for result in results:
+        if (baseline_timings := baseline.get(result.case.key)) is None:
+            continue  # nothing to compare against yet
+        baseline_median = float(baseline_timings["median"])
+        if result.median > noise_floor and result.median > baseline_median * (1 + threshold):
+            regressions.append(Regression(key=result.case.key, baseline_median=baseline_median, median=result.median))
+    return regressions
+
+
+def get_argument_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark Advent of Code 2022 solutions against a stored baseline.")
+    parser.add_argument("--days", type=parse_days, default=list(DAYS), help="e.g. `12` or `1-5,12` (default: all)")
+    parser.add_argument("--parts", type=int, nargs="+", default=list(PARTS), choices=PARTS)
+    parser.add_argument("--files", choices=["all", "inputs", "examples", "none"], default="all")
+    parser.add_argument(
+        "--generated-scales", type=float, nargs="*", default=[], help="also benchmark generated inputs of these scales"
+    )
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS)
+    parser.add_argument("--baseline", default=BASELINE_FILE_NAME, help="path to the JSON baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="allowed slowdown, e.g. 0.25")
+    parser.add_argument("--noise-floor", type=float, default=DEFAULT_NOISE_FLOOR, help="ignore medians below this")
+    parser.add_argument("--save", action="store_true", help="write these timings to the baseline")
+    return parser
+
+
+def main() -> None:
+    args = get_argument_parser().parse_args()
+    assert args.rounds > 0, "need at least one round to benchmark anything"
+    cases = get_benchmark_cases(
+        days=args.days,
+        parts=args.parts,
+        include_inputs=args.files in ("all", "inputs"),
+        include_examples=args.files in ("all", "examples"),
+        generated_scales=args.generated_scales,
+    )
+    ensure_generated_inputs_exist(cases, args.generated_scales)
+    results = []
+    for result in run_benchmark_cases(cases, rounds=args.rounds):
+        print(f"{result.case.key}: median {result.median:.4f} seconds, p95 {result.p95:.4f} seconds", flush=True)
+        results.append(result)
+
+    regressions = find_regressions(results, read_baseline(args.baseline), args.threshold, args.noise_floor)
+    if args.save:
+        write_baseline(results, args.baseline)
+        print(f"Wrote {len(results)} timings to {args.baseline}.")
+    if regressions:
+        print(f"\n{len(regressions)} part{'s' if len(regressions) != 1 else ''} regressed:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+import dataclasses
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, ParamSpec, TypeVar
+
+from lib.inputs import BUFFER_SIZE, STDIN_FILE_NAME
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+# caching is opt-in (e.g. `python run.py --cache`) and configured through environment variables so that it carries
+# over to any worker processes without having to thread it through every function call
+CACHE_DIRECTORY_VARIABLE = "AOC_2022_CACHE_DIRECTORY"
+CACHE_MAX_BYTES_VARIABLE = "AOC_2022_CACHE_MAX_BYTES"
+
+LIB_DIRECTORY = Path(__file__).resolve().parent
+DEFAULT_CACHE_DIRECTORY = LIB_DIRECTORY.parent / ".cache"
+DEFAULT_CACHE_MAX_BYTES = 256 * 2**20
+
+
+@dataclasses.dataclass(frozen=True)
+class Cache:
+    # pickled values on disk, one file per key. the least recently used files are deleted once the cache grows past
+    # `max_bytes` - reading a value bumps its modification time, which is what "recently used" is based on.
+    directory: Path
+    max_bytes: int = DEFAULT_CACHE_MAX_BYTES
+
+    def get_path(self, key: str) -> Path:
+        return self.directory / f"{key}.pickle"
+
+    def get(self, key: str) -> tuple[bool, Any]:  # (hit, value)
+        path = self.get_path(key)
+        try:
+            value = pickle.loads(path.read_bytes())
+        except FileNotFoundError:
+            return False, None
+        except Exception:  # truncated file, or it refers to a class which has since moved - just recompute it
+            path.unlink(missing_ok=True)
+            return False, None
+        os.utime(path)
+        return True, value
+
+    def set(self, key: str, value: Any) -> None:
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            return  # not everything can be pickled (e.g. lambdas) - those values just don't get cached
+        if len(data) > self.max_bytes:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file first so other processes never read a half-written value
+        with tempfile.NamedTemporaryFile(dir=self.directory, suffix=".tmp", delete=False) as f:
+            f.write(data)
+        os.replace(f.name, self.get_path(key))
+        self.evict()
+
+    def evict(self) -> None:
+        entries = []
+        for path in self.directory.glob("*.pickle"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue  # another process evicted it first
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total_bytes = sum([x[1] for x in entries])
+        for _, size, path in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total_bytes -= size
+
+    def clear(self) -> None:
+        for path in self.directory.glob("*.pickle"):
+            path.unlink(missing_ok=True)
+
+
+def enable_cache(directory: Path = DEFAULT_CACHE_DIRECTORY, max_bytes: int = DEFAULT_CACHE_MAX_BYTES) -> None:
+    os.environ[CACHE_DIRECTORY_VARIABLE] = str(directory)
+    os.environ[CACHE_MAX_BYTES_VARIABLE] = str(max_bytes)
+
+
+def get_active_cache() -> Cache | None:
+    if not (directory := os.environ.get(CACHE_DIRECTORY_VARIABLE)):
+        return None
+    return Cache(
+        directory=Path(directory), max_bytes=int(os.environ.get(CACHE_MAX_BYTES_VARIABLE, DEFAULT_CACHE_MAX_BYTES))
+    )
+
+
+def hash_key(*parts: bytes | str) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        data = part.encode() if isinstance(part, str) else part
+        digest.update(len(data).to_bytes(8, "little"))  # length-prefix each part so ("ab", "c") != ("a", "bc")
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def hash_file(file_name: str) -> bytes:
+    # read a chunk at a time so hashing a huge (e.g. generated) input doesn't need the whole file in memory
+    digest = hashlib.sha256()
+    with open(file_name, "rb") as f:
+        while chunk := f.read(BUFFER_SIZE):
+            digest.update(chunk)
+    return digest.digest()
+
+
+@functools.lru_cache
+def get_source_fingerprint(source_file: str) -> bytes:
+    # the solver's source, plus the shared modules in `lib` since a change to e.g. `Grid` can change answers too
+    sources = [Path(source_file)] + sorted(LIB_DIRECTORY.glob("*.py"))
+    return hashlib.sha256(b"".join([x.read_bytes() for x in sources])).digest()
+
+
+def get_input_key(function: Callable[..., Any], file_name: str, *extra: str) -> str:
+    # content-addressed - the file's name and modification time don't matter, only what's in it
+    return hash_key(
+        function.__module__,
+        function.__qualname__,
+        get_source_fingerprint(inspect.getfile(function)),
+        hash_file(file_name),
+        *extra,
+    )
+
+
+def cached_by_input(function: Callable[P, T]) -> Callable[P, T]:
+    # cache the result of a function which takes an input file name as `file_name` (e.g. a parser, or a parser plus
+    # some expensive preprocessing) against that file's contents, the function's source and its other arguments
+    signature = inspect.signature(function)
+
+    @functools.wraps(function)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        arguments = signature.bind(*args, **kwargs)
+        arguments.apply_defaults()
+        if (cache := get_active_cache()) is None or arguments.arguments["file_name"] == STDIN_FILE_NAME:
+            return function(*args, **kwargs)
+        other_arguments = {key: value for key, value in arguments.arguments.items() if key != "file_name"}
+        key = get_input_key(function, arguments.arguments["file_name"], repr(sorted(other_arguments.items())))
+        hit, value = cache.get(key)
+        if not hit:
+            value = function(*args, **kwargs)
+            cache.set(key, value)
+        return value
+
+    return wrapper
@@ -0,0 +1,24 @@
+import operator
+from typing import Callable, TypeAlias
+
+Operator: TypeAlias = Callable[[int, int], int]
+
+OPERATORS: dict[str, Operator] = {"+": operator.add, "-": operator.sub, "*": operator.mul, "/": operator.floordiv}
+
+
+def compile_operation(text: str, variable: str = "old") -> Callable[[int], int]:
+    # compile a binary operation on `variable` and/or integer literals (e.g. day 11's `old * 19` or `old * old`) into a
+    # closure once up front, so evaluating it is just a function call rather than parsing text each time
+    left_text, symbol, right_text = text.split()
+    op = OPERATORS[symbol]
+    left_is_variable, right_is_variable = left_text == variable, right_text == variable
+    if left_is_variable and right_is_variable:
+        return lambda value: op(value, value)
+    if left_is_variable:
+        right = int(right_text)
+        return lambda value: op(value, right)
+    if right_is_variable:
+        left = int(left_text)
+        return lambda value: op(left, value)
+    constant = op(int(left_text), int(right_text))
+    return lambda value: constant
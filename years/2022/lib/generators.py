@@ -0,0 +1,508 @@
+import argparse
+import math
+import random
+import string
+from pathlib import Path
+from typing import Callable, Iterable, TypeAlias
+
+from lib.runner import get_day_directory, load_day, parse_days
+
+# each generator yields the lines of a valid puzzle input for its day (without newlines).
+# `scale` multiplies the size of my real input - e.g. a scale of 1 produces an input roughly the same size as mine,
+# and a scale of 100 produces 100x as many numbers/lines/cells/etc. as mine.
+Generator: TypeAlias = Callable[[float, random.Random], Iterable[str]]  # scale, rng => lines
+
+GENERATED_FILE_PREFIX = "generated"
+
+
+def scaled(quantity: int, scale: float, minimum: int = 1) -> int:
+    return max(minimum, round(quantity * scale))
+
+
+def scaled_side(side: int, scale: float, minimum: int = 1) -> int:
+    # for 2D grids, scale the area rather than each side
+    return max(minimum, round(side * math.sqrt(scale)))
+
+
+def generate_day_1(scale: float, rng: random.Random) -> Iterable[str]:
+    for i in range(scaled(250, scale)):
+        if i > 0:
+            yield ""
+        for _ in range(rng.randint(1, 15)):
+            yield str(rng.randint(1_000, 60_000))
+
+
+def generate_day_2(scale: float, rng: random.Random) -> Iterable[str]:
+    for _ in range(scaled(2500, scale)):
+        yield f"{rng.choice('ABC')} {rng.choice('XYZ')}"
+
+
+def generate_day_3(scale: float, rng: random.Random) -> Iterable[str]:
+    # each group of three rucksacks shares exactly one item (the badge), and each rucksack's compartments share
+    # exactly one item. achieved by giving each rucksack in a group a disjoint pool of items plus the badge.
+    items = string.ascii_letters
+    for _ in range(scaled(100, scale)):
+        badge = rng.choice(items)
+        other_items = [x for x in items if x != badge]
+        rng.shuffle(other_items)
+        for pool in (other_items[0:17], other_items[17:34], other_items[34:51]):
+            overlapping_item = rng.choice([*pool, badge])
+            remaining_items = [x for x in [*pool, badge] if x != overlapping_item]
+            first_items, second_items = remaining_items[::2], remaining_items[1::2]
+            compartment_length = rng.randint(4, 24)
+            compartments = []
+            for compartment_items in (first_items, second_items):
+                required = [overlapping_item] + ([badge] if badge in compartment_items else [])
+                compartment = required + rng.choices(compartment_items, k=compartment_length - len(required))
+                rng.shuffle(compartment)
+                compartments.append("".join(compartment))
+            yield "".join(compartments)
+
+
+def generate_day_4(scale: float, rng: random.Random) -> Iterable[str]:
+    for _ in range(scaled(1000, scale)):
+        a, b = sorted((rng.randint(1, 99), rng.randint(1, 99)))
+        c, d = sorted((rng.randint(1, 99), rng.randint(1, 99)))
+        yield f"{a}-{b},{c}-{d}"
+
+
+def generate_day_5(scale: float, rng: random.Random) -> Iterable[str]:
+    # nine stacks whose heights grow with the scale. moves never empty a stack so there's always a crate on top.
+    num_stacks = 9
+    stacks = [rng.choices(string.ascii_uppercase, k=rng.randint(2, scaled(8, scale, 2))) for _ in range(num_stacks)]
+    for level in reversed(range(max(len(x) for x in stacks))):
+        yield " ".join(f"[{stack[level]}]" if level < len(stack) else "   " for stack in stacks).rstrip()
+    yield " " + "   ".join(str(i + 1) for i in range(num_stacks))
+    yield ""
+    heights = [len(x) for x in stacks]
+    for _ in range(scaled(500, scale)):
+        source = rng.choice([i for i, height in enumerate(heights) if height > 1])
+        target = rng.choice([i for i in range(num_stacks) if i != source])
+        num_crates = rng.randint(1, min(heights[source] - 1, 40))
+        heights[source] -= num_crates
+        heights[target] += num_crates
+        yield f"move {num_crates} from {source + 1} to {target + 1}"
+
+
+def generate_day_6(scale: float, rng: random.Random) -> Iterable[str]:
+    # a stretch with no 4-character marker, then a stretch with no 14-character marker, then a 14-character marker
+    length = scaled(4096, scale, 64)
+    alphabet = string.ascii_lowercase
+    stream = rng.sample(alphabet, 3)
+    while len(stream) < length // 3:
+        stream.append(rng.choice(stream[-3:]))  # every window of four characters contains a repeat
+    small_alphabet = rng.sample(alphabet, 13)
+    stream += rng.choices(small_alphabet, k=length - len(stream) - 14)  # 13 letters can't make a 14 character marker
+    stream += rng.sample(alphabet, 14)
+    yield "".join(stream)
+
+
+def generate_day_7(scale: float, rng: random.Random) -> Iterable[str]:
+    # a random tree of directories whose total size always requires (and allows) deleting one directory for the update.
+    # the root has two children so the larger of the two is always big enough to delete.
+    num_directories = scaled(180, scale, 2)
+    parents = [-1, 0, 0] + [rng.randint(1, i - 1) for i in range(3, num_directories + 1)]  # index 0 is the root
+    children: list[list[int]] = [[] for _ in parents]
+    for directory, parent in enumerate(parents[1:], start=1):
+        children[parent].append(directory)
+    num_files = [rng.randint(0, 4) for _ in parents]
+    num_files[0] = 2
+    weights = [rng.random() for _ in range(sum(num_files))]
+    size_per_weight = rng.randint(45_000_000, 60_000_000) / sum(weights)
+    file_sizes = iter([max(1, int(x * size_per_weight)) for x in weights])
+    names: list[str] = [""] * len(parents)
+
+    def get_unique_names(count: int, suffix: Callable[[], str] = lambda: "") -> list[str]:
+        unique_names: set[str] = set()
+        while len(unique_names) < count:
+            unique_names.add("".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 8))) + suffix())
+        return list(unique_names)
+
+    yield "$ cd /"
+    stack: list[int | None] = [0]  # directories to visit, with `None` meaning `cd ..`
+    while stack:
+        if (directory_to_visit := stack.pop()) is None:
+            yield "$ cd .."
+            continue
+        directory = directory_to_visit
+        if directory != 0:
+            yield f"$ cd {names[directory]}"
+        yield "$ ls"
+        for child, name in zip(children[directory], get_unique_names(len(children[directory]))):
+            names[child] = name
+            yield f"dir {name}"
+        for name in get_unique_names(num_files[directory], lambda: rng.choice(["", ".txt", ".dat", ".log"])):
+            yield f"{next(file_sizes)} {name}"
+        for child in reversed(children[directory]):
+            stack += [None, child]
+
+
+def generate_day_8(scale: float, rng: random.Random) -> Iterable[str]:
+    side = scaled_side(99, scale, 3)
+    for _ in range(side):
+        yield "".join(rng.choices(string.digits, k=side))
+
+
+def generate_day_9(scale: float, rng: random.Random) -> Iterable[str]:
+    for _ in range(scaled(2000, scale)):
+        yield f"{rng.choice('RULD')} {rng.randint(1, 20)}"
+
+
+def generate_day_10(scale: float, rng: random.Random) -> Iterable[str]:
+    # keep the register within a range where the sprite is occasionally on screen
+    x = 1
+    for _ in range(scaled(140, scale)):
+        if rng.random() < 0.3:
+            yield "noop"
+        else:
+            value = rng.randint(-10, 10) or 1
+            value = -value if not (-5 <= x + value <= 45) else value
+            x += value
+            yield f"addx {value}"
+
+
+def generate_day_11(scale: float, rng: random.Random) -> Iterable[str]:
+    # eight monkeys (each with a distinct prime divisor) passing around a number of items which grows with the scale
+    num_monkeys = 8
+    primes = [2, 3, 5, 7, 11, 13, 17, 19]
+    rng.shuffle(primes)
+    operations = ["old * old", *(f"old * {rng.randint(2, 19)}" for _ in range(2))]
+    operations += [f"old + {rng.randint(1, 8)}" for _ in range(num_monkeys - len(operations))]
+    rng.shuffle(operations)
+    items: list[list[int]] = [[] for _ in range(num_monkeys)]
+    for _ in range(scaled(36, scale, num_monkeys)):
+        items[rng.randrange(num_monkeys)].append(rng.randint(50, 99))
+    for i in range(num_monkeys):
+        if i > 0:
+            yield ""
+        true_target, false_target = rng.sample([x for x in range(num_monkeys) if x != i], 2)
+        yield f"Monkey {i}:"
+        yield f"  Starting items: {', '.join(str(x) for x in items[i] or [rng.randint(50, 99)])}"
+        yield f"  Operation: new = {operations[i]}"
+        yield f"  Test: divisible by {primes[i]}"
+        yield f"    If true: throw to monkey {true_target}"
+        yield f"    If false: throw to monkey {false_target}"
+
+
+def generate_day_12(scale: float, rng: random.Random) -> Iterable[str]:
+    # elevation increases from left to right one letter at a time, with raised cells scattered around as obstacles.
+    # the row containing S and E never has obstacles so there's always a path.
+    width, height = scaled_side(171, scale, 26), scaled_side(41, scale, 1)
+    path_row = rng.randrange(height)
+    for y in range(height):
+        row = []
+        for x in range(width):
+            elevation = x * 26 // width
+            if y != path_row and rng.random() < 0.15:
+                elevation = min(25, elevation + rng.randint(2, 5))
+            row.append(chr(elevation + ord("a")))
+        if y == path_row:
+            row[0], row[-1] = "S", "E"
+        yield "".join(row)
+
+
+def generate_day_13_packet(rng: random.Random, depth: int = 0) -> str:
+    items = []
+    for _ in range(rng.randint(0, 5)):
+        if depth < 4 and rng.random() < 0.3:
+            items.append(generate_day_13_packet(rng, depth + 1))
+        else:
+            items.append(str(rng.randint(0, 10)))
+    return f"[{','.join(items)}]"
+
+
+def generate_day_13(scale: float, rng: random.Random) -> Iterable[str]:
+    for i in range(scaled(150, scale)):
+        if i > 0:
+            yield ""
+        left = generate_day_13_packet(rng)
+        while (right := generate_day_13_packet(rng)) == left:
+            pass  # identical packets have no defined order
+        yield left
+        yield right
+
+
+def generate_day_14(scale: float, rng: random.Random) -> Iterable[str]:
+    # paths of rock made of horizontal and vertical segments, in a cave that gets deeper and wider with the scale.
+    # nothing starts right below the source of the sand, otherwise it fills up almost immediately.
+    depth = scaled_side(160, scale, 20)
+    for _ in range(scaled(140, scale)):
+        x, y = rng.randint(500 - depth // 2, 500 + depth // 2), rng.randint(max(12, depth // 10), depth)
+        points = [(x, y)]
+        for i in range(rng.randint(1, 6)):
+            if i % 2 == 0:
+                x = max(0, x + rng.choice([-1, 1]) * rng.randint(1, 10))
+            else:
+                y = max(12, y + rng.choice([-1, 1]) * rng.randint(1, 10))
+            points.append((x, y))
+        yield " -> ".join(f"{x},{y}" for x, y in points)
+
+
+def generate_day_15(scale: float, rng: random.Random, max_coordinate: int = 4_000_000) -> Iterable[str]:
+    # there must be exactly one position within the search area that no sensor covers. a sensor in each corner of the
+    # search area which can *just* not reach that position covers everything else, since every other position in that
+    # corner's quadrant is closer to it. every other sensor is also kept just out of reach of that position.
+    # keeping it near the middle keeps the corner sensors about as big as the ones in my input
+    distress_x = rng.randint(max_coordinate * 9 // 20, max_coordinate * 11 // 20)
+    distress_y = rng.randint(max_coordinate * 9 // 20, max_coordinate * 11 // 20)
+    corners = [(0, 0), (max_coordinate, 0), (0, max_coordinate), (max_coordinate, max_coordinate)]
+    sensors = corners + [
+        (rng.randint(0, max_coordinate), rng.randint(0, max_coordinate)) for _ in range(scaled(21, scale, 0))
+    ]
+    for sensor_x, sensor_y in sensors:
+        distance_to_distress_signal = abs(sensor_x - distress_x) + abs(sensor_y - distress_y)
+        if distance_to_distress_signal < 2:
+            continue
+        slack = 1 if (sensor_x, sensor_y) in corners else rng.randint(1, distance_to_distress_signal - 1)
+        distance = distance_to_distress_signal - slack
+        dx = rng.randint(-distance, distance)
+        beacon_x, beacon_y = sensor_x + dx, sensor_y + rng.choice([-1, 1]) * (distance - abs(dx))
+        yield f"Sensor at x={sensor_x}, y={sensor_y}: closest beacon is at x={beacon_x}, y={beacon_y}"
+
+
+def generate_day_16(scale: float, rng: random.Random) -> Iterable[str]:
+    # a connected network of valves (a random tree plus some extra tunnels), a quarter of which have a flow rate.
+    # careful - the search is exponential in the number of valves with a flow rate.
+    name_characters = string.ascii_uppercase + string.digits
+    num_valves = min(scaled(54, scale, 2), len(name_characters) ** 2)
+    other_names = [a + b for a in name_characters for b in name_characters if a + b != "AA"]
+    names = ["AA"] + rng.sample(other_names, num_valves - 1)
+    tunnels: list[set[int]] = [set() for _ in range(num_valves)]
+    for i in range(1, num_valves):
+        j = rng.randrange(i)
+        tunnels[i].add(j)
+        tunnels[j].add(i)
+    for _ in range(num_valves // 4):
+        i, j = rng.sample(range(num_valves), 2)
+        tunnels[i].add(j)
+        tunnels[j].add(i)
+    valves_with_flow = set(rng.sample(range(1, num_valves), max(1, (num_valves - 1) * 15 // 53)))
+    for i, name in enumerate(names):
+        flow_rate = rng.randint(3, 25) if i in valves_with_flow else 0
+        destinations = ", ".join(names[x] for x in sorted(tunnels[i]))
+        if len(tunnels[i]) == 1:
+            yield f"Valve {name} has flow rate={flow_rate}; tunnel leads to valve {destinations}"
+        else:
+            yield f"Valve {name} has flow rate={flow_rate}; tunnels lead to valves {destinations}"
+
+
+def generate_day_17(scale: float, rng: random.Random) -> Iterable[str]:
+    yield "".join(rng.choices("<>", k=scaled(10091, scale)))
+
+
+def generate_day_18(scale: float, rng: random.Random) -> Iterable[str]:
+    # a roughly spherical droplet of cubes which gets bigger with the scale. the density leaves some air pockets.
+    num_cubes = scaled(2881, scale)
+    radius = (num_cubes / (0.35 * 4 / 3 * math.pi)) ** (1 / 3)
+    centre = math.ceil(radius) + 1
+    cubes: set[tuple[int, int, int]] = set()
+    while len(cubes) < num_cubes:
+        x, y, z = (rng.randint(-int(radius), int(radius)) for _ in range(3))
+        if x**2 + y**2 + z**2 <= radius**2:
+            cubes.add((x, y, z))
+    for x, y, z in cubes:
+        yield f"{x + centre},{y + centre},{z + centre}"
+
+
+def generate_day_19(scale: float, rng: random.Random) -> Iterable[str]:
+    for i in range(scaled(30, scale)):
+        yield (
+            f"Blueprint {i + 1}: "
+            f"Each ore robot costs {rng.randint(2, 4)} ore. "
+            f"Each clay robot costs {rng.randint(2, 4)} ore. "
+            f"Each obsidian robot costs {rng.randint(2, 4)} ore and {rng.randint(5, 20)} clay. "
+            f"Each geode robot costs {rng.randint(2, 4)} ore and {rng.randint(7, 20)} obsidian."
+        )
+
+
+def generate_day_20(scale: float, rng: random.Random) -> Iterable[str]:
+    # exactly one zero, since that's where the grove coordinates are measured from
+    count = scaled(5000, scale, 2)
+    zero_index = rng.randrange(count)
+    for i in range(count):
+        yield "0" if i == zero_index else str(rng.choice([-1, 1]) * rng.randint(1, 10_000))
+
+
+def generate_day_21(scale: float, rng: random.Random) -> Iterable[str]:
+    # `humn` sits at the bottom of a chain of monkeys under the left side of `root`, and every other monkey belongs to a
+    # subtree which doesn't depend on `humn`. the chain is built upwards from the answer to part 2 so that part 2 has an
+    # integer answer, and `humn`'s own number differs from that answer by a multiple of every divisor along the chain so
+    # that part 1 only ever divides exactly too. everything stays positive and well within float precision.
+    num_monkeys = scaled(2295, scale, 16)
+    used_names = {"root", "humn"}
+    lines: list[str] = []
+
+    def new_name() -> str:
+        while (name := "".join(rng.choices(string.ascii_letters, k=4))) in used_names:
+            pass
+        used_names.add(name)
+        return name
+
+    def build_subtree(name: str, value: int, size: int) -> None:
+        # give `name` a subtree of roughly `size` monkeys which evaluates to `value`
+        if size <= 1 or value < 2:
+            lines.append(f"{name}: {value}")
+            return
+        op = rng.choice("+-*/")
+        if op == "*" and (divisors := [x for x in range(2, 10) if value % x == 0]):
+            b = rng.choice(divisors)
+            a = value // b
+        elif op == "-":
+            b = rng.randint(1, 100)
+            a = value + b
+        elif op == "/":
+            b = rng.randint(2, 9)
+            a = value * b
+        else:
+            op = "+"
+            a = rng.randint(1, value - 1)
+            b = value - a
+        left, right = new_name(), new_name()
+        lines.append(f"{name}: {left} {op} {right}")
+        left_size = max(1, min(size - 2, round((size - 1) * rng.uniform(0.35, 0.65))))
+        build_subtree(left, a, left_size)
+        build_subtree(right, b, max(1, size - 1 - left_size))
+
+    chain_length = min(60, num_monkeys // 8)
+    subtree_size = max(1, (num_monkeys - 2 * chain_length - 3) // (chain_length + 1))
+    answer = rng.randint(1_000, 100_000)
+    chain: list[tuple[str, str, int]] = []  # op, which operand the chain is (l/r), the other operand's value
+    value, divisor_product = answer, 1
+    for _ in range(chain_length):
+        op = rng.choice("+-*/")
+        if op == "*" and value < 10**11:
+            other = rng.randint(2, 5)
+            value *= other
+        elif (
+            op == "/"
+            and value > 10**6
+            and (divisors := [x for x in range(2, 10) if value % x == 0 and divisor_product * x <= 10_000])
+        ):
+            other = rng.choice(divisors)
+            value //= other
+            divisor_product *= other
+        elif op == "-" and value > 2:
+            other = rng.randint(1, value - 1)
+            value -= other
+        else:
+            op = "+"
+            other = rng.randint(1, 1_000)
+            value += other
+        chain.append((op, rng.choice("lr") if op in "+*" else "l", other))  # + and * are commutative
+
+    root_left, root_right = new_name(), new_name()
+    lines.append(f"root: {root_left} + {root_right}")
+    build_subtree(root_right, value, subtree_size)
+    name = root_left
+    for i, (op, side, other) in enumerate(reversed(chain)):
+        chain_name, other_name = "humn" if i == chain_length - 1 else new_name(), new_name()
+        operands = (chain_name, other_name) if side == "l" else (other_name, chain_name)
+        lines.append(f"{name}: {operands[0]} {op} {operands[1]}")
+        build_subtree(other_name, other, subtree_size)
+        name = chain_name
+    lines.append(f"humn: {answer + divisor_product * rng.randint(1, 10)}")
+    rng.shuffle(lines)
+    yield from lines
+
+
+def generate_day_22(scale: float, rng: random.Random) -> Iterable[str]:
+    # the cube's edges are hardcoded for my input's net (50x50 faces) so keep that and scale the path instead
+    faces = {(1, 0), (2, 0), (1, 1), (0, 2), (1, 2), (0, 3)}  # (column, row) of each face in the net
+    face_size = 50
+    for y in range(4 * face_size):
+        line = ""
+        for x in range(3 * face_size):
+            if (x // face_size, y // face_size) in faces:
+                line += "#" if rng.random() < 0.04 and (x, y) != (face_size, 0) else "."
+            else:
+                line += " "
+        yield line.rstrip()
+    yield ""
+    commands = "".join(f"{rng.randint(1, 50)}{rng.choice('LR')}" for _ in range(scaled(2000, scale)))
+    yield commands + str(rng.randint(1, 50))
+
+
+def generate_day_23(scale: float, rng: random.Random) -> Iterable[str]:
+    side = scaled_side(73, scale)
+    for _ in range(side):
+        yield "".join("#" if rng.random() < 0.51 else "." for _ in range(side))
+
+
+def generate_day_24(scale: float, rng: random.Random) -> Iterable[str]:
+    # a valley which gets wider and taller with the scale. like my input, there are no vertical blizzards in the same
+    # columns as the entrance and the exit so nothing ever blows out of the valley.
+    width, height = scaled_side(150, scale, 3), scaled_side(20, scale, 3)
+    yield "#." + "#" * width
+    for _ in range(height):
+        row = [rng.choice("<>^v") if rng.random() < 0.7 else "." for _ in range(width)]
+        for x in (0, width - 1):
+            if row[x] in "^v":
+                row[x] = rng.choice("<>")
+        yield "#" + "".join(row) + "#"
+    yield "#" * width + ".#"
+
+
+def generate_day_25(scale: float, rng: random.Random) -> Iterable[str]:
+    decimal_to_snafu = load_day(25).decimal_to_snafu  # the solver's own conversion, so the two can't drift apart
+    for _ in range(scaled(125, scale)):
+        yield decimal_to_snafu(rng.randint(1, 5 ** rng.randint(1, 20)))
+
+
+GENERATORS: dict[int, Generator] = {
+    1: generate_day_1,
+    2: generate_day_2,
+    3: generate_day_3,
+    4: generate_day_4,
+    5: generate_day_5,
+    6: generate_day_6,
+    7: generate_day_7,
+    8: generate_day_8,
+    9: generate_day_9,
+    10: generate_day_10,
+    11: generate_day_11,
+    12: generate_day_12,
+    13: generate_day_13,
+    14: generate_day_14,
+    15: generate_day_15,
+    16: generate_day_16,
+    17: generate_day_17,
+    18: generate_day_18,
+    19: generate_day_19,
+    20: generate_day_20,
+    21: generate_day_21,
+    22: generate_day_22,
+    23: generate_day_23,
+    24: generate_day_24,
+    25: generate_day_25,
+}
+
+
+def get_generated_file_name(scale: float, seed: int) -> str:
+    return f"{GENERATED_FILE_PREFIX}_x{scale:g}_seed_{seed}.txt"
+
+
+def write_generated_input(day: int, scale: float = 1, seed: int = 0, file_name: str | None = None) -> Path:
+    # writes into the day's directory by default so it can be run with `run.py --input <file name>`
+    file_path = get_day_directory(day) / (file_name or get_generated_file_name(scale, seed))
+    with open(file_path, "w") as f:
+        for line in GENERATORS[day](scale, random.Random(seed)):
+            f.write(line + "\n")
+    return file_path
+
+
+def get_argument_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Generate synthetic Advent of Code 2022 inputs of any size.")
+    parser.add_argument("--days", type=parse_days, default=list(GENERATORS.keys()), help="e.g. `20` or `1-5,12`")
+    parser.add_argument("--scale", type=float, default=1, help="size relative to the real input, e.g. 100")
+    parser.add_argument("--seed", type=int, default=0)
+    return parser
+
+
+def main() -> None:
+    args = get_argument_parser().parse_args()
+    for day in args.days:
+        print(f"Wrote {write_generated_input(day, scale=args.scale, seed=args.seed)}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+import dataclasses
+from typing import Callable, Iterable, Mapping, TypeAlias
+
+Point: TypeAlias = tuple[int, int]  # x, y. top-left is (min_x, min_y).
+
+CARDINAL_DELTAS: tuple[Point, ...] = ((0, -1), (1, 0), (0, 1), (-1, 0))  # north, east, south, west
+DIAGONAL_DELTAS: tuple[Point, ...] = ((1, -1), (1, 1), (-1, 1), (-1, -1))  # north-east, south-east, etc
+
+
+@dataclasses.dataclass(slots=True)
+class Grid:
+    # a dense 2D grid of small integers (0-255) stored row-major in a single bytearray - roughly one byte per cell,
+    # rather than the ~100 bytes per cell of a dict or set keyed by tuples.
+    # coordinates don't have to start at zero (e.g. day 14's cave is centred around x=500), and with `auto_grow` the
+    # grid will reallocate itself to fit any point written outside of its bounds.
+    # hot loops should skip the bounds checks in `__getitem__` by using `index` and `cells` directly - moving one cell
+    # north/south is `-width`/`+width` and moving one cell west/east is `-1`/`+1`.
+    width: int
+    height: int
+    min_x: int = 0
+    min_y: int = 0
+    auto_grow: bool = False
+    cells: bytearray = dataclasses.field(default_factory=bytearray)
+
+    def __post_init__(self) -> None:
+        if not self.cells:
+            self.cells = bytearray(self.width * self.height)
+        assert len(self.cells) == self.width * self.height, "cells don't match the grid's dimensions"
+
+    @classmethod
+    def from_lines(
+        cls,
+        lines: Iterable[str],
+        values: Mapping[str, int] | Callable[[str], int],
+        auto_grow: bool = False,
+        pad_ragged_rows: bool = False,
+    ) -> "Grid":
+        # empty lines (e.g. a trailing blank line) are skipped rather than becoming rows of 0s. rows of different
+        # lengths are an error unless `pad_ragged_rows` is set (e.g. day 22's map), where anything past the end of a
+        # line is left as 0.
+        rows = [row for line in lines if (row := line.rstrip("\r\n"))]
+        width = max([len(x) for x in rows], default=0)
+        if not pad_ragged_rows and (ragged_rows := [y for y, row in enumerate(rows) if len(row) != width]):
+            raise ValueError(f"row {ragged_rows[0]} is {len(rows[ragged_rows[0]])} cells wide rather than {width}")
+        get_value = values.__getitem__ if isinstance(values, Mapping) else values
+        grid = cls(width=width, height=len(rows), auto_grow=auto_grow)
+        for y, row in enumerate(rows):
+            grid.cells[y * grid.width : y * grid.width + len(row)] = bytes(get_value(x) for x in row)
+        return grid
+
+    @classmethod
+    def from_points(cls, points: Iterable[Point], value: int = 1, auto_grow: bool = False) -> "Grid":
+        points = list(points)
+        xs, ys = [x for x, _ in points] or [0], [y for _, y in points] or [0]
+        grid = cls(
+            width=max(xs) - min(xs) + 1, height=max(ys) - min(ys) + 1, min_x=min(xs), min_y=min(ys), auto_grow=auto_grow
+        )
+        for point in points:
+            grid.cells[grid.index(*point)] = value
+        return grid
+
+    @property
+    def max_x(self) -> int:
+        return self.min_x + self.width - 1
+
+    @property
+    def max_y(self) -> int:
+        return self.min_y + self.height - 1
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        return 0 <= x - self.min_x < self.width and 0 <= y - self.min_y < self.height
+
+    def index(self, x: int, y: int) -> int:
+        return (y - self.min_y) * self.width + (x - self.min_x)
+
+    def point(self, index: int) -> Point:
+        y, x = divmod(index, self.width)
+        return x + self.min_x, y + self.min_y
+
+    def __getitem__(self, point: Point) -> int:
+        x, y = point[0] - self.min_x, point[1] - self.min_y
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise IndexError(f"{point} is outside of the grid")
+        return self.cells[y * self.width + x]
+
+    def __setitem__(self, point: Point, value: int) -> None:
+        if not self.in_bounds(*point):
+            if not self.auto_grow:
+                raise IndexError(f"{point} is outside of the grid")
+            # leave some room on whichever side grew so that writing a line of points doesn't reallocate every time
+            padding = max(self.width, self.height) // 2 + 1
+            self.grow_to_include(
+                point[0] - (padding if point[0] < self.min_x else 0),
+                point[1] - (padding if point[1] < self.min_y else 0),
+                point[0] + (padding if point[0] > self.max_x else 0),
+                point[1] + (padding if point[1] > self.max_y else 0),
+            )
+        self.cells[self.index(*point)] = value
+
+    def get(self, x: int, y: int, default: int = 0) -> int:
+        x, y = x - self.min_x, y - self.min_y
+        return self.cells[y * self.width + x] if 0 <= x < self.width and 0 <= y < self.height else default
+
+    def neighbours(self, point: Point, diagonal: bool = False) -> list[Point]:
+        deltas = CARDINAL_DELTAS + DIAGONAL_DELTAS if diagonal else CARDINAL_DELTAS
+        candidates = [(point[0] + dx, point[1] + dy) for dx, dy in deltas]
+        return [x for x in candidates if self.in_bounds(*x)]
+
+    def find(self, value: int) -> list[Point]:
+        return [self.point(i) for i, cell in enumerate(self.cells) if cell == value]
+
+    def count(self, value: int) -> int:
+        return self.cells.count(value)
+
+    def copy(self) -> "Grid":
+        return dataclasses.replace(self, cells=self.cells[:])
+
+    def cropped(self, min_x: int, min_y: int, max_x: int, max_y: int) -> "Grid":
+        # a copy of this grid with new bounds. cells outside of this grid's bounds are 0.
+        grid = Grid(
+            width=max_x - min_x + 1, height=max_y - min_y + 1, min_x=min_x, min_y=min_y, auto_grow=self.auto_grow
+        )
+        overlap_min_x, overlap_max_x = max(min_x, self.min_x), min(max_x, self.max_x)
+        if overlap_min_x <= overlap_max_x:
+            for y in range(max(min_y, self.min_y), min(max_y, self.max_y) + 1):
+                source = self.index(overlap_min_x, y)
+                destination = grid.index(overlap_min_x, y)
+                grid.cells[destination : destination + overlap_max_x - overlap_min_x + 1] = self.cells[
+                    source : source + overlap_max_x - overlap_min_x + 1
+                ]
+        return grid
+
+    def grow_to_include(self, min_x: int, min_y: int, max_x: int, max_y: int) -> None:
+        if min_x >= self.min_x and min_y >= self.min_y and max_x <= self.max_x and max_y <= self.max_y:
+            return
+        grown = self.cropped(
+            min(min_x, self.min_x), min(min_y, self.min_y), max(max_x, self.max_x), max(max_y, self.max_y)
+        )
+        self.width, self.height, self.min_x, self.min_y = grown.width, grown.height, grown.min_x, grown.min_y
+        self.cells = grown.cells
+
+    def bounding_box(self, empty: int = 0) -> tuple[Point, Point]:  # (min x, min y), (max x, max y) of non-empty cells
+        points = [self.point(i) for i, cell in enumerate(self.cells) if cell != empty]
+        assert points, "the grid is empty"
+        xs, ys = [x for x, _ in points], [y for _, y in points]
+        return (min(xs), min(ys)), (max(xs), max(ys))
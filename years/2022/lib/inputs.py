@@ -0,0 +1,96 @@
+import contextlib
+import mmap
+import os
+import re
+import sys
+from typing import IO, Any, Iterator, TypeAlias
+
+STDIN_FILE_NAME = "-"  # pass this as the file name to read the puzzle input from stdin instead
+BUFFER_SIZE = 2**16
+BLANK_LINE = re.compile(rb"\n\r?\n")
+
+Buffer: TypeAlias = bytes | mmap.mmap
+
+
+@contextlib.contextmanager
+def open_input(file_name: str, binary: bool = False) -> Iterator[IO[Any]]:
+    if file_name == STDIN_FILE_NAME:  # not ours to close
+        if binary:
+            yield sys.stdin.buffer
+        else:
+            yield sys.stdin
+        return
+    with open(file_name, "rb" if binary else "r", buffering=BUFFER_SIZE) as f:
+        yield f
+
+
+def read_lines(file_name: str) -> Iterator[str]:
+    # each line without its trailing newline, read lazily so memory use doesn't depend on the size of the input
+    with open_input(file_name) as f:
+        for line in f:
+            yield line.rstrip("\r\n")
+
+
+def read_records(file_name: str) -> Iterator[list[str]]:
+    # groups of lines separated by blank lines (e.g. each elf's snacks in day 1, or each monkey in day 11)
+    record: list[str] = []
+    for line in read_lines(file_name):
+        if line.strip():
+            record.append(line)
+        elif record:
+            yield record
+            record = []
+    if record:
+        yield record
+
+
+def read_chunks(file_name: str, chunk_size: int = BUFFER_SIZE) -> Iterator[bytes]:
+    with open_input(file_name, binary=True) as f:
+        while chunk := f.read(chunk_size):
+            yield chunk
+
+
+@contextlib.contextmanager
+def map_input(file_name: str) -> Iterator[Buffer]:
+    # the whole input as a read-only buffer. files are memory-mapped so the OS pages them in as they're touched rather
+    # than python copying them into memory up front - stdin can't be mapped, so it's read in full instead.
+    if file_name == STDIN_FILE_NAME:
+        yield sys.stdin.buffer.read()
+        return
+    with open(file_name, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""  # empty files can't be mapped
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield buffer
+
+
+def split_records(buffer: Buffer, num_chunks: int) -> list[tuple[int, int]]:
+    # split a buffer into (up to) `num_chunks` roughly equal (start, end) ranges which only break on blank lines, so
+    # each record falls entirely within one range and the ranges can be processed independently
+    boundaries = [0]
+    for i in range(1, num_chunks):
+        if (match := BLANK_LINE.search(buffer, max(boundaries[-1], len(buffer) * i // num_chunks))) is None:
+            break
+        boundaries.append(match.end())
+    boundaries.append(len(buffer))
+    return [(start, end) for start, end in zip(boundaries, boundaries[1:]) if start < end]
+
+
+def iter_buffer_records(buffer: Buffer, start: int = 0, end: int | None = None) -> Iterator[list[bytes]]:
+    # like `read_records`, but over a range of a buffer (e.g. from `split_records`) and yielding stripped bytes
+    end = len(buffer) if end is None else end
+    record: list[bytes] = []
+    position = start
+    while position < end:
+        if (line_end := buffer.find(b"\n", position, end)) == -1:
+            line_end = end
+        line = buffer[position:line_end].strip()
+        position = line_end + 1
+        if line:
+            record.append(line)
+        elif record:
+            yield record
+            record = []
+    if record:
+        yield record
@@ -0,0 +1,53 @@
+import cProfile
+import dataclasses
+import io
+import pstats
+import tracemalloc
+from pathlib import Path
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_TOP = 25  # how many functions to show in the cumulative time table
+
+
+def format_bytes(num_bytes: int) -> str:
+    return f"{num_bytes / 2**20:.2f} MiB"
+
+
+@dataclasses.dataclass(frozen=True)
+class ProfileReport:
+    stats_file: Path  # open with `python -m pstats <file>` or snakeviz
+    cumulative_table: str  # the top functions sorted by cumulative time
+    peak_memory: int  # bytes allocated by python at the high-water mark
+    allocated_memory: int  # bytes still allocated when the profiled call returned (e.g. caches and results)
+
+    def __str__(self) -> str:
+        return (
+            f"Peak memory: {format_bytes(self.peak_memory)}, still allocated on return: "
+            f"{format_bytes(self.allocated_memory)}. Stats written to {self.stats_file}.\n{self.cumulative_table}"
+        )
+
+
+def profile_call(function: Callable[[], T], stats_file: Path, top: int = DEFAULT_TOP) -> tuple[T, ProfileReport]:
+    # run `function` under both cProfile and tracemalloc. both slow things down (tracemalloc especially on
+    # allocation-heavy days), so timings taken inside a profiled call are only useful relative to each other.
+    # only this process is profiled - work handed off to other processes won't show up.
+    profiler = cProfile.Profile()
+    tracemalloc.start()
+    try:
+        result = profiler.runcall(function)
+        allocated_memory, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    stats_file.parent.mkdir(parents=True, exist_ok=True)
+    profiler.dump_stats(stats_file)
+    stream = io.StringIO()
+    pstats.Stats(profiler, stream=stream).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    return result, ProfileReport(
+        stats_file=stats_file,
+        cumulative_table=stream.getvalue().strip("\n"),
+        peak_memory=peak_memory,
+        allocated_memory=allocated_memory,
+    )
@@ -0,0 +1,210 @@
+import argparse
+import atexit
+import dataclasses
+import importlib.util
+import inspect
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from types import ModuleType
+from typing import IO, Any, Callable, Iterable, TypeAlias
+
+from lib.cache import (
+    DEFAULT_CACHE_DIRECTORY,
+    DEFAULT_CACHE_MAX_BYTES,
+    enable_cache,
+    get_active_cache,
+    get_input_key,
+)
+from lib.inputs import BUFFER_SIZE, STDIN_FILE_NAME
+from lib.profiling import DEFAULT_TOP, ProfileReport, profile_call
+
+Answer: TypeAlias = int | str
+Part: TypeAlias = Callable[..., Answer]  # input file name (plus optional day-specific kwargs) => answer
+
+YEAR_DIRECTORY = Path(__file__).resolve().parents[1]  # the directory containing each day's directory
+DAYS = range(1, 26)
+PARTS = (1, 2)
+INPUT_FILE_NAME = "input.txt"
+PROFILE_DIRECTORY = YEAR_DIRECTORY / "profiles"
+
+
+def get_day_directory(day: int) -> Path:
+    return YEAR_DIRECTORY / f"{day:02d}"
+
+
+def load_day(day: int) -> ModuleType:
+    # the day modules are prefixed with digits (e.g. `2022_day_1.py`) so they can't be imported the normal way
+    if (module := sys.modules.get(module_name := f"day_{day}")) is not None:
+        return module  # already loaded in this process
+    file_path = get_day_directory(day) / f"2022_day_{day}.py"
+    spec = importlib.util.spec_from_file_location(module_name, file_path)
+    assert spec is not None and spec.loader is not None, f"could not load day {day} from {file_path}"
+    module = importlib.util.module_from_spec(spec)
+    # register the module so its functions can be pickled and sent to worker processes
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def get_part(module: ModuleType, part: int) -> Part | None:
+    # not every day has two parts (looking at you, day 25)
+    return getattr(module, f"part_{part}", None)
+
+
+def resolve_input_file(day: int, file_name: str = INPUT_FILE_NAME) -> str:
+    # input files are resolved relative to the day's directory rather than the current working directory
+    return file_name if file_name == STDIN_FILE_NAME else str(get_day_directory(day) / file_name)
+
+
+@dataclasses.dataclass(frozen=True)
+class PartResult:
+    day: int
+    part: int
+    answer: Answer
+    seconds: float  # wall time spent computing the answer
+    cached: bool = False  # was the answer read from the cache rather than computed?
+
+    def __str__(self) -> str:
+        answer = f"\n{self.answer}" if "\n" in str(self.answer) else f" {self.answer}"
+        cached = ", cached" if self.cached else ""
+        return f"Day {self.day}, part {self.part} ({self.seconds:.3f} seconds{cached}):{answer}"
+
+
+def time_part(part_callable: Part, file_name: str, **kwargs: Any) -> tuple[Answer, float]:
+    t0 = time.perf_counter()
+    answer = part_callable(file_name, **kwargs)
+    return answer, time.perf_counter() - t0
+
+
+def run_part(
+    day: int, part: int, file_name: str = INPUT_FILE_NAME, module: ModuleType | None = None, part_workers: int = 1
+) -> PartResult:
+    part_callable = get_part(module if module is not None else load_day(day), part)
+    assert part_callable is not None, f"day {day} does not have a part {part}"
+    input_file = resolve_input_file(day, file_name)
+    if (cache := get_active_cache()) is not None and input_file != STDIN_FILE_NAME:
+        # the number of workers doesn't change the answer, so it's not part of the key
+        t0 = time.perf_counter()
+        hit, answer = cache.get(key := get_input_key(part_callable, input_file))
+        if hit:
+            return PartResult(day=day, part=part, answer=answer, seconds=time.perf_counter() - t0, cached=True)
+    # some parts can split their own work across processes (e.g. each blueprint in day 19)
+    kwargs = {"workers": part_workers} if "workers" in inspect.signature(part_callable).parameters else {}
+    answer, seconds = time_part(part_callable, input_file, **kwargs)
+    if cache is not None and input_file != STDIN_FILE_NAME:
+        cache.set(key, answer)
+    return PartResult(day=day, part=part, answer=answer, seconds=seconds)
+
+
+def profile_part(
+    day: int,
+    part: int,
+    file_name: str = INPUT_FILE_NAME,
+    output_directory: Path = PROFILE_DIRECTORY,
+    top: int = DEFAULT_TOP,
+    part_workers: int = 1,
+) -> tuple[PartResult, ProfileReport]:
+    module = load_day(day)  # load outside of the profiler so importing the module isn't counted
+    return profile_call(
+        lambda: run_part(day, part, file_name=file_name, module=module, part_workers=part_workers),
+        stats_file=output_directory / f"day_{day}_part_{part}.pstats",
+        top=top,
+    )
+
+
+def get_tasks(days: Iterable[int], parts: Iterable[int]) -> list[tuple[int, int]]:  # (day, part)
+    return [(day, part) for day in days for part in parts if get_part(load_day(day), part) is not None]
+
+
+def run_days(
+    days: Iterable[int] = DAYS,
+    parts: Iterable[int] = PARTS,
+    file_name: str = INPUT_FILE_NAME,
+    workers: int = 1,
+    part_workers: int = 1,
+) -> Iterable[PartResult]:
+    tasks = get_tasks(days, parts)
+    if workers == 1:
+        for day, part in tasks:
+            yield run_part(day, part, file_name=file_name, part_workers=part_workers)
+        return
+
+    # every day (and every part within a day) is independent, so they can all be computed at once.
+    # results are yielded in the same order as the serial path, each as soon as it and everything before it is done.
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(run_part, day, part, file_name, None, part_workers) for day, part in tasks]
+        for future in futures:
+            yield future.result()
+
+
+def spool_stdin() -> str:
+    # every part reads its own input but stdin can only be read once, so copy it to a temporary file first
+    source: IO[bytes] = sys.stdin.buffer
+    with tempfile.NamedTemporaryFile(prefix="aoc_2022_", suffix=".txt", delete=False) as f:
+        destination: IO[bytes] = f
+        while chunk := source.read(BUFFER_SIZE):
+            destination.write(chunk)
+    atexit.register(os.remove, f.name)
+    return f.name
+
+
+def parse_days(days_text: str) -> list[int]:
+    # accepts things like `12`, `1,2,3` and `1-5,12`
+    days: list[int] = []
+    for chunk in days_text.split(","):
+        start, _, end = chunk.strip().partition("-")
+        days += list(range(int(start), int(end or start) + 1))
+    return days
+
+
+def get_argument_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Run Advent of Code 2022 solutions in a single interpreter.")
+    parser.add_argument("--days", type=parse_days, default=list(DAYS), help="e.g. `12` or `1-5,12` (default: all)")
+    parser.add_argument("--parts", type=int, nargs="+", default=list(PARTS), choices=PARTS)
+    parser.add_argument(
+        "--input", default=INPUT_FILE_NAME, help="input file name, relative to each day's directory, or - for stdin"
+    )
+    parser.add_argument("--workers", type=int, default=1, help="number of processes to spread days and parts across")
+    parser.add_argument("--part-workers", type=int, default=1, help="number of processes each part may use itself")
+    parser.add_argument("--cache", action="store_true", help="reuse answers and parsed inputs from previous runs")
+    parser.add_argument("--cache-directory", type=Path, default=DEFAULT_CACHE_DIRECTORY)
+    parser.add_argument("--cache-max-mb", type=int, default=DEFAULT_CACHE_MAX_BYTES // 2**20)
+    parser.add_argument("--profile", action="store_true", help="run each part under cProfile and tracemalloc")
+    parser.add_argument("--profile-top", type=int, default=DEFAULT_TOP, help="functions to show per profiled part")
+    parser.add_argument("--profile-directory", type=Path, default=PROFILE_DIRECTORY, help="where to write .pstats")
+    return parser
+
+
+def main() -> None:
+    args = get_argument_parser().parse_args()
+    assert args.workers > 0 and args.part_workers > 0, "need at least one worker"
+    if args.cache:
+        enable_cache(args.cache_directory, args.cache_max_mb * 2**20)
+    if args.input == STDIN_FILE_NAME:
+        args.input = spool_stdin()  # an absolute path, so it's used as-is rather than looked up in each day's directory
+    if args.profile:
+        assert args.workers == 1, "profiling only covers the main process, so parts can't be spread across workers"
+        for day, part in get_tasks(args.days, args.parts):
+            result, report = profile_part(
+                day, part, args.input, args.profile_directory, top=args.profile_top, part_workers=args.part_workers
+            )
+            print(f"{result}\n{report}\n", flush=True)
+        return
+    t0 = time.perf_counter()
+    total_seconds = 0.0
+    for result in run_days(
+        days=args.days, parts=args.parts, file_name=args.input, workers=args.workers, part_workers=args.part_workers
+    ):
+        print(result, flush=True)
+        total_seconds += result.seconds
+    print(f"Total time spent computing answers: {total_seconds:.3f} seconds.")
+    if args.workers > 1 or args.part_workers > 1:
+        print(f"Wall time with parallel execution: {time.perf_counter() - t0:.3f} seconds.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+import dataclasses
+import heapq
+from array import array
+from collections import deque
+from itertools import accumulate, repeat
+from typing import Callable, Container, Iterable, TypeAlias
+
+# nodes are non-negative integers (e.g. `Grid` cell indexes) so distances and parents can live in flat arrays.
+# graphs which are too big to enumerate up front (e.g. day 24's position + time) can leave `num_nodes` unset and the
+# search will fall back to dicts.
+Neighbours: TypeAlias = Callable[[int], Iterable[int]]  # node => adjacent nodes, all one step away
+WeightedNeighbours: TypeAlias = Callable[[int], Iterable[tuple[int, int]]]  # node => (adjacent node, cost to move)
+Heuristic: TypeAlias = Callable[[int], int]  # node => admissible estimate of the cost to reach a target
+Targets: TypeAlias = Container[int] | Callable[[int], bool] | None  # None => explore everything reachable
+
+UNREACHED = -1
+
+
+class SparseTable(dict[int, int]):
+    # reads like an array full of UNREACHED, but only stores the nodes which have been written to
+    def __missing__(self, node: int) -> int:
+        return UNREACHED
+
+
+NodeTable: TypeAlias = "array[int] | SparseTable"
+
+
+def new_node_table(num_nodes: int | None) -> NodeTable:
+    return array("q", [UNREACHED]) * num_nodes if num_nodes is not None else SparseTable()
+
+
+def get_target_checker(targets: Targets) -> Callable[[int], bool]:
+    if targets is None:
+        return lambda node: False
+    if callable(targets):
+        return targets
+    return targets.__contains__
+
+
+@dataclasses.dataclass(frozen=True)
+class CompressedGraph:
+    # a graph which never changes, compiled once into compressed sparse row form - the neighbours of node n are
+    # `targets[offsets[n] : offsets[n + 1]]`, so expanding a node is a slice of one flat array rather than generating
+    # and bounds checking its neighbours again every time it's visited
+    offsets: "array[int]"  # num_nodes + 1 of them
+    targets: "array[int]"
+
+    @classmethod
+    def from_neighbours(cls, num_nodes: int, neighbours: Neighbours) -> "CompressedGraph":
+        offsets, targets = array("q", [0]), array("q")
+        for node in range(num_nodes):
+            targets.extend(neighbours(node))
+            offsets.append(len(targets))
+        return cls(offsets=offsets, targets=targets)
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.offsets) - 1
+
+    def neighbours(self, node: int) -> "array[int]":
+        return self.targets[self.offsets[node] : self.offsets[node + 1]]
+
+    def weighted_neighbours(self, node: int) -> Iterable[tuple[int, int]]:  # every edge costs 1
+        return zip(self.neighbours(node), repeat(1))
+
+    def reversed(self) -> "CompressedGraph":
+        # the same graph with every edge pointing the other way, e.g. for searching backwards from a target
+        in_degrees = array("q", [0]) * (self.num_nodes + 1)
+        for target in self.targets:
+            in_degrees[target + 1] += 1
+        offsets = array("q", accumulate(in_degrees))
+        next_slots = array("q", offsets)
+        sources = array("q", [0]) * len(self.targets)
+        for node in range(self.num_nodes):
+            for target in self.neighbours(node):
+                sources[next_slots[target]] = node
+                next_slots[target] += 1
+        return CompressedGraph(offsets=offsets, targets=sources)
+
+
+@dataclasses.dataclass
+class SearchResult:
+    distances: NodeTable  # node => cost of the cheapest path found from any source, or UNREACHED
+    parents: NodeTable  # node => previous node on that path, or UNREACHED for sources
+    target: int | None  # the first target reached, or None if no target was reachable (or none were given)
+    expansions: int  # how many nodes had their neighbours generated - handy for comparing heuristics
+
+    def distance(self, node: int | None = None) -> int | None:
+        node = self.target if node is None else node
+        if node is None or self.distances[node] == UNREACHED:
+            return None
+        return self.distances[node]
+
+    def path(self, node: int | None = None) -> list[int]:  # source => node (defaulting to the target reached)
+        node = self.target if node is None else node
+        if node is None or self.distances[node] == UNREACHED:
+            return []
+        path = [node]
+        while (node := self.parents[node]) != UNREACHED:  # iterative so long paths don't hit the recursion limit
+            path.append(node)
+        return path[::-1]
+
+
+def breadth_first_search(
+    sources: Iterable[int], neighbours: Neighbours, targets: Targets = None, num_nodes: int | None = None
+) -> SearchResult:
+    # shortest paths by number of steps. stops as soon as any target is reached.
+    is_target = get_target_checker(targets)
+    distances, parents = new_node_table(num_nodes), new_node_table(num_nodes)
+    frontier: deque[int] = deque()
+    for source in sources:
+        if distances[source] == UNREACHED:
+            distances[source] = 0
+            frontier.append(source)
+    expansions = 0
+    while frontier:
+        node = frontier.popleft()
+        if is_target(node):
+            return SearchResult(distances=distances, parents=parents, target=node, expansions=expansions)
+        expansions += 1
+        distance = distances[node] + 1
+        for neighbour in neighbours(node):
+            if distances[neighbour] == UNREACHED:
+                distances[neighbour] = distance
+                parents[neighbour] = node
+                frontier.append(neighbour)
+    return SearchResult(distances=distances, parents=parents, target=None, expansions=expansions)
+
+
+def a_star_search(
+    sources: Iterable[int],
+    neighbours: WeightedNeighbours,
+    heuristic: Heuristic | None = None,
+    targets: Targets = None,
+    num_nodes: int | None = None,
+) -> SearchResult:
+    # cheapest paths for non-negative costs. with no heuristic this is dijkstra's algorithm.
+    # the frontier is a plain heapq list of (estimated total cost, cost so far, node) tuples - stale entries are
+    # skipped when they're popped rather than being removed from the heap when a cheaper path turns up.
+    is_target = get_target_checker(targets)
+    distances, parents = new_node_table(num_nodes), new_node_table(num_nodes)
+    frontier: list[tuple[int, int, int]] = []
+    for source in sources:
+        if distances[source] == UNREACHED:
+            distances[source] = 0
+            frontier.append((heuristic(source) if heuristic is not None else 0, 0, source))
+    heapq.heapify(frontier)
+    expansions = 0
+    while frontier:
+        _, distance, node = heapq.heappop(frontier)
+        if distance > distances[node]:
+            continue  # we've already found a cheaper way to this node
+        if is_target(node):
+            return SearchResult(distances=distances, parents=parents, target=node, expansions=expansions)
+        expansions += 1
+        for neighbour, cost in neighbours(node):
+            new_distance = distance + cost
+            neighbour_distance = distances[neighbour]
+            if neighbour_distance == UNREACHED or new_distance < neighbour_distance:
+                distances[neighbour] = new_distance
+                parents[neighbour] = node
+                estimate = new_distance + heuristic(neighbour) if heuristic is not None else new_distance
+                heapq.heappush(frontier, (estimate, new_distance, neighbour))
+    return SearchResult(distances=distances, parents=parents, target=None, expansions=expansions)
+
+
+def dijkstra(
+    sources: Iterable[int], neighbours: WeightedNeighbours, targets: Targets = None, num_nodes: int | None = None
+) -> SearchResult:
+    return a_star_search(sources=sources, neighbours=neighbours, targets=targets, num_nodes=num_nodes)
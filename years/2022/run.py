@@ -0,0 +1,4 @@
+from lib.runner import main
+
+if __name__ == "__main__":
+    main()
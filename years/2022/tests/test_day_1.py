@@ -0,0 +1,20 @@
+from pathlib import Path
+
+import pytest
+from lib.runner import load_day
+
+DAY_1_EXAMPLE = "1000\n2000\n3000\n\n4000\n\n5000\n6000\n\n7000\n8000\n9000\n\n10000\n"
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_find_top_calories_on_empty_input(tmp_path: Path, workers: int) -> None:
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("")
+    assert load_day(1).find_top_calories(str(input_file), k=3, workers=workers) == []
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_find_top_calories_matches_across_workers(tmp_path: Path, workers: int) -> None:
+    input_file = tmp_path / "input.txt"
+    input_file.write_text(DAY_1_EXAMPLE)
+    assert load_day(1).find_top_calories(str(input_file), k=3, workers=workers) == [24000, 11000, 10000]
@@ -0,0 +1,19 @@
+from pathlib import Path
+
+from lib.runner import load_day
+
+DAY_10_EXAMPLE = Path(__file__).resolve().parents[1] / "10" / "example_2.txt"
+
+
+def test_render_crt_frames_matches_part_2() -> None:
+    day_10 = load_day(10)
+    frames = list(day_10.render_crt_frames(day_10.read_input_file(str(DAY_10_EXAMPLE))))
+    assert frames == [day_10.part_2(str(DAY_10_EXAMPLE))]
+
+
+def test_render_crt_frames_covers_every_cycle(tmp_path: Path) -> None:
+    day_10 = load_day(10)
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("noop\n" * 9)
+    frames = list(day_10.render_crt_frames(day_10.read_input_file(str(input_file)), width=4, height=1))
+    assert frames == ["###.\n"] * 3  # the register stays at 1, so the sprite covers the first 3 pixels of every row
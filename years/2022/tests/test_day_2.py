@@ -0,0 +1,31 @@
+from pathlib import Path
+
+import pytest
+from lib.inputs import BUFFER_SIZE
+from lib.runner import load_day
+
+DAY_2_EXAMPLE = "A Y\nB X\nC Z\n"
+
+
+@pytest.mark.parametrize(
+    "text, scores",
+    [
+        (DAY_2_EXAMPLE, (15, 12)),
+        (DAY_2_EXAMPLE.rstrip("\n"), (15, 12)),  # no newline after the last line
+        (DAY_2_EXAMPLE.replace("\n", "\r\n"), (15, 12)),
+        (DAY_2_EXAMPLE + "\n\n", (15, 12)),
+        (DAY_2_EXAMPLE * (BUFFER_SIZE // 5), (15 * (BUFFER_SIZE // 5), 12 * (BUFFER_SIZE // 5))),  # lines across chunks
+    ],
+)
+def test_score_strategy_guide(tmp_path: Path, text: str, scores: tuple[int, int]) -> None:
+    input_file = tmp_path / "input.txt"
+    input_file.write_text(text, newline="")
+    assert load_day(2).score_strategy_guide(str(input_file)) == scores
+
+
+@pytest.mark.parametrize("bad_line", ["A  X", "D Y", "A X Y", "AX", "A XB Y"])
+def test_score_strategy_guide_rejects_malformed_lines(tmp_path: Path, bad_line: str) -> None:
+    input_file = tmp_path / "input.txt"
+    input_file.write_text(f"A Y\n{bad_line}\nC Z\n")
+    with pytest.raises(ValueError):
+        load_day(2).score_strategy_guide(str(input_file))
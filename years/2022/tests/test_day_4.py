@@ -0,0 +1,41 @@
+import random
+from array import array
+from typing import Any
+
+import pytest
+from lib.runner import load_day
+
+
+def make_elf_pairs(seed: int, num_pairs: int, max_section: int) -> Any:
+    rng = random.Random(seed)
+    columns = [array("i") for _ in range(4)]
+    for _ in range(num_pairs):
+        for min_ids, max_ids in [(columns[0], columns[1]), (columns[2], columns[3])]:
+            min_ids.append(min_id := rng.randint(1, max_section))
+            max_ids.append(rng.randint(min_id, max_section))
+    return load_day(4).ElfPairs(*columns)
+
+
+def find_overlapping_by_brute_force(elf_pairs: Any, min_id: int, max_id: int) -> list[tuple[int, int]]:
+    return [
+        (pair_index, elf_index)
+        for pair_index, (first_min_id, first_max_id, second_min_id, second_max_id) in enumerate(
+            zip(*elf_pairs.get_columns())
+        )
+        for elf_index, (elf_min_id, elf_max_id) in enumerate(
+            [(first_min_id, first_max_id), (second_min_id, second_max_id)]
+        )
+        if elf_min_id <= max_id and elf_max_id >= min_id
+    ]
+
+
+@pytest.mark.parametrize("seed, num_pairs, max_section", [(0, 0, 10), (1, 1, 5), (2, 50, 20), (3, 500, 100)])
+def test_section_index_matches_brute_force(seed: int, num_pairs: int, max_section: int) -> None:
+    elf_pairs = make_elf_pairs(seed, num_pairs, max_section)
+    rng = random.Random(seed)
+    for _ in range(200):
+        min_id = rng.randint(0, max_section + 1)
+        max_id = rng.randint(min_id, max_section + 1)
+        expected = find_overlapping_by_brute_force(elf_pairs, min_id, max_id)
+        assert elf_pairs.section_index.find_overlapping(min_id, max_id) == expected
+        assert elf_pairs.section_index.count_overlapping(min_id, max_id) == len(expected)
@@ -0,0 +1,18 @@
+from pathlib import Path
+
+import pytest
+from lib.runner import load_day
+
+
+def test_check_forest_in_bands_rejects_ragged_rows(tmp_path: Path) -> None:
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("30373\n2551\n65332\n")
+    with pytest.raises(ValueError):
+        load_day(8).check_forest_in_bands(str(input_file), band_rows=2)
+
+
+@pytest.mark.parametrize("trailing_text", ["\n", "\n\n", "\r\n\r\n"])
+def test_check_forest_in_bands_ignores_trailing_blank_lines(tmp_path: Path, trailing_text: str) -> None:
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("30373\n25512\n65332\n33549\n35390" + trailing_text, newline="")
+    assert load_day(8).check_forest_in_bands(str(input_file), band_rows=2) == (21, 8)
@@ -0,0 +1,40 @@
+from pathlib import Path
+
+import pytest
+from lib.grid import Grid
+from lib.runner import load_day
+
+DAY_8_EXAMPLE = "30373\n25512\n65332\n33549\n35390\n"
+DAY_12_EXAMPLE = "Sabqponm\nabcryxxl\naccszExk\nacctuvwj\nabdefghi\n"
+
+
+def test_from_lines_skips_blank_lines() -> None:
+    grid = Grid.from_lines(["12", "", "34", "\n", ""], int)
+    assert (grid.width, grid.height, grid.cells) == (2, 2, bytearray([1, 2, 3, 4]))
+
+
+def test_from_lines_rejects_ragged_rows() -> None:
+    with pytest.raises(ValueError):
+        Grid.from_lines(["123", "45"], int)
+
+
+def test_from_lines_pads_ragged_rows_when_asked() -> None:
+    grid = Grid.from_lines(["123", "45"], int, pad_ragged_rows=True)
+    assert grid.cells == bytearray([1, 2, 3, 4, 5, 0])
+
+
+@pytest.mark.parametrize("trailing_text", ["", "\n", "\n\n"])
+def test_day_8_ignores_trailing_blank_lines(tmp_path: Path, trailing_text: str) -> None:
+    day_8 = load_day(8)
+    input_file = tmp_path / "input.txt"
+    input_file.write_text(DAY_8_EXAMPLE + trailing_text)
+    assert day_8.check_forest_in_memory(str(input_file)) == (21, 8)
+    assert day_8.check_forest_in_bands(str(input_file), band_rows=2) == (21, 8)
+
+
+@pytest.mark.parametrize("trailing_text", ["", "\n", "\n\n"])
+def test_day_12_ignores_trailing_blank_lines(tmp_path: Path, trailing_text: str) -> None:
+    day_12 = load_day(12)
+    input_file = tmp_path / "input.txt"
+    input_file.write_text(DAY_12_EXAMPLE + trailing_text)
+    assert (day_12.part_1(str(input_file)), day_12.part_2(str(input_file))) == (31, 29)